@@ -0,0 +1,190 @@
+"""Benchmark del numero de pedidos y productos creados por segundo con y sin releer
+el documento insertado.
+
+Crea ``--registros`` registros concurrentes con ``PedidoRepository.add`` y
+``ProductoRepository.add`` (el camino de crear-pedido y crear-producto), que
+arman la respuesta con el documento insertado, y con la misma llamada seguida
+del ``find_one`` que hacian antes. Mongo se reemplaza por una coleccion en
+memoria que serializa los documentos en BSON y espera ``--latencia``
+milisegundos por comando, el tiempo de ida y vuelta al cluster; la subida a
+ImageKit de crear-producto se reemplaza por una que tarda ``--latencia-imagen``
+milisegundos::
+
+    python -m benchmarks.crear_registros --registros 500 --latencia 0 1 5
+"""
+
+# External libraries
+import argparse
+import asyncio
+import contextlib
+import io
+import time
+from types import SimpleNamespace
+from typing import Callable, List
+
+import bson
+from bson.codec_options import CodecOptions
+
+# Own libraries
+from contexts.database import TIPOS_MONGO
+from models.pedidos_model import PedidoModel
+from models.productos_model import ProductoModel
+from repositories import producto_repositorie
+from repositories.pedido_repositorie import PedidoRepository
+from repositories.producto_repositorie import ProductoRepository
+
+_CODEC_OPTIONS = CodecOptions(type_registry=TIPOS_MONGO)
+
+
+class ColeccionSimulada:
+    """Coleccion en memoria con el costo de serializar y de ir a Mongo."""
+
+    def __init__(self, latencia: float) -> None:
+        self.latencia = latencia
+        self._documentos = {}
+
+    async def insert_one(self, documento: dict, **_) -> SimpleNamespace:
+        """Guarda el documento serializado y espera la latencia de un comando."""
+        documento.setdefault("_id", bson.ObjectId())
+        self._documentos[documento["_id"]] = bson.encode(
+            documento, codec_options=_CODEC_OPTIONS
+        )
+        await asyncio.sleep(self.latencia)
+        return SimpleNamespace(inserted_id=documento["_id"])
+
+    async def find_one(self, filtro: dict) -> dict:
+        """Espera la latencia de un comando y retorna el documento guardado."""
+        await asyncio.sleep(self.latencia)
+        return bson.decode(
+            self._documentos[filtro["_id"]], codec_options=_CODEC_OPTIONS
+        )
+
+
+def imagekit_simulado(latencia: float) -> Callable[..., SimpleNamespace]:
+    """Reemplazo de la clase ``ImageKit`` cuya subida no sale de la maquina, solo
+    espera ``latencia`` segundos como el SDK sincrono."""
+
+    def subir_imagen(file_name: str, **_) -> SimpleNamespace:
+        time.sleep(latencia)
+        url = f"https://ik.imagekit.io/benchmark/{file_name}"
+        return SimpleNamespace(response_metadata=SimpleNamespace(raw={"url": url}))
+
+    return lambda **_: SimpleNamespace(upload_file=subir_imagen)
+
+
+def nuevo_pedido() -> PedidoModel:
+    """Pedido que se envia a crear-pedido."""
+    return PedidoModel(
+        id_tienda="662d0d325363bbc93a0c0295",
+        id_cliente="662d0d325363bbc93a0c0296",
+        productos=[{"id_producto": "662d0d325363bbc93a0c0297", "cantidad": 2}],
+        precio_total="24000",
+        direccion="Calle 10 # 43-12",
+        fecha_entrega="2024-10-23T10:00:00",
+        fecha_creacion="2024-10-22T10:00:00",
+        fecha_actualizacion="2024-10-22T10:00:00",
+    )
+
+
+def nuevo_producto() -> ProductoModel:
+    """Producto que se envia a crear-producto, ``add`` modifica su imagen."""
+    return ProductoModel(
+        nombre="Leche Entera Colanta",
+        imagen="https://example.com/leche.png",
+        tipo="Lacteo",
+        sub_tipo="Leche",
+        precio="5500",
+        fecha_creacion="2024-10-22T10:00:00",
+        fecha_actualizacion="2024-10-22T10:00:00",
+    )
+
+
+ENDPOINTS = {
+    "crear-pedido": (PedidoRepository, "pedidos", nuevo_pedido),
+    "crear-producto": (ProductoRepository, "productos", nuevo_producto),
+}
+
+
+async def medir(
+    endpoint: str, releer: bool, registros: int, latencia: float
+) -> List[str]:
+    """Crea ``registros`` registros concurrentes y retorna la fila del reporte."""
+    repositorio_clase, nombre_coleccion, nuevo_registro = ENDPOINTS[endpoint]
+    coleccion = ColeccionSimulada(latencia)
+    repositorio = repositorio_clase(SimpleNamespace(**{nombre_coleccion: coleccion}))
+    registros_nuevos = [nuevo_registro() for _ in range(registros)]
+
+    async def crear(record) -> float:
+        inicio = time.perf_counter()
+        creado = await repositorio.add(record)
+        if releer:
+            await coleccion.find_one({"_id": creado["_id"]})
+        return time.perf_counter() - inicio
+
+    # ProductoRepository.add imprime la respuesta de ImageKit de cada producto.
+    with contextlib.redirect_stdout(io.StringIO()):
+        inicio = time.perf_counter()
+        tiempos = await asyncio.gather(*(crear(r) for r in registros_nuevos))
+        duracion = time.perf_counter() - inicio
+
+    return [
+        endpoint,
+        "insert + find_one" if releer else "insert",
+        f"{latencia * 1000:g}",
+        f"{registros / duracion:.1f}",
+        f"{sum(tiempos) / registros * 1000:.2f}",
+    ]
+
+
+async def main(registros: int, latencias: List[float], latencia_imagen: float) -> None:
+    """Ejecuta el benchmark e imprime la tabla de resultados."""
+    producto_repositorie.ImageKit = imagekit_simulado(latencia_imagen)
+    filas = []
+    for endpoint in ENDPOINTS:
+        for latencia in latencias:
+            for releer in (True, False):
+                filas.append(await medir(endpoint, releer, registros, latencia))
+
+    print(
+        f"{registros} registros concurrentes, subida de imagen de "
+        f"{latencia_imagen * 1000:g} ms"
+    )
+    print(
+        f"{'endpoint':<16}{'ejecucion':<20}{'latencia (ms)':>15}"
+        f"{'registros/s':>14}{'ms/registro':>14}"
+    )
+    for endpoint, ejecucion, latencia, por_segundo, tiempo in filas:
+        print(
+            f"{endpoint:<16}{ejecucion:<20}{latencia:>15}{por_segundo:>14}{tiempo:>14}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--registros",
+        type=int,
+        default=500,
+        help="Numero de registros concurrentes por medicion.",
+    )
+    parser.add_argument(
+        "--latencia",
+        type=float,
+        nargs="+",
+        default=[0, 1, 5],
+        help="Milisegundos de ida y vuelta a Mongo por comando.",
+    )
+    parser.add_argument(
+        "--latencia-imagen",
+        type=float,
+        default=0,
+        help="Milisegundos que tarda la subida de cada imagen a ImageKit.",
+    )
+    argumentos = parser.parse_args()
+    asyncio.run(
+        main(
+            argumentos.registros,
+            [latencia / 1000 for latencia in argumentos.latencia],
+            argumentos.latencia_imagen / 1000,
+        )
+    )
@@ -0,0 +1,103 @@
+"""Benchmark del numero de inicios de sesion por segundo segun donde se verifica el
+password.
+
+Verifica ``--logins`` passwords concurrentes en el event loop, con
+``asyncio.to_thread`` y con el pool de procesos (``ejecutar_en_proceso``) para
+cada numero de procesos de ``--workers``. Ademas de los inicios de sesion por
+segundo reporta el retraso maximo del event loop, el tiempo que una peticion
+que no inicia sesion esperaria para ser atendida::
+
+    python -m benchmarks.inicio_sesion --logins 64 --workers 1 2 4
+"""
+
+# External libraries
+import argparse
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, List
+
+# Own libraries
+from contexts.procesos import cerrar_pool_procesos, ejecutar_en_proceso
+from helpers.seguridad import hashear_password, verificar_password
+from properties.settings import Settings
+
+
+async def medir_retraso(detener: asyncio.Event, intervalo: float = 0.005) -> float:
+    """Mide el mayor retraso del event loop mientras no se active ``detener``."""
+    retraso = 0.0
+    while not detener.is_set():
+        inicio = time.perf_counter()
+        await asyncio.sleep(intervalo)
+        retraso = max(retraso, time.perf_counter() - inicio - intervalo)
+    return retraso
+
+
+async def medir(
+    nombre: str, verificar: Callable[[], Awaitable], logins: int
+) -> List[str]:
+    """Ejecuta ``logins`` verificaciones concurrentes y retorna la fila del reporte."""
+    detener = asyncio.Event()
+    tarea_retraso = asyncio.create_task(medir_retraso(detener))
+    await asyncio.sleep(0)
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(verificar() for _ in range(logins)))
+    duracion = time.perf_counter() - inicio
+
+    detener.set()
+    retraso = await tarea_retraso
+    return [nombre, f"{logins / duracion:.1f}", f"{retraso * 1000:.1f}"]
+
+
+async def main(logins: int, workers: List[int]) -> None:
+    """Ejecuta el benchmark e imprime la tabla de resultados."""
+    guardado = hashear_password("benchmark")
+
+    async def en_event_loop():
+        verificar_password("benchmark", guardado)
+
+    async def en_hilo():
+        await asyncio.to_thread(verificar_password, "benchmark", guardado)
+
+    async def en_proceso():
+        await ejecutar_en_proceso(verificar_password, "benchmark", guardado)
+
+    filas = [
+        await medir("event loop", en_event_loop, logins),
+        await medir("to_thread", en_hilo, logins),
+    ]
+    for numero in workers:
+        Settings.procesos_hash_workers = numero
+        cerrar_pool_procesos()
+        # La primera ronda inicia los procesos, no se incluye en la medicion.
+        await asyncio.gather(*(en_proceso() for _ in range(numero)))
+        filas.append(await medir(f"procesos={numero}", en_proceso, logins))
+    cerrar_pool_procesos()
+
+    print(
+        f"scrypt n={Settings.password_scrypt_n} r={Settings.password_scrypt_r} "
+        f"p={Settings.password_scrypt_p}, {os.cpu_count()} CPUs, {logins} logins"
+    )
+    print(f"{'ejecucion':<14}{'logins/s':>10}{'retraso loop (ms)':>20}")
+    for nombre, por_segundo, retraso in filas:
+        print(f"{nombre:<14}{por_segundo:>10}{retraso:>20}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--logins",
+        type=int,
+        default=64,
+        help="Numero de inicios de sesion concurrentes por medicion.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, os.cpu_count() or 1}),
+        help="Numero de procesos del pool a medir.",
+    )
+    argumentos = parser.parse_args()
+    asyncio.run(main(argumentos.logins, argumentos.workers))
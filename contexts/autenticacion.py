@@ -0,0 +1,53 @@
+"""Modulo con la dependencia que autentica las peticiones con el token de sesion."""
+
+# External libraries
+from typing import Optional
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+# Own libraries
+from helpers.seguridad import TokenInvalidoError, decodificar_token
+from models.sesiones_model import SesionModel
+
+_esquema_bearer = HTTPBearer(auto_error=False)
+
+
+def obtener_sesion(
+    credenciales: Optional[HTTPAuthorizationCredentials] = Depends(_esquema_bearer),
+) -> SesionModel:
+    """Dependencia de FastAPI que valida el ``access_token`` del header
+    ``Authorization: Bearer``.
+
+    El token se valida solo con su firma y su expiracion, sin consultar el
+    usuario en Mongo.
+
+    Args:
+        credenciales: Token recibido en el header ``Authorization``.
+
+    Returns:
+        Usuario autenticado.
+
+    Raises:
+        HTTPException: 401 si no se envia el token o no es valido.
+    """
+    if credenciales is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Se requiere iniciar sesion",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    try:
+        carga = decodificar_token(credenciales.credentials, "access")
+    except TokenInvalidoError as error:
+        raise HTTPException(
+            status_code=401, detail=str(error), headers={"WWW-Authenticate": "Bearer"}
+        ) from error
+
+    return SesionModel(
+        id_usuario=carga["sub"],
+        email=carga.get("email"),
+        tipo=carga.get("tipo"),
+        expira=carga["exp"],
+    )
@@ -1,15 +1,39 @@
 """Modulo con las funciones de conexion y ejecucion de sql a la base de datos."""
 
 # External libraries
+from decimal import Decimal
 from functools import lru_cache
+from typing import Callable, Optional
 
 import certifi
-from pymongo import MongoClient
+from bson.codec_options import TypeCodec, TypeRegistry
+from bson.decimal128 import Decimal128
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from properties.settings import Settings
 
+# Cliente compartido por todo el proceso, se crea en el arranque de la aplicación.
+_cliente_mongo: Optional[AsyncIOMotorClient] = None
 
-def crear_mongo_conexion() -> MongoClient:
+
+class DecimalCodec(TypeCodec):
+    """Guarda los ``Decimal`` de python como ``Decimal128`` en Mongo y viceversa."""
+
+    python_type = Decimal
+    bson_type = Decimal128
+
+    def transform_python(self, value: Decimal) -> Decimal128:
+        return Decimal128(value)
+
+    def transform_bson(self, value: Decimal128) -> Decimal:
+        return value.to_decimal()
+
+
+# Tipos de python que el cliente convierte a tipos de BSON y viceversa.
+TIPOS_MONGO = TypeRegistry([DecimalCodec()])
+
+
+def crear_mongo_conexion() -> AsyncIOMotorClient:
     """Crea la conexion con la base de datos.
 
     Returns:
@@ -18,12 +42,45 @@ def crear_mongo_conexion() -> MongoClient:
     """
     setting = Settings()
 
-    client = MongoClient(setting.database_connection_str, tlsCAFile=certifi.where())
+    client = AsyncIOMotorClient(
+        setting.database_connection_str,
+        tlsCAFile=certifi.where(),
+        type_registry=TIPOS_MONGO,
+        maxPoolSize=setting.mongo_max_pool_size,
+        minPoolSize=setting.mongo_min_pool_size,
+        maxIdleTimeMS=setting.mongo_max_idle_time_ms,
+        waitQueueTimeoutMS=setting.mongo_wait_queue_timeout_ms,
+        connectTimeoutMS=setting.mongo_connect_timeout_ms,
+        serverSelectionTimeoutMS=setting.mongo_server_selection_timeout_ms,
+    )
     return client
 
 
+def abrir_pool_mongo() -> AsyncIOMotorClient:
+    """Crea el cliente compartido de Mongo si aun no existe.
+
+    Returns:
+        Cliente de Mongo con el pool de conexiones del proceso.
+    """
+    global _cliente_mongo
+
+    if _cliente_mongo is None:
+        _cliente_mongo = crear_mongo_conexion()
+    return _cliente_mongo
+
+
+def cerrar_pool_mongo() -> None:
+    """Cierra el cliente compartido de Mongo y libera las conexiones del pool."""
+    global _cliente_mongo
+
+    if _cliente_mongo is not None:
+        _cliente_mongo.close()
+        crear_cursor_mongo.cache_clear()
+        _cliente_mongo = None
+
+
 @lru_cache()
-def crear_cursor_mongo(conexion: MongoClient):
+def crear_cursor_mongo(conexion: AsyncIOMotorClient):
     """Retorna el cursor sobre la base de datos para ejecutar operaciones.
 
     Args:
@@ -34,3 +91,12 @@ def crear_cursor_mongo(conexion: MongoClient):
     """
     mongo_db = conexion.mini_market
     return lambda: mongo_db
+
+
+def obtener_cursor_mongo() -> Callable[[], AsyncIOMotorDatabase]:
+    """Dependencia de FastAPI que entrega el cursor del cliente compartido.
+
+    Returns:
+        Cursor para ejecutar operaciones sobre la base de datos
+    """
+    return crear_cursor_mongo(abrir_pool_mongo())
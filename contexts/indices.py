@@ -0,0 +1,149 @@
+"""Modulo con el registro de indices de las colecciones y su creacion en Mongo."""
+
+# External libraries
+import traceback
+from typing import Dict, List
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.collation import Collation
+from pymongo.errors import PyMongoError
+
+# Own libraries
+from helpers.config import get_log
+
+# Colacion de los emails: no distingue mayusculas y minusculas (strength 2). Las
+# consultas por email deben usarla para aprovechar el indice ``email_unico``.
+COLACION_EMAIL = Collation(locale="es", strength=2)
+
+# Indices que necesita cada coleccion para las consultas frecuentes del api.
+INDICES: Dict[str, List[IndexModel]] = {
+    "usuarios": [
+        IndexModel(
+            [("email", ASCENDING)],
+            name="email_unico",
+            unique=True,
+            collation=COLACION_EMAIL,
+        ),
+    ],
+    "tiendas": [
+        IndexModel([("id_usuario_tendero", ASCENDING)], name="id_usuario_tendero"),
+    ],
+    "productos": [
+        IndexModel(
+            [
+                ("tipo", ASCENDING),
+                ("sub_tipo", ASCENDING),
+                ("precio", ASCENDING),
+                ("_id", ASCENDING),
+            ],
+            name="tipo_sub_tipo_precio",
+        ),
+        IndexModel(
+            [
+                ("tipo", ASCENDING),
+                ("sub_tipo", ASCENDING),
+                ("nombre", ASCENDING),
+                ("_id", ASCENDING),
+            ],
+            name="tipo_sub_tipo_nombre",
+        ),
+        IndexModel([("precio", ASCENDING), ("_id", ASCENDING)], name="precio"),
+        IndexModel([("nombre", ASCENDING), ("_id", ASCENDING)], name="nombre"),
+        IndexModel(
+            [("nombre_normalizado", ASCENDING), ("_id", ASCENDING)],
+            name="nombre_normalizado",
+        ),
+    ],
+    "inventarios": [
+        IndexModel(
+            [("id_tienda", ASCENDING), ("id_producto", ASCENDING)],
+            name="id_tienda_id_producto",
+        ),
+        IndexModel([("id_tienda", ASCENDING), ("_id", ASCENDING)], name="id_tienda_id"),
+    ],
+    "pedidos": [
+        IndexModel(
+            [("id_cliente", ASCENDING), ("fecha_creacion", DESCENDING)],
+            name="id_cliente_fecha_creacion",
+        ),
+        IndexModel(
+            [("id_tienda", ASCENDING), ("fecha_creacion", DESCENDING)],
+            name="id_tienda_fecha_creacion",
+        ),
+        IndexModel(
+            [("productos.id_producto", ASCENDING), ("_id", ASCENDING)],
+            name="productos_id_producto",
+        ),
+        IndexModel([("fecha_creacion", DESCENDING)], name="fecha_creacion"),
+    ],
+    "ventas_diarias": [
+        IndexModel(
+            [("id_tienda", ASCENDING), ("dia", ASCENDING)],
+            name="id_tienda_dia",
+            unique=True,
+        ),
+        IndexModel([("dia", ASCENDING), ("_id", ASCENDING)], name="dia_id"),
+    ],
+}
+
+
+async def asegurar_indices(mongo_db: AsyncIOMotorDatabase) -> None:
+    """Crea en Mongo los indices del registro que aun no existan.
+
+    Un error en una coleccion se registra en el log y no impide crear los indices
+    de las demas colecciones ni el arranque de la aplicación.
+
+    Args:
+        mongo_db: Base de datos sobre la que se crean los indices.
+    """
+    log = get_log()
+
+    for coleccion, indices in INDICES.items():
+        try:
+            nombres = await mongo_db[coleccion].create_indexes(indices)
+            log.info("Indices asegurados en %s: %s", coleccion, ", ".join(nombres))
+        except PyMongoError:
+            log.error(traceback.format_exc())
+
+
+async def consultar_indices(mongo_db: AsyncIOMotorDatabase) -> List[dict]:
+    """Compara los indices del registro con los que existen en Mongo.
+
+    Args:
+        mongo_db: Base de datos sobre la que se consultan los indices.
+
+    Returns:
+        Estado de cada indice del registro
+
+        .. code-block:: python
+
+            [
+                {
+                    'coleccion': 'usuarios',
+                    'nombre': 'email_unico',
+                    'claves': {'email': 1},
+                    'unico': True,
+                    'existe': True
+                }
+            ]
+
+    """
+    respuesta = []
+
+    for coleccion, indices in INDICES.items():
+        existentes = await mongo_db[coleccion].index_information()
+
+        for indice in indices:
+            documento = indice.document
+            respuesta.append(
+                {
+                    "coleccion": coleccion,
+                    "nombre": documento["name"],
+                    "claves": dict(documento["key"]),
+                    "unico": documento.get("unique", False),
+                    "existe": documento["name"] in existentes,
+                }
+            )
+
+    return respuesta
@@ -0,0 +1,68 @@
+"""Modulo con el pool de procesos para las operaciones que consumen CPU."""
+
+# External libraries
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from properties.settings import Settings
+
+# Pool compartido por todo el proceso, se crea con la primera operacion.
+_pool_procesos: Optional[ProcessPoolExecutor] = None
+
+
+def abrir_pool_procesos() -> ProcessPoolExecutor:
+    """Crea el pool de procesos compartido si aun no existe.
+
+    Los procesos se inician con ``spawn`` para no copiar los hilos del cliente de
+    Mongo ni el estado del event loop del proceso del api.
+
+    Returns:
+        Pool con ``procesos_hash_workers`` procesos como maximo.
+    """
+    global _pool_procesos
+
+    if _pool_procesos is None:
+        _pool_procesos = ProcessPoolExecutor(
+            max_workers=Settings.procesos_hash_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool_procesos
+
+
+def cerrar_pool_procesos() -> None:
+    """Termina los procesos del pool compartido."""
+    global _pool_procesos
+
+    if _pool_procesos is not None:
+        _pool_procesos.shutdown(cancel_futures=True)
+        _pool_procesos = None
+
+
+async def ejecutar_en_proceso(funcion: Callable, *argumentos: Any) -> Any:
+    """Ejecuta una funcion en el pool de procesos sin bloquear el event loop.
+
+    Las peticiones que superan el numero de procesos esperan en la cola del pool,
+    por lo que una rafaga de inicios de sesion no consume mas CPU que la
+    configurada ni ocupa los hilos que usa FastAPI.
+
+    Args:
+        funcion: Funcion definida a nivel de modulo (se envia al proceso con
+            pickle).
+        argumentos: Argumentos de la funcion.
+
+    Returns:
+        Resultado de la funcion.
+
+    Raises:
+        BrokenProcessPool: Si un proceso del pool termino de forma inesperada, el
+            pool se descarta y se crea uno nuevo en la siguiente operacion.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(abrir_pool_procesos(), funcion, *argumentos)
+    except BrokenProcessPool:
+        cerrar_pool_procesos()
+        raise
@@ -0,0 +1,72 @@
+"""Modulo con el endpoint para consultar las estadisticas de los caches en memoria"""
+
+# External libraries
+import traceback
+
+from fastapi import APIRouter, Response
+
+# Own libraries
+from helpers.cache import CACHES
+from helpers.config import get_log
+from models.cache_model import CachesCollection
+
+caches_registrados_controller = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@caches_registrados_controller.get(
+    "/caches-registrados",
+    status_code=200,
+    response_model=CachesCollection,
+)
+async def caches_registrados(response: Response):
+    """Obtener el tamaño y los contadores de hits, misses y evictions de cada cache
+
+    Los contadores son del proceso que atiende la petición.
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+
+    Returns:
+        Estadisticas de los caches del proceso
+
+        .. code-block:: python
+
+            {
+              'data': [
+                {
+                  'nombre': 'productos',
+                  'elementos': 120,
+                  'capacidad': 1000,
+                  'ttl': 60.0,
+                  'hits': 5400,
+                  'misses': 130,
+                  'evictions': 0
+                }],
+              'msg': 'Se obtuvo el resultado exitosamente.',
+              'success': true
+            }
+
+    """
+    success = None
+    data = None
+    status_code = 200
+    message = None
+
+    try:
+        data = [cache.estadisticas() for cache in CACHES.values()]
+        message = "Se obtuvo el resultado exitosamente."
+        success = True
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = None
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        res = CachesCollection(data=data, success=success, msg=message)
+
+    return res
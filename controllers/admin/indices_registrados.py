@@ -0,0 +1,72 @@
+"""Modulo con el endpoint para consultar el estado de los indices de Mongo"""
+
+# External libraries
+import traceback
+from typing import Callable
+
+from fastapi import APIRouter, Depends, Response
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from contexts.indices import consultar_indices
+from helpers.config import get_log
+from models.indices_model import IndicesCollection
+
+indices_registrados_controller = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@indices_registrados_controller.get(
+    "/indices-registrados",
+    status_code=200,
+    response_model=IndicesCollection,
+)
+async def indices_registrados(
+    response: Response, cursor: Callable = Depends(obtener_cursor_mongo)
+):
+    """Obtener los indices declarados para cada coleccion y si ya existen en Mongo
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+
+    Returns:
+        Estado de los indices declarados en el registro
+
+        .. code-block:: python
+
+            {
+              'data': [
+                {
+                  'coleccion': 'usuarios',
+                  'nombre': 'email_unico',
+                  'claves': {'email': 1},
+                  'unico': true,
+                  'existe': true
+                }],
+              'msg': 'Se obtuvo el resultado exitosamente.',
+              'success': true
+            }
+
+    """
+    success = None
+    data = None
+    status_code = 200
+    message = None
+
+    try:
+        data = await consultar_indices(cursor())
+        message = "Se obtuvo el resultado exitosamente."
+        success = True
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = None
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        res = IndicesCollection(data=data, success=success, msg=message)
+
+    return res
@@ -3,14 +3,18 @@
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Depends, Response
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
-from models.inventarios_model import (InventarioCollection, InventarioModel,
-                                      UpdateInventarioModel)
+from models.inventarios_model import (
+    InventarioCollection,
+    InventarioModel,
+    UpdateInventarioModel,
+)
 from services.inventario_service import InventarioService
 
 actualizar_inventario_controller = APIRouter(
@@ -24,8 +28,11 @@ actualizar_inventario_controller = APIRouter(
     response_model=InventarioCollection,
     response_model_by_alias=False,
 )
-def actualizar_inventario(
-    response: Response, identificador: str, inventario: UpdateInventarioModel
+async def actualizar_inventario(
+    response: Response,
+    identificador: str,
+    inventario: UpdateInventarioModel,
+    cursor: Callable = Depends(obtener_cursor_mongo),
 ):
     """Actualiza la informacion correspondiente a un inventario en la base de datos.
 
@@ -56,13 +63,12 @@ def actualizar_inventario(
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
-        with InventarioService(cursor=cursor) as inventario_service:
-            data = inventario_service.inventarios_repository.get_by_id(identificador)
+        async with InventarioService(cursor=cursor) as inventario_service:
+            data = await inventario_service.inventarios_repository.get_by_id(
+                identificador
+            )
             if data is not None:
-                data = inventario_service.inventarios_repository.update(
+                data = await inventario_service.inventarios_repository.update(
                     identificador, inventario
                 )
                 message = "Se obtuvo el resultado exitosamente."
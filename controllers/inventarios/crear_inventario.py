@@ -2,11 +2,12 @@
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, Response, status
+from fastapi import APIRouter, Depends, Response, status
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
 from models.inventarios_model import InventarioCollection, InventarioModel
 from services.inventario_service import InventarioService
@@ -19,7 +20,11 @@ crear_inventario_controller = APIRouter(prefix="/inventarios", tags=["inventario
     status_code=status.HTTP_201_CREATED,
     response_model=InventarioCollection,
 )
-def crear_inventario(response: Response, inventario: InventarioModel):
+async def crear_inventario(
+    response: Response,
+    inventario: InventarioModel,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Crea un inventario dada la informacion correspondiente al mismo.
 
     Args:
@@ -54,12 +59,9 @@ def crear_inventario(response: Response, inventario: InventarioModel):
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
         data = {}
-        with InventarioService(cursor=cursor) as inventario_service:
-            data = inventario_service.inventarios_repository.add(inventario)
+        async with InventarioService(cursor=cursor) as inventario_service:
+            data = await inventario_service.inventarios_repository.add(inventario)
 
         message = "Se obtuvo el resultado exitosamente."
         success = True
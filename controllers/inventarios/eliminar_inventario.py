@@ -2,11 +2,12 @@
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
 from services.inventario_service import InventarioService
 
@@ -16,7 +17,11 @@ eliminar_inventario_controller = APIRouter(prefix="/inventarios", tags=["inventa
 @eliminar_inventario_controller.delete(
     "/eliminar-inventario/{identificador}", status_code=200
 )
-def elimina_inventario(response: Response, identificador: str):
+async def elimina_inventario(
+    response: Response,
+    identificador: str,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Elimina un registro correspondiente a un inventario en la base de datos
 
     Args:
@@ -35,12 +40,9 @@ def elimina_inventario(response: Response, identificador: str):
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
         data = "Reactor no eliminado correctamente"
-        with InventarioService(cursor=cursor) as inventario_service:
-            delete_result = inventario_service.inventarios_repository.delete(
+        async with InventarioService(cursor=cursor) as inventario_service:
+            delete_result = await inventario_service.inventarios_repository.delete(
                 identificador
             )
 
@@ -0,0 +1,62 @@
+"""Modulo con el endpoint para exportar en NDJSON los inventarios registrados"""
+
+# External libraries
+import traceback
+from typing import AsyncIterator, Callable
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from models.inventarios_model import InventarioModel
+from properties.settings import Settings
+from services.inventario_service import InventarioService
+
+exportar_inventarios_controller = APIRouter(prefix="/inventarios", tags=["inventarios"])
+
+
+async def generar_inventarios_ndjson(cursor: Callable) -> AsyncIterator[str]:
+    """Genera una linea JSON por cada inventario leyendo la colleccion por lotes.
+
+    Args:
+        cursor: Cursor para ejecutar operaciones sobre la base de datos.
+
+    Returns:
+        Iterador asincrono con un inventario serializado por linea.
+    """
+    try:
+        async with InventarioService(cursor=cursor) as inventario_service:
+            async for documento in inventario_service.inventarios_repository.iter_all(
+                Settings.exportacion_batch_size
+            ):
+                yield InventarioModel(**documento).model_dump_json() + "\n"
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+        raise
+
+
+@exportar_inventarios_controller.get("/exportar-inventarios", status_code=200)
+async def exportar_inventarios(cursor: Callable = Depends(obtener_cursor_mongo)):
+    """Exporta todos los inventarios registrados como NDJSON, un inventario por linea.
+
+    La respuesta se envia a medida que se lee el cursor de Mongo, por lo que la
+    memoria usada depende del tamaño del lote y no del tamaño de la colleccion.
+
+    Args:
+        cursor: Cursor para ejecutar operaciones sobre la base de datos.
+
+    Returns:
+        Respuesta en streaming con los inventarios registrados.
+
+        .. code-block:: text
+
+            {"id": "662d0d325363bbc93a0c027c", ...}
+            {"id": "662d0d325363bbc93a0c027f", ...}
+
+    """
+    return StreamingResponse(
+        generar_inventarios_ndjson(cursor), media_type="application/x-ndjson"
+    )
@@ -2,12 +2,15 @@
 
 # External libraries
 import traceback
+from typing import Callable, Optional
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Depends, Header, Response
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
+from helpers.etag import calcular_etag, etag_coincide, respuesta_no_modificada
+from helpers.proyeccion import CampoInvalidoError, crear_proyeccion, respuesta_recortada
 from models.inventarios_model import InventarioCollection, InventarioModel
 from services.inventario_service import InventarioService
 
@@ -22,7 +25,13 @@ inventario_identificador_controller = APIRouter(
     response_model=InventarioCollection,
     response_model_by_alias=False,
 )
-def inventario_identificador(response: Response, identificador: str):
+async def inventario_identificador(
+    response: Response,
+    identificador: str,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(default=None),
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Obtener informacion de un inventario registrado en la tabla Inventario
         segun su ID.
 
@@ -30,6 +39,8 @@ def inventario_identificador(response: Response, identificador: str):
         response: parametro de entrada para construir la respuesta en el
             decorador wrapper.
         identificador: ID que identifica al inventario que queremos consultar
+        fields: Campos a retornar separados por coma, todos si no se envia.
+        if_none_match: ETag que tiene el cliente, si no cambio se responde 304.
 
     Returns:
         Información corespondiente al inventario que queremos consultar.
@@ -56,17 +67,25 @@ def inventario_identificador(response: Response, identificador: str):
     data = InventarioModel()
     status_code = 200
     message = None
+    etag = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
-        with InventarioService(cursor=cursor) as inventario_service:
-            data = inventario_service.inventarios_repository.get_by_id(identificador)
+        proyeccion = crear_proyeccion(InventarioModel, fields)
+        async with InventarioService(cursor=cursor) as inventario_service:
+            data = await inventario_service.inventarios_repository.get_by_id(
+                identificador, proyeccion
+            )
             if data is None:
                 data = InventarioModel()
+            else:
+                etag = calcular_etag(data)
         message = "Se obtuvo el resultado exitosamente."
         success = True
+    except CampoInvalidoError as error:
+        data = InventarioModel()
+        message = str(error)
+        success = False
+        status_code = 400
     except Exception:
         log = get_log()
         log.error(traceback.format_exc())
@@ -77,6 +96,15 @@ def inventario_identificador(response: Response, identificador: str):
         status_code = 500
     finally:
         response.status_code = status_code
-        res = InventarioCollection(success=success, msg=message, data=data)
 
+    # Si el cliente ya tiene la version actual no se arma la respuesta.
+    if etag is not None:
+        if etag_coincide(if_none_match, etag):
+            return respuesta_no_modificada(etag)
+        response.headers["ETag"] = etag
+
+    res = InventarioCollection(success=success, msg=message, data=data)
+
+    if fields is not None:
+        return respuesta_recortada(res, response)
     return res
@@ -0,0 +1,116 @@
+"""Modulo con el endpoint para obtener varios inventarios por identificador (ID)"""
+
+# External libraries
+import traceback
+from typing import Callable, Optional
+
+from fastapi import APIRouter, Depends, Response
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from helpers.proyeccion import CampoInvalidoError, crear_proyeccion, respuesta_recortada
+from models.inventarios_model import (
+    InventarioModel,
+    InventariosIdentificadoresCollection,
+)
+from properties.settings import Settings
+from services.inventario_service import InventarioService
+
+inventarios_identificadores_controller = APIRouter(
+    prefix="/inventarios", tags=["inventarios"]
+)
+
+
+@inventarios_identificadores_controller.get(
+    "/inventarios-identificadores",
+    status_code=200,
+    response_model=InventariosIdentificadoresCollection,
+    response_model_by_alias=False,
+)
+async def inventarios_identificadores(
+    response: Response,
+    ids: str,
+    fields: Optional[str] = None,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
+    """Obtener varios inventarios con una sola consulta a la base de datos.
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+        ids: Identificadores de los inventarios separados por coma.
+        fields: Campos a retornar separados por coma, todos si no se envia.
+
+    Returns:
+        Inventarios en el orden de ``ids`` e identificadores que no existen.
+
+        .. code-block:: python
+
+            {
+              'data': [
+                {
+                  'id': '662d0d325363bbc93a0c0295',
+                  'id_producto': '662d0d325363bbc93a0c0295',
+                  'id_tienda': '662d0d325363bbc93a0c0295',
+                  'cantidad_disponibles': 700,
+                  'fecha_creacion': '2024-10-22T00:00:00',
+                  'fecha_actualizacion': '2024-10-22T00:00:00'
+                }],
+              'faltantes': ['6717c43ef963e95aa4789247'],
+              'msg': 'Se obtuvo el resultado exitosamente.',
+              'success': true
+            }
+
+    """
+    success = None
+    data = None
+    faltantes = []
+    status_code = 200
+    message = None
+
+    try:
+        identificadores = [
+            identificador.strip()
+            for identificador in ids.split(",")
+            if identificador.strip()
+        ]
+        proyeccion = crear_proyeccion(InventarioModel, fields)
+
+        if len(identificadores) > Settings.paginacion_limite_maximo:
+            message = (
+                f"Se pueden consultar maximo {Settings.paginacion_limite_maximo} ids"
+            )
+            success = False
+            status_code = 400
+        else:
+            async with InventarioService(cursor=cursor) as inventario_service:
+                data, faltantes = (
+                    await inventario_service.inventarios_repository.get_many(
+                        identificadores, proyeccion
+                    )
+                )
+            message = "Se obtuvo el resultado exitosamente."
+            success = True
+    except CampoInvalidoError as error:
+        data = None
+        message = str(error)
+        success = False
+        status_code = 400
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = None
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        res = InventariosIdentificadoresCollection(
+            data=data, success=success, msg=message, faltantes=faltantes
+        )
+
+    if fields is not None:
+        return respuesta_recortada(res, response)
+    return res
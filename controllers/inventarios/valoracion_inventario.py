@@ -0,0 +1,91 @@
+"""Modulo con el endpoint para obtener las unidades y el valor del inventario"""
+
+# External libraries
+import traceback
+from typing import Callable, Literal, Optional
+
+from fastapi import APIRouter, Depends, Response
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from models.inventarios_model import ValoracionInventarioCollection
+from services.inventario_service import InventarioService
+
+valoracion_inventario_controller = APIRouter(
+    prefix="/inventarios", tags=["inventarios"]
+)
+
+# Campo del inventario (o de su producto) por el que se agrupa en ``agrupar``.
+AGRUPACIONES = {
+    "tienda": "id_tienda",
+    "tipo": "producto.tipo",
+    "sub_tipo": "producto.sub_tipo",
+}
+
+
+@valoracion_inventario_controller.get(
+    "/valoracion-inventario",
+    status_code=200,
+    response_model=ValoracionInventarioCollection,
+)
+async def valoracion_inventario(
+    response: Response,
+    agrupar: Literal["tienda", "tipo", "sub_tipo"] = "tienda",
+    id_tienda: Optional[str] = None,
+    usar_cache: bool = False,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
+    """Obtener las unidades y el valor (cantidad por precio) del inventario por grupo.
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+        agrupar: Agrupa por ``tienda``, ``tipo`` o ``sub_tipo`` del producto.
+        id_tienda: Limita el reporte al inventario de una tienda.
+        usar_cache: Retorna el ultimo reporte calculado si inventarios y productos
+            no han cambiado, pensado para tableros que se refrescan seguido.
+
+    Returns:
+        Unidades, valor y numero de inventarios de cada grupo
+
+        .. code-block:: python
+
+            {
+              'data': [
+                {
+                  'grupo': 'Lacteo',
+                  'unidades': 340,
+                  'valor': '1870000',
+                  'inventarios': 12
+                }],
+              'msg': 'Se obtuvo el resultado exitosamente.',
+              'success': true
+            }
+
+    """
+    success = None
+    data = None
+    status_code = 200
+    message = None
+
+    try:
+        async with InventarioService(cursor=cursor) as inventario_service:
+            data = await inventario_service.inventarios_repository.get_valoracion(
+                AGRUPACIONES[agrupar], id_tienda, usar_cache
+            )
+        message = "Se obtuvo el resultado exitosamente."
+        success = True
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = None
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        res = ValoracionInventarioCollection(data=data, success=success, msg=message)
+
+    return res
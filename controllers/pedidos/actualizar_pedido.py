@@ -3,14 +3,14 @@
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Depends, Response
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
-from models.pedidos_model import (PedidoCollection, PedidoModel,
-                                  UpdatePedidoModel)
+from models.pedidos_model import PedidoCollection, PedidoModel, UpdatePedidoModel
 from services.pedido_service import PedidoService
 
 actualizar_pedido_controller = APIRouter(prefix="/pedidos", tags=["pedidos"])
@@ -22,7 +22,12 @@ actualizar_pedido_controller = APIRouter(prefix="/pedidos", tags=["pedidos"])
     response_model=PedidoCollection,
     response_model_by_alias=False,
 )
-def pedido_pedido(response: Response, identificador: str, pedido: UpdatePedidoModel):
+async def pedido_pedido(
+    response: Response,
+    identificador: str,
+    pedido: UpdatePedidoModel,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Actualiza la informacion correspondiente a un pedido en la base de datos.
 
     Returns:
@@ -52,15 +57,9 @@ def pedido_pedido(response: Response, identificador: str, pedido: UpdatePedidoMo
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
-        with PedidoService(cursor=cursor) as pedido_service:
-            data = pedido_service.pedidos_repository.get_by_id(identificador)
+        async with PedidoService(cursor=cursor) as pedido_service:
+            data = await pedido_service.actualizar_pedido(identificador, pedido)
             if data is not None:
-                data = pedido_service.inventarios_repository.update(
-                    identificador, pedido
-                )
                 message = "Resultado exitosamente."
                 success = True
             else:
@@ -2,14 +2,20 @@
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, Response, status
+from fastapi import APIRouter, Depends, Response, status
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
 from models.pedidos_model import PedidoCollection, PedidoModel
-from services.pedido_service import PedidoService
+from services.pedido_service import (
+    CantidadInvalidaError,
+    PedidoEnConflictoError,
+    PedidoService,
+    StockInsuficienteError,
+)
 
 crear_pedido_controller = APIRouter(prefix="/pedidos", tags=["pedidos"])
 
@@ -19,9 +25,18 @@ crear_pedido_controller = APIRouter(prefix="/pedidos", tags=["pedidos"])
     status_code=status.HTTP_201_CREATED,
     response_model=PedidoCollection,
 )
-def crear_pedido(response: Response, pedido: PedidoModel):
+async def crear_pedido(
+    response: Response,
+    pedido: PedidoModel,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Crea un pedido dada la informacion correspondiente al mismo.
 
+    Las cantidades de cada linea se descuentan del inventario de la tienda; si
+    algun producto no tiene stock suficiente el pedido no se crea y se responde
+    con status code 409, igual que si la transaccion sigue en conflicto con otros
+    pedidos despues de los reintentos. Una cantidad menor a uno responde 400.
+
     Args:
         response: parametro de entrada para construir la respuesta en el
             decorador wrapper.
@@ -54,15 +69,22 @@ def crear_pedido(response: Response, pedido: PedidoModel):
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
         data = {}
-        with PedidoService(cursor=cursor) as pedido_service:
-            data = pedido_service.pedidos_repository.add(pedido)
+        async with PedidoService(cursor=cursor) as pedido_service:
+            data = await pedido_service.crear_pedido(pedido)
 
         message = "Se obtuvo el resultado exitosamente."
         success = True
+    except CantidadInvalidaError as error:
+        data = PedidoModel()
+        message = str(error)
+        success = False
+        status_code = 400
+    except (StockInsuficienteError, PedidoEnConflictoError) as error:
+        data = PedidoModel()
+        message = str(error)
+        success = False
+        status_code = 409
     except Exception:
         log = get_log()
         log.error(traceback.format_exc())
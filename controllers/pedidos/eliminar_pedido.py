@@ -2,11 +2,12 @@
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
 from services.pedido_service import PedidoService
 
@@ -14,7 +15,11 @@ eliminar_pedido_controller = APIRouter(prefix="/pedidos", tags=["pedidos"])
 
 
 @eliminar_pedido_controller.delete("/eliminar-pedido/{identificador}", status_code=200)
-def eliminar_pedido(response: Response, identificador: str):
+async def eliminar_pedido(
+    response: Response,
+    identificador: str,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Elimina un registro correspondiente a un pedido en la base de datos
 
     Args:
@@ -31,16 +36,14 @@ def eliminar_pedido(response: Response, identificador: str):
     data = None
     status_code = 200
     message = None
+    eliminado = False
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
         data = "Pedido no eliminado correctamente"
-        with PedidoService(cursor=cursor) as pedidos_service:
-            delete_result = pedidos_service.pedidos_repository.delete(identificador)
+        async with PedidoService(cursor=cursor) as pedidos_service:
+            eliminado = await pedidos_service.eliminar_pedido(identificador)
 
-        if delete_result.deleted_count != 1:
+        if not eliminado:
             raise HTTPException(status_code=404, detail=f"Student {id} not found")
     except Exception:
         log = get_log()
@@ -51,7 +54,7 @@ def eliminar_pedido(response: Response, identificador: str):
         success = False
         status_code = 500
     finally:
-        if delete_result.deleted_count == 1:
+        if eliminado:
             return Response(status_code=status.HTTP_204_NO_CONTENT)
 
         response.status_code = status_code
@@ -0,0 +1,62 @@
+"""Modulo con el endpoint para exportar en NDJSON los pedidos registrados"""
+
+# External libraries
+import traceback
+from typing import AsyncIterator, Callable
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from models.pedidos_model import PedidoModel
+from properties.settings import Settings
+from services.pedido_service import PedidoService
+
+exportar_pedidos_controller = APIRouter(prefix="/pedidos", tags=["pedidos"])
+
+
+async def generar_pedidos_ndjson(cursor: Callable) -> AsyncIterator[str]:
+    """Genera una linea JSON por cada pedido leyendo la colleccion por lotes.
+
+    Args:
+        cursor: Cursor para ejecutar operaciones sobre la base de datos.
+
+    Returns:
+        Iterador asincrono con un pedido serializado por linea.
+    """
+    try:
+        async with PedidoService(cursor=cursor) as pedido_service:
+            async for documento in pedido_service.pedidos_repository.iter_all(
+                Settings.exportacion_batch_size
+            ):
+                yield PedidoModel(**documento).model_dump_json() + "\n"
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+        raise
+
+
+@exportar_pedidos_controller.get("/exportar-pedidos", status_code=200)
+async def exportar_pedidos(cursor: Callable = Depends(obtener_cursor_mongo)):
+    """Exporta todos los pedidos registrados como NDJSON, un pedido por linea.
+
+    La respuesta se envia a medida que se lee el cursor de Mongo, por lo que la
+    memoria usada depende del tamaño del lote y no del tamaño de la colleccion.
+
+    Args:
+        cursor: Cursor para ejecutar operaciones sobre la base de datos.
+
+    Returns:
+        Respuesta en streaming con los pedidos registrados.
+
+        .. code-block:: text
+
+            {"id": "662d0d325363bbc93a0c027c", ...}
+            {"id": "662d0d325363bbc93a0c027f", ...}
+
+    """
+    return StreamingResponse(
+        generar_pedidos_ndjson(cursor), media_type="application/x-ndjson"
+    )
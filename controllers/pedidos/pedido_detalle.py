@@ -0,0 +1,107 @@
+"""Modulo con el endpoint para obtener un pedido con su tienda, cliente y productos"""
+
+# External libraries
+import traceback
+from typing import Callable
+
+from bson.errors import InvalidId
+from fastapi import APIRouter, Depends, Response
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from models.pedidos_model import PedidoDetalleCollection, PedidoDetalleModel
+from services.pedido_service import PedidoService
+
+pedido_detalle_controller = APIRouter(prefix="/pedidos", tags=["pedidos"])
+
+
+@pedido_detalle_controller.get(
+    "/pedido-detalle/{identificador}",
+    status_code=200,
+    response_model=PedidoDetalleCollection,
+    response_model_by_alias=False,
+)
+async def pedido_detalle(
+    response: Response,
+    identificador: str,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
+    """Obtener un pedido con la informacion de su tienda, su cliente y sus productos.
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+        identificador: ID que identifica al pedido que queremos consultar
+
+    Returns:
+        Información del pedido con la tienda, el cliente y los productos.
+
+         .. code-block:: python
+
+            {
+              'msg': 'Se obtuvo el resultado exitosamente.',
+              'success': true,
+              'data': {
+                'id': '662d0d325363bbc93a0c0295',
+                'id_tienda': '662d0d325363bbc93a0c0296',
+                'id_cliente': '662d0d325363bbc93a0c0297',
+                'productos': [
+                  {
+                    'id_producto': '6717c43ef963e95aa4789246',
+                    'cantidad': 2,
+                    'precio_unitario': '5500',
+                    'producto': {
+                      'id': '6717c43ef963e95aa4789246',
+                      'nombre': 'Leche',
+                      'precio': '5500'
+                    }
+                  }],
+                'precio_total': '11000',
+                'tienda': {
+                  'id': '662d0d325363bbc93a0c0296',
+                  'nombre': 'Tienda La Esquina'
+                },
+                'cliente': {
+                  'id': '662d0d325363bbc93a0c0297',
+                  'nombre_completo': 'Emanuel Acevedo'
+                }
+              }
+            }
+
+    """
+    success = None
+    data = PedidoDetalleModel()
+    status_code = 200
+    message = None
+
+    try:
+        async with PedidoService(cursor=cursor) as pedido_service:
+            data = await pedido_service.obtener_detalle(identificador)
+
+        if data is not None:
+            message = "Se obtuvo el resultado exitosamente."
+            success = True
+        else:
+            message = f"pedido {identificador} no encontrado"
+            status_code = 404
+            data = PedidoDetalleModel()
+            success = False
+    except InvalidId:
+        data = PedidoDetalleModel()
+        message = f"Identificador {identificador} invalido"
+        success = False
+        status_code = 400
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = PedidoDetalleModel()
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        res = PedidoDetalleCollection(success=success, msg=message, data=data)
+
+    return res
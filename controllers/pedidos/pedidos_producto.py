@@ -0,0 +1,106 @@
+"""Modulo con el endpoint para obtener los pedidos que contienen un producto"""
+
+# External libraries
+import traceback
+from typing import Callable, Optional
+
+from bson.errors import InvalidId
+from fastapi import APIRouter, Depends, Query, Response
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from models.pedidos_model import PedidosCollection
+from properties.settings import Settings
+from services.pedido_service import PedidoService
+
+pedidos_producto_controller = APIRouter(prefix="/pedidos", tags=["pedidos"])
+
+
+@pedidos_producto_controller.get(
+    "/pedidos-producto/{id_producto}",
+    status_code=200,
+    response_model=PedidosCollection,
+    response_model_by_alias=False,
+)
+async def pedidos_producto(
+    response: Response,
+    id_producto: str,
+    limit: int = Query(
+        default=Settings.paginacion_limite_defecto,
+        ge=1,
+        le=Settings.paginacion_limite_maximo,
+    ),
+    after: Optional[str] = None,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
+    """Obtener los pedidos que contienen un producto en sus lineas
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+        id_producto: ID del producto que deben contener los pedidos
+        limit: Numero maximo de registros a retornar en la pagina.
+        after: Cursor ``next_cursor`` retornado por la pagina anterior.
+
+    Returns:
+        Pedidos que contienen el producto
+
+        .. code-block:: python
+
+            {
+              'data': [
+                {
+                  'id': '662d0d325363bbc93a0c027c',
+                  'id_tienda': '662d0d325363bbc93a0c0295',
+                  'id_cliente': '662d0d325363bbc93a0c0295',
+                  'productos': [
+                    {
+                      'id_producto': '662d0d325363bbc93a0c0295',
+                      'cantidad': 2,
+                      'precio_unitario': '350'
+                    }],
+                  'precio_total': '700',
+                  ...
+                }],
+              'msg': 'Se obtuvo el resultado exitosamente.',
+              'success': true,
+              'next_cursor': None
+            }
+
+    """
+    success = None
+    data = None
+    next_cursor = None
+    status_code = 200
+    message = None
+
+    try:
+        async with PedidoService(cursor=cursor) as pedido_service:
+            data, next_cursor = (
+                await pedido_service.pedidos_repository.get_list_by_producto(
+                    id_producto, limit, after
+                )
+            )
+        message = "Se obtuvo el resultado exitosamente."
+        success = True
+    except InvalidId:
+        data = None
+        message = f"Cursor {after} invalido"
+        success = False
+        status_code = 400
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = None
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        res = PedidosCollection(
+            data=data, success=success, msg=message, next_cursor=next_cursor
+        )
+
+    return res
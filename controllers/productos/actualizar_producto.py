@@ -3,14 +3,18 @@
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Depends, Response
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
-from models.productos_model import (ProductoCollection, ProductoModel,
-                                    UpdateProductoModel)
+from models.productos_model import (
+    ProductoCollection,
+    ProductoModel,
+    UpdateProductoModel,
+)
 from services.producto_service import ProductoService
 
 actualizar_producto_controller = APIRouter(prefix="/productos", tags=["productos"])
@@ -22,8 +26,11 @@ actualizar_producto_controller = APIRouter(prefix="/productos", tags=["productos
     response_model=ProductoCollection,
     response_model_by_alias=False,
 )
-def actualizar_producto(
-    response: Response, identificador: str, producto: UpdateProductoModel
+async def actualizar_producto(
+    response: Response,
+    identificador: str,
+    producto: UpdateProductoModel,
+    cursor: Callable = Depends(obtener_cursor_mongo),
 ):
     """Actualiza la informacion correspondiente a un producto en la base de datos.
 
@@ -54,13 +61,10 @@ def actualizar_producto(
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
-        with ProductoService(cursor=cursor) as producto_service:
-            data = producto_service.productos_repository.get_by_id(identificador)
+        async with ProductoService(cursor=cursor) as producto_service:
+            data = await producto_service.productos_repository.get_by_id(identificador)
             if data is not None:
-                data = producto_service.productos_repository.update(
+                data = await producto_service.productos_repository.update(
                     identificador, producto
                 )
                 message = "Se obtuvo el resultado exitosamente."
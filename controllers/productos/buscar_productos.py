@@ -0,0 +1,97 @@
+"""Modulo con el endpoint para buscar productos por el inicio de su nombre"""
+
+# External libraries
+import traceback
+from typing import Callable, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from helpers.proyeccion import CampoInvalidoError, crear_proyeccion, respuesta_recortada
+from models.productos_model import ProductoModel, ProductosCollection
+from properties.settings import Settings
+from services.producto_service import ProductoService
+
+buscar_productos_controller = APIRouter(prefix="/productos", tags=["productos"])
+
+
+@buscar_productos_controller.get(
+    "/buscar-productos",
+    status_code=200,
+    response_model=ProductosCollection,
+    response_model_by_alias=False,
+)
+async def buscar_productos(
+    response: Response,
+    texto: str = Query(min_length=1, max_length=100),
+    limit: int = Query(default=10, ge=1, le=Settings.paginacion_limite_maximo),
+    fields: Optional[str] = None,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
+    """Buscar productos por el inicio de su nombre para el autocompletado.
+
+    La busqueda no distingue mayusculas ni tildes, ``lec`` encuentra ``Leche`` y
+    ``Lécithine``.
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+        texto: Inicio del nombre de los productos.
+        limit: Numero maximo de productos a retornar.
+        fields: Campos a retornar separados por coma, todos si no se envia.
+
+    Returns:
+        Productos cuyo nombre empieza por ``texto`` ordenados por nombre
+
+        .. code-block:: python
+
+            {
+              'data': [
+                {
+                  'id': '6717c43ef963e95aa4789246',
+                  'nombre': 'Leche',
+                  'tipo': 'Lacteo',
+                  'sub_tipo': 'Leche',
+                  'precio': '5500'
+                }],
+              'next_cursor': None,
+              'msg': 'Se obtuvo el resultado exitosamente.',
+              'success': true
+            }
+
+    """
+    success = None
+    data = None
+    status_code = 200
+    message = None
+
+    try:
+        proyeccion = crear_proyeccion(ProductoModel, fields)
+        async with ProductoService(cursor=cursor) as producto_service:
+            data = await producto_service.productos_repository.buscar(
+                texto, limit, proyeccion
+            )
+        message = "Se obtuvo el resultado exitosamente."
+        success = True
+    except CampoInvalidoError as error:
+        data = None
+        message = str(error)
+        success = False
+        status_code = 400
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = None
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        res = ProductosCollection(data=data, success=success, msg=message)
+
+    if fields is not None:
+        return respuesta_recortada(res, response)
+    return res
@@ -2,11 +2,12 @@
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, Response, status
+from fastapi import APIRouter, Depends, Response, status
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
 from models.productos_model import ProductoCollection, ProductoModel
 from services.producto_service import ProductoService
@@ -19,7 +20,11 @@ crear_producto_controller = APIRouter(prefix="/productos", tags=["productos"])
     status_code=status.HTTP_201_CREATED,
     response_model=ProductoCollection,
 )
-def crear_producto(response: Response, producto: ProductoModel):
+async def crear_producto(
+    response: Response,
+    producto: ProductoModel,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Crea un producto dada la informacion correspondiente al mismo.
 
     Args:
@@ -53,12 +58,9 @@ def crear_producto(response: Response, producto: ProductoModel):
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
         data = {}
-        with ProductoService(cursor=cursor) as producto_service:
-            data = producto_service.productos_repository.add(producto)
+        async with ProductoService(cursor=cursor) as producto_service:
+            data = await producto_service.productos_repository.add(producto)
 
         message = "Se obtuvo el resultado exitosamente."
         success = True
@@ -2,11 +2,12 @@
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
 from services.producto_service import ProductoService
 
@@ -16,7 +17,11 @@ eliminar_producto_controller = APIRouter(prefix="/productos", tags=["productos"]
 @eliminar_producto_controller.delete(
     "/eliminar-producto/{identificador}", status_code=200
 )
-def elimina_producto(response: Response, identificador: str):
+async def elimina_producto(
+    response: Response,
+    identificador: str,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Elimina un registro correspondiente a un reactor en la base de datos
 
     Args:
@@ -35,12 +40,11 @@ def elimina_producto(response: Response, identificador: str):
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
         data = "Producto no eliminado correctamente"
-        with ProductoService(cursor=cursor) as producto_service:
-            delete_result = producto_service.productos_repository.delete(identificador)
+        async with ProductoService(cursor=cursor) as producto_service:
+            delete_result = await producto_service.productos_repository.delete(
+                identificador
+            )
 
         if delete_result.deleted_count != 1:
             raise HTTPException(status_code=404, detail=f"Student {id} not found")
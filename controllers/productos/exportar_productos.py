@@ -0,0 +1,62 @@
+"""Modulo con el endpoint para exportar en NDJSON los productos registrados"""
+
+# External libraries
+import traceback
+from typing import AsyncIterator, Callable
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from models.productos_model import ProductoModel
+from properties.settings import Settings
+from services.producto_service import ProductoService
+
+exportar_productos_controller = APIRouter(prefix="/productos", tags=["productos"])
+
+
+async def generar_productos_ndjson(cursor: Callable) -> AsyncIterator[str]:
+    """Genera una linea JSON por cada producto leyendo la colleccion por lotes.
+
+    Args:
+        cursor: Cursor para ejecutar operaciones sobre la base de datos.
+
+    Returns:
+        Iterador asincrono con un producto serializado por linea.
+    """
+    try:
+        async with ProductoService(cursor=cursor) as producto_service:
+            async for documento in producto_service.productos_repository.iter_all(
+                Settings.exportacion_batch_size
+            ):
+                yield ProductoModel(**documento).model_dump_json() + "\n"
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+        raise
+
+
+@exportar_productos_controller.get("/exportar-productos", status_code=200)
+async def exportar_productos(cursor: Callable = Depends(obtener_cursor_mongo)):
+    """Exporta todos los productos registrados como NDJSON, un producto por linea.
+
+    La respuesta se envia a medida que se lee el cursor de Mongo, por lo que la
+    memoria usada depende del tamaño del lote y no del tamaño de la colleccion.
+
+    Args:
+        cursor: Cursor para ejecutar operaciones sobre la base de datos.
+
+    Returns:
+        Respuesta en streaming con los productos registrados.
+
+        .. code-block:: text
+
+            {"id": "662d0d325363bbc93a0c027c", ...}
+            {"id": "662d0d325363bbc93a0c027f", ...}
+
+    """
+    return StreamingResponse(
+        generar_productos_ndjson(cursor), media_type="application/x-ndjson"
+    )
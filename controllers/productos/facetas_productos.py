@@ -0,0 +1,88 @@
+"""Modulo con el endpoint para contar los productos por tipo y sub tipo"""
+
+# External libraries
+import traceback
+from decimal import Decimal
+from typing import Callable, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from models.productos_model import FacetasProductosCollection
+from services.producto_service import ProductoService
+
+facetas_productos_controller = APIRouter(prefix="/productos", tags=["productos"])
+
+
+@facetas_productos_controller.get(
+    "/facetas-productos",
+    status_code=200,
+    response_model=FacetasProductosCollection,
+)
+async def facetas_productos(
+    response: Response,
+    tipo: Optional[str] = None,
+    sub_tipo: Optional[str] = None,
+    precio_min: Optional[Decimal] = Query(default=None, ge=0),
+    precio_max: Optional[Decimal] = Query(default=None, ge=0),
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
+    """Obtener el numero de productos por tipo y por sub tipo.
+
+    Los conteos se calculan con una sola agregacion y se guardan en cache hasta
+    que se modifica algun producto.
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+        tipo: Tipo de los productos a contar.
+        sub_tipo: Sub tipo de los productos a contar.
+        precio_min: Precio minimo (inclusivo) de los productos a contar.
+        precio_max: Precio maximo (inclusivo) de los productos a contar.
+
+    Returns:
+        Total de productos y conteos por tipo y sub tipo
+
+        .. code-block:: python
+
+            {
+              'data': {
+                'total': 3,
+                'tipos': [{'tipo': 'Lacteo', 'total': 3}],
+                'sub_tipos': [
+                  {'tipo': 'Lacteo', 'sub_tipo': 'Leche', 'total': 2},
+                  {'tipo': 'Lacteo', 'sub_tipo': 'Queso', 'total': 1}
+                ]
+              },
+              'msg': 'Se obtuvo el resultado exitosamente.',
+              'success': true
+            }
+
+    """
+    success = None
+    data = None
+    status_code = 200
+    message = None
+
+    try:
+        async with ProductoService(cursor=cursor) as producto_service:
+            data = await producto_service.productos_repository.get_facetas(
+                tipo, sub_tipo, precio_min, precio_max
+            )
+        message = "Se obtuvo el resultado exitosamente."
+        success = True
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = None
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        res = FacetasProductosCollection(data=data, success=success, msg=message)
+
+    return res
@@ -0,0 +1,107 @@
+"""Modulo con el endpoint para importar los productos de forma masiva"""
+
+# External libraries
+import traceback
+from typing import Any, Callable, Dict, List
+
+from fastapi import APIRouter, Depends, Response
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from helpers.importacion import dividir_en_lotes, validar_filas
+from models.importacion_model import ImportacionCollection
+from models.productos_model import ProductoModel
+from properties.settings import Settings
+from services.producto_service import ProductoService
+
+importar_productos_controller = APIRouter(prefix="/productos", tags=["productos"])
+
+
+@importar_productos_controller.post(
+    "/importar-productos",
+    status_code=200,
+    response_model=ImportacionCollection,
+)
+async def importar_productos(
+    response: Response,
+    productos: List[Dict[str, Any]],
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
+    """Crea varios productos en la base de datos con escrituras por lotes.
+
+    Cada fila se valida contra ``ProductoModel``; las filas invalidas o que Mongo
+    rechaza se reportan por posicion sin detener la importación del resto.
+
+    La imagen de cada producto se guarda tal como llega en ``imagen``, se
+    espera la url de una imagen ya publicada.
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+        productos: Lista con la informacion de cada producto a crear.
+
+    Returns:
+        Resumen de la importación con el id y los errores por fila.
+
+        .. code-block:: python
+
+            {
+              'msg': 'Se importaron 2 de 3 registros.',
+              'success': true,
+              'data': {
+                'insertados': 2,
+                'fallidos': 1,
+                'ids': ['662d0d325363bbc93a0c027c', None, '662d0d325363bbc93a0c027d'],
+                'errores': [{'indice': 1, 'error': "[{'type': 'string_type', ...}]"}]
+              }
+            }
+
+    """
+    success = None
+    data = None
+    status_code = 200
+    message = None
+
+    try:
+        validos, errores = validar_filas(ProductoModel, productos)
+        # Un id por fila recibida, ``None`` en las filas que no se importaron.
+        ids = [None] * len(productos)
+
+        async with ProductoService(cursor=cursor) as producto_service:
+            for lote in dividir_en_lotes(validos, Settings.importacion_batch_size):
+                identificadores, errores_lote = (
+                    await producto_service.productos_repository.add_many(
+                        [record for _, record in lote]
+                    )
+                )
+                for (indice, _), identificador in zip(lote, identificadores):
+                    ids[indice] = identificador
+                errores.extend(
+                    {"indice": lote[posicion][0], "error": error}
+                    for posicion, error in errores_lote.items()
+                )
+
+        errores.sort(key=lambda error: error["indice"])
+        insertados = sum(identificador is not None for identificador in ids)
+        data = {
+            "insertados": insertados,
+            "fallidos": len(errores),
+            "ids": ids,
+            "errores": errores,
+        }
+        message = f"Se importaron {insertados} de {len(productos)} registros."
+        success = True
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = None
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        respuesta = ImportacionCollection(success=success, msg=message, data=data)
+
+    return respuesta
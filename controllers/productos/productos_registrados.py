@@ -2,17 +2,31 @@
 
 # External libraries
 import traceback
+from decimal import Decimal
+from typing import Callable, Literal, Optional
 
-from fastapi import APIRouter, Response
+from bson.errors import InvalidId
+from fastapi import APIRouter, Depends, Header, Query, Response
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
-from models.productos_model import ProductosCollection
+from helpers.etag import calcular_etag, etag_coincide, respuesta_no_modificada
+from helpers.proyeccion import CampoInvalidoError, crear_proyeccion, respuesta_recortada
+from models.productos_model import ProductoModel, ProductosCollection
+from properties.settings import Settings
 from services.producto_service import ProductoService
 
 productos_registrados_controller = APIRouter(prefix="/productos", tags=["productos"])
 
+# Valores aceptados en ``orden``, el prefijo ``-`` indica orden descendente.
+ORDENES = {
+    "nombre": ("nombre", 1),
+    "-nombre": ("nombre", -1),
+    "precio": ("precio", 1),
+    "-precio": ("precio", -1),
+}
+
 
 @productos_registrados_controller.get(
     "/productos-registrados",
@@ -20,12 +34,37 @@ productos_registrados_controller = APIRouter(prefix="/productos", tags=["product
     response_model=ProductosCollection,
     response_model_by_alias=False,
 )
-def productos_registrados(response: Response):
+async def productos_registrados(
+    response: Response,
+    limit: int = Query(
+        default=Settings.paginacion_limite_defecto,
+        ge=1,
+        le=Settings.paginacion_limite_maximo,
+    ),
+    after: Optional[str] = None,
+    fields: Optional[str] = None,
+    tipo: Optional[str] = None,
+    sub_tipo: Optional[str] = None,
+    precio_min: Optional[Decimal] = Query(default=None, ge=0),
+    precio_max: Optional[Decimal] = Query(default=None, ge=0),
+    orden: Optional[Literal["nombre", "-nombre", "precio", "-precio"]] = None,
+    if_none_match: Optional[str] = Header(default=None),
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Obtener todos los reactores registrados en la tabla REACTORES
 
     Args:
         response: parametro de entrada para construir la respuesta en el
             decorador wrapper.
+        limit: Numero maximo de registros a retornar en la pagina.
+        after: Cursor ``next_cursor`` retornado por la pagina anterior.
+        fields: Campos a retornar separados por coma, todos si no se envia.
+        if_none_match: ETag que tiene el cliente, si no cambio se responde 304.
+        tipo: Tipo de los productos a retornar.
+        sub_tipo: Sub tipo de los productos a retornar.
+        precio_min: Precio minimo (inclusivo) de los productos a retornar.
+        precio_max: Precio maximo (inclusivo) de los productos a retornar.
+        orden: Campo por el que se ordenan los productos, ``-`` para descendente.
 
     Returns:
         Todos los reactores registrados en la base de datos
@@ -59,16 +98,37 @@ def productos_registrados(response: Response):
     """
     success = None
     data = None
+    next_cursor = None
     status_code = 200
     message = None
+    etag = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-        with ProductoService(cursor=cursor) as producto_service:
-            data = producto_service.productos_repository.get_list()
+        proyeccion = crear_proyeccion(ProductoModel, fields)
+        async with ProductoService(cursor=cursor) as producto_service:
+            data, next_cursor = await producto_service.productos_repository.get_list(
+                limit,
+                after,
+                proyeccion,
+                tipo=tipo,
+                sub_tipo=sub_tipo,
+                precio_min=precio_min,
+                precio_max=precio_max,
+                orden=ORDENES.get(orden),
+            )
+        etag = calcular_etag(data, next_cursor)
         message = "Se obtuvo el resultado exitosamente."
         success = True
+    except CampoInvalidoError as error:
+        data = None
+        message = str(error)
+        success = False
+        status_code = 400
+    except InvalidId:
+        data = None
+        message = f"Cursor {after} invalido"
+        success = False
+        status_code = 400
     except Exception:
         log = get_log()
         log.error(traceback.format_exc())
@@ -79,6 +139,17 @@ def productos_registrados(response: Response):
         status_code = 500
     finally:
         response.status_code = status_code
-        res = ProductosCollection(data=data, success=success, msg=message)
 
+    # Si el cliente ya tiene la version actual no se arma la respuesta.
+    if etag is not None:
+        if etag_coincide(if_none_match, etag):
+            return respuesta_no_modificada(etag)
+        response.headers["ETag"] = etag
+
+    res = ProductosCollection(
+        data=data, success=success, msg=message, next_cursor=next_cursor
+    )
+
+    if fields is not None:
+        return respuesta_recortada(res, response)
     return res
@@ -0,0 +1,87 @@
+"""Modulo con el endpoint para obtener los productos mas vendidos"""
+
+# External libraries
+import traceback
+from datetime import date
+from typing import Callable, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from models.reportes_model import ProductosVendidosCollection
+from services.analitica_service import AnaliticaService
+
+productos_mas_vendidos_controller = APIRouter(prefix="/reportes", tags=["reportes"])
+
+
+@productos_mas_vendidos_controller.get(
+    "/productos-mas-vendidos",
+    status_code=200,
+    response_model=ProductosVendidosCollection,
+)
+async def productos_mas_vendidos(
+    response: Response,
+    top: int = Query(default=10, ge=1, le=100),
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
+    """Obtener los productos con mas unidades vendidas.
+
+    Los pedidos se leen por lotes y se agregan con pandas, la memoria usada no
+    depende del numero de pedidos del rango.
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+        top: Numero de productos a retornar.
+        desde: Fecha inicial (inclusiva) de creacion de los pedidos.
+        hasta: Fecha final (exclusiva) de creacion de los pedidos.
+
+    Returns:
+        Productos de mayor a menor numero de unidades vendidas
+
+        .. code-block:: python
+
+            {
+              'data': [
+                {
+                  'id_producto': '6717c43ef963e95aa4789246',
+                  'unidades': 310,
+                  'ingresos': 1705000.0,
+                  'pedidos': 180
+                }],
+              'msg': 'Se obtuvo el resultado exitosamente.',
+              'success': true
+            }
+
+    """
+    success = None
+    data = None
+    status_code = 200
+    message = None
+
+    try:
+        async with AnaliticaService(cursor=cursor) as analitica_service:
+            data = await analitica_service.productos_mas_vendidos(
+                top,
+                desde.isoformat() if desde else None,
+                hasta.isoformat() if hasta else None,
+            )
+        message = "Se obtuvo el resultado exitosamente."
+        success = True
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = None
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        res = ProductosVendidosCollection(data=data, success=success, msg=message)
+
+    return res
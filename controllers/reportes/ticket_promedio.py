@@ -0,0 +1,84 @@
+"""Modulo con el endpoint para obtener el ticket promedio general y por tienda"""
+
+# External libraries
+import traceback
+from datetime import date
+from typing import Callable, Optional
+
+from fastapi import APIRouter, Depends, Response
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from models.reportes_model import TicketsPromedioCollection
+from services.analitica_service import AnaliticaService
+
+ticket_promedio_controller = APIRouter(prefix="/reportes", tags=["reportes"])
+
+
+@ticket_promedio_controller.get(
+    "/ticket-promedio",
+    status_code=200,
+    response_model=TicketsPromedioCollection,
+)
+async def ticket_promedio(
+    response: Response,
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
+    """Obtener el ticket promedio (ingresos / pedidos) general y de cada tienda.
+
+    Los pedidos se leen por lotes y se agregan con pandas, la memoria usada no
+    depende del numero de pedidos del rango.
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+        desde: Fecha inicial (inclusiva) de creacion de los pedidos.
+        hasta: Fecha final (exclusiva) de creacion de los pedidos.
+
+    Returns:
+        Ticket promedio general (``id_tienda`` en ``None``) y de cada tienda
+
+        .. code-block:: python
+
+            {
+              'data': [
+                {
+                  'id_tienda': None,
+                  'pedidos': 1200,
+                  'ingresos': 25200000.0,
+                  'ticket_promedio': 21000.0
+                }],
+              'msg': 'Se obtuvo el resultado exitosamente.',
+              'success': true
+            }
+
+    """
+    success = None
+    data = None
+    status_code = 200
+    message = None
+
+    try:
+        async with AnaliticaService(cursor=cursor) as analitica_service:
+            data = await analitica_service.ticket_promedio(
+                desde.isoformat() if desde else None,
+                hasta.isoformat() if hasta else None,
+            )
+        message = "Se obtuvo el resultado exitosamente."
+        success = True
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = None
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        res = TicketsPromedioCollection(data=data, success=success, msg=message)
+
+    return res
@@ -0,0 +1,113 @@
+"""Modulo con el endpoint para consultar el resumen de ventas por tienda y dia"""
+
+# External libraries
+import traceback
+from datetime import date
+from typing import Callable, Optional
+
+from bson.errors import InvalidId
+from fastapi import APIRouter, Depends, Query, Response
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from models.reportes_model import VentasDiariasCollection
+from properties.settings import Settings
+from services.analitica_service import AnaliticaService
+
+ventas_diarias_controller = APIRouter(prefix="/reportes", tags=["reportes"])
+
+
+@ventas_diarias_controller.get(
+    "/ventas-diarias",
+    status_code=200,
+    response_model=VentasDiariasCollection,
+    response_model_by_alias=False,
+)
+async def ventas_diarias(
+    response: Response,
+    id_tienda: Optional[str] = None,
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    limit: int = Query(
+        default=Settings.paginacion_limite_defecto,
+        ge=1,
+        le=Settings.paginacion_limite_maximo,
+    ),
+    after: Optional[str] = None,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
+    """Obtener el resumen de pedidos, unidades e ingresos por tienda y dia.
+
+    El resumen se actualiza con cada pedido creado, modificado o eliminado, por
+    lo que la consulta lee un registro por tienda y dia sin recorrer los pedidos.
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+        id_tienda: Tienda a consultar, todas si no se envia.
+        desde: Dia inicial (inclusivo).
+        hasta: Dia final (exclusivo).
+        limit: Numero maximo de registros a retornar en la pagina.
+        after: Cursor ``next_cursor`` retornado por la pagina anterior.
+
+    Returns:
+        Resumen de ventas ordenado por dia
+
+        .. code-block:: python
+
+            {
+              'data': [
+                {
+                  'id': '6717c43ef963e95aa4789300',
+                  'id_tienda': '662d0d325363bbc93a0c0296',
+                  'dia': '2024-10-22',
+                  'pedidos': 42,
+                  'unidades': 130,
+                  'ingresos': '840000'
+                }],
+              'next_cursor': None,
+              'msg': 'Se obtuvo el resultado exitosamente.',
+              'success': true
+            }
+
+    """
+    success = None
+    data = None
+    next_cursor = None
+    status_code = 200
+    message = None
+
+    try:
+        async with AnaliticaService(cursor=cursor) as analitica_service:
+            data, next_cursor = (
+                await analitica_service.ventas_diarias_repository.get_list(
+                    limit,
+                    after,
+                    id_tienda,
+                    desde.isoformat() if desde else None,
+                    hasta.isoformat() if hasta else None,
+                )
+            )
+        message = "Se obtuvo el resultado exitosamente."
+        success = True
+    except InvalidId:
+        data = None
+        message = f"Cursor {after} invalido"
+        success = False
+        status_code = 400
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = None
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        res = VentasDiariasCollection(
+            data=data, success=success, msg=message, next_cursor=next_cursor
+        )
+
+    return res
@@ -0,0 +1,85 @@
+"""Modulo con el endpoint para obtener los ingresos por tienda y dia"""
+
+# External libraries
+import traceback
+from datetime import date
+from typing import Callable, Optional
+
+from fastapi import APIRouter, Depends, Response
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from models.reportes_model import VentasTiendaDiaCollection
+from services.analitica_service import AnaliticaService
+
+ventas_tienda_dia_controller = APIRouter(prefix="/reportes", tags=["reportes"])
+
+
+@ventas_tienda_dia_controller.get(
+    "/ventas-tienda-dia",
+    status_code=200,
+    response_model=VentasTiendaDiaCollection,
+)
+async def ventas_tienda_dia(
+    response: Response,
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
+    """Obtener los ingresos, pedidos y ticket promedio de cada tienda por dia.
+
+    Los pedidos se leen por lotes y se agregan con pandas, la memoria usada no
+    depende del numero de pedidos del rango.
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+        desde: Fecha inicial (inclusiva) de creacion de los pedidos.
+        hasta: Fecha final (exclusiva) de creacion de los pedidos.
+
+    Returns:
+        Ventas de cada tienda por dia ordenadas por tienda y dia
+
+        .. code-block:: python
+
+            {
+              'data': [
+                {
+                  'id_tienda': '662d0d325363bbc93a0c0296',
+                  'dia': '2024-10-22',
+                  'pedidos': 42,
+                  'ingresos': 840000.0,
+                  'ticket_promedio': 20000.0
+                }],
+              'msg': 'Se obtuvo el resultado exitosamente.',
+              'success': true
+            }
+
+    """
+    success = None
+    data = None
+    status_code = 200
+    message = None
+
+    try:
+        async with AnaliticaService(cursor=cursor) as analitica_service:
+            data = await analitica_service.ventas_tienda_dia(
+                desde.isoformat() if desde else None,
+                hasta.isoformat() if hasta else None,
+            )
+        message = "Se obtuvo el resultado exitosamente."
+        success = True
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = None
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        res = VentasTiendaDiaCollection(data=data, success=success, msg=message)
+
+    return res
@@ -3,11 +3,12 @@
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Depends, Response
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
 from models.tiendas_model import TiendaCollection, TiendaModel, UpdateTiendaModel
 from services.tienda_service import TiendaService
@@ -21,8 +22,11 @@ actualizar_tienda_controller = APIRouter(prefix="/tiendas", tags=["tiendas"])
     response_model=TiendaCollection,
     response_model_by_alias=False,
 )
-def actualizar_tienda(
-    response: Response, identificador: str, tienda: UpdateTiendaModel
+async def actualizar_tienda(
+    response: Response,
+    identificador: str,
+    tienda: UpdateTiendaModel,
+    cursor: Callable = Depends(obtener_cursor_mongo),
 ):
     """Actualiza la informacion correspondiente a un tienda en la base de datos.
 
@@ -53,13 +57,12 @@ def actualizar_tienda(
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
-        with TiendaService(cursor=cursor) as tienda_service:
-            data = tienda_service.tiendas_repository.get_by_id(identificador)
+        async with TiendaService(cursor=cursor) as tienda_service:
+            data = await tienda_service.tiendas_repository.get_by_id(identificador)
             if data is not None:
-                data = tienda_service.tiendas_repository.update(identificador, tienda)
+                data = await tienda_service.tiendas_repository.update(
+                    identificador, tienda
+                )
                 message = "Se obtuvo el resultado exitosamente."
                 success = True
             else:
@@ -0,0 +1,109 @@
+"""Modulo con el endpoint para obtener el catalogo (inventario y productos) de una
+tienda"""
+
+# External libraries
+import traceback
+from typing import Callable, Optional
+
+from bson.errors import InvalidId
+from fastapi import APIRouter, Depends, Query, Response
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from models.tiendas_model import CatalogoTiendaCollection
+from properties.settings import Settings
+from services.inventario_service import InventarioService
+
+catalogo_tienda_controller = APIRouter(prefix="/tiendas", tags=["tiendas"])
+
+
+@catalogo_tienda_controller.get(
+    "/{identificador}/catalogo",
+    status_code=200,
+    response_model=CatalogoTiendaCollection,
+    response_model_by_alias=False,
+)
+async def catalogo_tienda(
+    response: Response,
+    identificador: str,
+    limit: int = Query(
+        default=Settings.paginacion_limite_defecto,
+        ge=1,
+        le=Settings.paginacion_limite_maximo,
+    ),
+    after: Optional[str] = None,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
+    """Obtener los productos que tiene una tienda, su cantidad disponible y su precio.
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+        identificador: ID de la tienda registrado en ``id_tienda`` del inventario.
+        limit: Numero maximo de registros a retornar en la pagina.
+        after: Cursor ``next_cursor`` retornado por la pagina anterior.
+
+    Returns:
+        Inventario de la tienda con la informacion de cada producto
+
+        .. code-block:: python
+
+            {
+              'data': [
+                {
+                  'id': '6717c43ef963e95aa4789250',
+                  'id_producto': '6717c43ef963e95aa4789246',
+                  'id_tienda': '662d0d325363bbc93a0c0296',
+                  'cantidad_disponibles': 12,
+                  'fecha_creacion': '2024-10-22T00:00:00',
+                  'fecha_actualizacion': '2024-10-22T00:00:00',
+                  'producto': {
+                    'id': '6717c43ef963e95aa4789246',
+                    'nombre': 'Leche',
+                    'tipo': 'Lacteo',
+                    'sub_tipo': 'Leche',
+                    'precio': '5500'
+                  }
+                }],
+              'next_cursor': None,
+              'msg': 'Se obtuvo el resultado exitosamente.',
+              'success': true
+            }
+
+    """
+    success = None
+    data = None
+    next_cursor = None
+    status_code = 200
+    message = None
+
+    try:
+        async with InventarioService(cursor=cursor) as inventario_service:
+            data, next_cursor = (
+                await inventario_service.inventarios_repository.get_catalogo(
+                    identificador, limit, after
+                )
+            )
+        message = "Se obtuvo el resultado exitosamente."
+        success = True
+    except InvalidId:
+        data = None
+        message = f"Cursor {after} invalido"
+        success = False
+        status_code = 400
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = None
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        res = CatalogoTiendaCollection(
+            data=data, success=success, msg=message, next_cursor=next_cursor
+        )
+
+    return res
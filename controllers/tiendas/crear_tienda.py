@@ -2,11 +2,12 @@
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, Response, status
+from fastapi import APIRouter, Depends, Response, status
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
 from models.tiendas_model import TiendaCollection, TiendaModel
 from services.tienda_service import TiendaService
@@ -19,7 +20,11 @@ crear_tienda_controller = APIRouter(prefix="/tiendas", tags=["tiendas"])
     status_code=status.HTTP_201_CREATED,
     response_model=TiendaCollection,
 )
-def crear_tienda(response: Response, tienda: TiendaModel):
+async def crear_tienda(
+    response: Response,
+    tienda: TiendaModel,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Crea un tienda dada la informacion correspondiente al mismo.
 
     Args:
@@ -58,12 +63,9 @@ def crear_tienda(response: Response, tienda: TiendaModel):
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
         data = {}
-        with TiendaService(cursor=cursor) as tienda_service:
-            data = tienda_service.tiendas_repository.add(tienda)
+        async with TiendaService(cursor=cursor) as tienda_service:
+            data = await tienda_service.tiendas_repository.add(tienda)
 
         message = "Se obtuvo el resultado exitosamente."
         success = True
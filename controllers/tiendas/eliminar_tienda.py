@@ -2,11 +2,12 @@
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
 from services.tienda_service import TiendaService
 
@@ -14,7 +15,11 @@ eliminar_tienda_controller = APIRouter(prefix="/tiendas", tags=["tiendas"])
 
 
 @eliminar_tienda_controller.delete("/eliminar-tienda/{identificador}", status_code=200)
-def elimina_tienda(response: Response, identificador: str):
+async def elimina_tienda(
+    response: Response,
+    identificador: str,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Elimina un registro correspondiente a un tienda en la base de datos
 
     Args:
@@ -33,12 +38,11 @@ def elimina_tienda(response: Response, identificador: str):
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
         data = "Reactor no eliminado correctamente"
-        with TiendaService(cursor=cursor) as tienda_service:
-            delete_result = tienda_service.tiendas_repository.delete(identificador)
+        async with TiendaService(cursor=cursor) as tienda_service:
+            delete_result = await tienda_service.tiendas_repository.delete(
+                identificador
+            )
 
         if delete_result.deleted_count != 1:
             raise HTTPException(status_code=404, detail=f"Student {id} not found")
@@ -0,0 +1,62 @@
+"""Modulo con el endpoint para exportar en NDJSON las tiendas registradas"""
+
+# External libraries
+import traceback
+from typing import AsyncIterator, Callable
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from models.tiendas_model import TiendaModel
+from properties.settings import Settings
+from services.tienda_service import TiendaService
+
+exportar_tiendas_controller = APIRouter(prefix="/tiendas", tags=["tiendas"])
+
+
+async def generar_tiendas_ndjson(cursor: Callable) -> AsyncIterator[str]:
+    """Genera una linea JSON por cada tienda leyendo la colleccion por lotes.
+
+    Args:
+        cursor: Cursor para ejecutar operaciones sobre la base de datos.
+
+    Returns:
+        Iterador asincrono con una tienda serializada por linea.
+    """
+    try:
+        async with TiendaService(cursor=cursor) as tienda_service:
+            async for documento in tienda_service.tiendas_repository.iter_all(
+                Settings.exportacion_batch_size
+            ):
+                yield TiendaModel(**documento).model_dump_json() + "\n"
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+        raise
+
+
+@exportar_tiendas_controller.get("/exportar-tiendas", status_code=200)
+async def exportar_tiendas(cursor: Callable = Depends(obtener_cursor_mongo)):
+    """Exporta todas las tiendas registradas como NDJSON, una tienda por linea.
+
+    La respuesta se envia a medida que se lee el cursor de Mongo, por lo que la
+    memoria usada depende del tamaño del lote y no del tamaño de la colleccion.
+
+    Args:
+        cursor: Cursor para ejecutar operaciones sobre la base de datos.
+
+    Returns:
+        Respuesta en streaming con las tiendas registradas.
+
+        .. code-block:: text
+
+            {"id": "662d0d325363bbc93a0c027c", ...}
+            {"id": "662d0d325363bbc93a0c027f", ...}
+
+    """
+    return StreamingResponse(
+        generar_tiendas_ndjson(cursor), media_type="application/x-ndjson"
+    )
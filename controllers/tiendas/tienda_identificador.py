@@ -2,12 +2,15 @@
 
 # External libraries
 import traceback
+from typing import Callable, Optional
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Depends, Header, Response
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
+from helpers.etag import calcular_etag, etag_coincide, respuesta_no_modificada
+from helpers.proyeccion import CampoInvalidoError, crear_proyeccion, respuesta_recortada
 from models.tiendas_model import TiendaCollection, TiendaModel
 from services.tienda_service import TiendaService
 
@@ -20,14 +23,23 @@ tienda_identificador_controller = APIRouter(prefix="/tiendas", tags=["tiendas"])
     response_model=TiendaCollection,
     response_model_by_alias=False,
 )
-def tienda_identificador(response: Response, identificador: str):
+async def tienda_identificador(
+    response: Response,
+    identificador: str,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(default=None),
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Obtener informacion de un tienda registrado en la tabla REACTORES
         segun su ID.
 
     Args:
         response: parametro de entrada para construir la respuesta en el
             decorador wrapper.
-        identificador: ID que identifica al tienda que queremos consultar
+        identificador: ID del usuario tendero de la tienda que queremos
+            consultar (``id_usuario_tendero``).
+        fields: Campos a retornar separados por coma, todos si no se envia.
+        if_none_match: ETag que tiene el cliente, si no cambio se responde 304.
 
     Returns:
         Información corespondiente al tienda que queremos consultar.
@@ -54,17 +66,25 @@ def tienda_identificador(response: Response, identificador: str):
     data = TiendaModel()
     status_code = 200
     message = None
+    etag = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
-        with TiendaService(cursor=cursor) as tienda_service:
-            data = tienda_service.tiendas_repository.get_by_id(identificador)
+        proyeccion = crear_proyeccion(TiendaModel, fields)
+        async with TiendaService(cursor=cursor) as tienda_service:
+            data = await tienda_service.tiendas_repository.get_by_id(
+                identificador, proyeccion
+            )
             if data is None:
                 data = TiendaModel()
+            else:
+                etag = calcular_etag(data)
         message = "Se obtuvo el resultado exitosamente."
         success = True
+    except CampoInvalidoError as error:
+        data = TiendaModel()
+        message = str(error)
+        success = False
+        status_code = 400
     except Exception:
         log = get_log()
         log.error(traceback.format_exc())
@@ -75,6 +95,15 @@ def tienda_identificador(response: Response, identificador: str):
         status_code = 500
     finally:
         response.status_code = status_code
-        res = TiendaCollection(success=success, msg=message, data=data)
 
+    # Si el cliente ya tiene la version actual no se arma la respuesta.
+    if etag is not None:
+        if etag_coincide(if_none_match, etag):
+            return respuesta_no_modificada(etag)
+        response.headers["ETag"] = etag
+
+    res = TiendaCollection(success=success, msg=message, data=data)
+
+    if fields is not None:
+        return respuesta_recortada(res, response)
     return res
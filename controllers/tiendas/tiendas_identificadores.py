@@ -0,0 +1,117 @@
+"""Modulo con el endpoint para obtener varios tiendas por identificador (ID)"""
+
+# External libraries
+import traceback
+from typing import Callable, Optional
+
+from fastapi import APIRouter, Depends, Response
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from helpers.proyeccion import CampoInvalidoError, crear_proyeccion, respuesta_recortada
+from models.tiendas_model import TiendaModel, TiendasIdentificadoresCollection
+from properties.settings import Settings
+from services.tienda_service import TiendaService
+
+tiendas_identificadores_controller = APIRouter(prefix="/tiendas", tags=["tiendas"])
+
+
+@tiendas_identificadores_controller.get(
+    "/tiendas-identificadores",
+    status_code=200,
+    response_model=TiendasIdentificadoresCollection,
+    response_model_by_alias=False,
+)
+async def tiendas_identificadores(
+    response: Response,
+    ids: str,
+    fields: Optional[str] = None,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
+    """Obtener varios tiendas con una sola consulta a la base de datos.
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+        ids: ``_id`` de las tiendas separados por coma (el ``id_tienda`` de
+            pedidos e inventarios), no el usuario tendero que recibe
+            ``tienda-identificador``.
+        fields: Campos a retornar separados por coma, todos si no se envia.
+
+    Returns:
+        Tiendas en el orden de ``ids`` e identificadores que no existen.
+
+        .. code-block:: python
+
+            {
+              'data': [
+                {
+                  'id': '662d10f8dd91ebe8c34a81f2',
+                  'id_usuario_tendero': '662d10f8dd91ebe8c34a81f2',
+                  'nombre': 'RanchoTienda',
+                  'ciudad': 'Medellín',
+                  'pais': 'Colombia',
+                  'direccion': 'Carrera 65 C #47 Sur 44',
+                  'telefono': '4187277',
+                  'celular': '3187604393',
+                  'hora_inicio': '08:00',
+                  'hora_fin': '16:00',
+                  'fecha_creacion': '2024-10-22T00:00:00',
+                  'fecha_actualizacion': '2024-10-22T00:00:00'
+                }],
+              'faltantes': ['6717c43ef963e95aa4789247'],
+              'msg': 'Se obtuvo el resultado exitosamente.',
+              'success': true
+            }
+
+    """
+    success = None
+    data = None
+    faltantes = []
+    status_code = 200
+    message = None
+
+    try:
+        identificadores = [
+            identificador.strip()
+            for identificador in ids.split(",")
+            if identificador.strip()
+        ]
+        proyeccion = crear_proyeccion(TiendaModel, fields)
+
+        if len(identificadores) > Settings.paginacion_limite_maximo:
+            message = (
+                f"Se pueden consultar maximo {Settings.paginacion_limite_maximo} ids"
+            )
+            success = False
+            status_code = 400
+        else:
+            async with TiendaService(cursor=cursor) as tienda_service:
+                data, faltantes = await tienda_service.tiendas_repository.get_many(
+                    identificadores, proyeccion
+                )
+            message = "Se obtuvo el resultado exitosamente."
+            success = True
+    except CampoInvalidoError as error:
+        data = None
+        message = str(error)
+        success = False
+        status_code = 400
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = None
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        res = TiendasIdentificadoresCollection(
+            data=data, success=success, msg=message, faltantes=faltantes
+        )
+
+    if fields is not None:
+        return respuesta_recortada(res, response)
+    return res
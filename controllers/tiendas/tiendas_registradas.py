@@ -2,13 +2,18 @@
 
 # External libraries
 import traceback
+from typing import Callable, Optional
 
-from fastapi import APIRouter, Response
+from bson.errors import InvalidId
+from fastapi import APIRouter, Depends, Header, Query, Response
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
-from models.tiendas_model import TiendasCollection
+from helpers.etag import calcular_etag, etag_coincide, respuesta_no_modificada
+from helpers.proyeccion import CampoInvalidoError, crear_proyeccion, respuesta_recortada
+from models.tiendas_model import TiendaModel, TiendasCollection
+from properties.settings import Settings
 from services.tienda_service import TiendaService
 
 tiendas_registradas_controller = APIRouter(prefix="/tiendas", tags=["tiendas"])
@@ -20,12 +25,27 @@ tiendas_registradas_controller = APIRouter(prefix="/tiendas", tags=["tiendas"])
     response_model=TiendasCollection,
     response_model_by_alias=False,
 )
-def tiendas_registradas(response: Response):
+async def tiendas_registradas(
+    response: Response,
+    limit: int = Query(
+        default=Settings.paginacion_limite_defecto,
+        ge=1,
+        le=Settings.paginacion_limite_maximo,
+    ),
+    after: Optional[str] = None,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(default=None),
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Obtener todos los tiendaes registrados en la tabla REACTORES
 
     Args:
         response: parametro de entrada para construir la respuesta en el
             decorador wrapper.
+        limit: Numero maximo de registros a retornar en la pagina.
+        after: Cursor ``next_cursor`` retornado por la pagina anterior.
+        fields: Campos a retornar separados por coma, todos si no se envia.
+        if_none_match: ETag que tiene el cliente, si no cambio se responde 304.
 
     Returns:
         Todos los tiendaes registrados en la base de datos
@@ -61,16 +81,30 @@ def tiendas_registradas(response: Response):
     """
     success = None
     data = None
+    next_cursor = None
     status_code = 200
     message = None
+    etag = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-        with TiendaService(cursor=cursor) as tienda_service:
-            data = tienda_service.tiendas_repository.get_list()
+        proyeccion = crear_proyeccion(TiendaModel, fields)
+        async with TiendaService(cursor=cursor) as tienda_service:
+            data, next_cursor = await tienda_service.tiendas_repository.get_list(
+                limit, after, proyeccion
+            )
+        etag = calcular_etag(data, next_cursor)
         message = "Se obtuvo el resultado exitosamente."
         success = True
+    except CampoInvalidoError as error:
+        data = None
+        message = str(error)
+        success = False
+        status_code = 400
+    except InvalidId:
+        data = None
+        message = f"Cursor {after} invalido"
+        success = False
+        status_code = 400
     except Exception:
         log = get_log()
         log.error(traceback.format_exc())
@@ -81,6 +115,17 @@ def tiendas_registradas(response: Response):
         status_code = 500
     finally:
         response.status_code = status_code
-        res = TiendasCollection(data=data, success=success, msg=message)
 
+    # Si el cliente ya tiene la version actual no se arma la respuesta.
+    if etag is not None:
+        if etag_coincide(if_none_match, etag):
+            return respuesta_no_modificada(etag)
+        response.headers["ETag"] = etag
+
+    res = TiendasCollection(
+        data=data, success=success, msg=message, next_cursor=next_cursor
+    )
+
+    if fields is not None:
+        return respuesta_recortada(res, response)
     return res
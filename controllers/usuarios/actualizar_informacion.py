@@ -2,13 +2,17 @@
 
 # External libraries
 import traceback
+from typing import Callable, Optional
 
-from fastapi import APIRouter, Response
+from bson.errors import InvalidId
+from fastapi import APIRouter, Depends, Query, Response
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
+from helpers.proyeccion import crear_proyeccion
 from models.usuarios_model import UsuarioModel, UsuariosCollection
+from properties.settings import Settings
 from services.usuario_service import UsuarioService
 
 actualizar_informacion_controller = APIRouter(prefix="/usuarios", tags=["usuarios"])
@@ -20,12 +24,24 @@ actualizar_informacion_controller = APIRouter(prefix="/usuarios", tags=["usuario
     response_model=UsuariosCollection,
     response_model_by_alias=False,
 )
-def actualizar_informacion(response: Response, usuario: UsuarioModel):
+async def actualizar_informacion(
+    response: Response,
+    usuario: UsuarioModel,
+    limit: int = Query(
+        default=Settings.paginacion_limite_defecto,
+        ge=1,
+        le=Settings.paginacion_limite_maximo,
+    ),
+    after: Optional[str] = None,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Obtener todos los reactores registrados en la tabla REACTORES
 
     Args:
         response: parametro de entrada para construir la respuesta en el
             decorador wrapper.
+        limit: Numero maximo de registros a retornar en la pagina.
+        after: Cursor ``next_cursor`` retornado por la pagina anterior.
 
     Returns:
         Todos los reactores registrados en la base de datos
@@ -61,16 +77,23 @@ def actualizar_informacion(response: Response, usuario: UsuarioModel):
     """
     success = None
     data = None
+    next_cursor = None
     status_code = 200
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-        with UsuarioService(cursor=cursor) as usuarios_service:
-            data = usuarios_service.usuarios_repository.get_list()
+        proyeccion = crear_proyeccion(UsuarioModel, None, ocultos=["password"])
+        async with UsuarioService(cursor=cursor) as usuarios_service:
+            data, next_cursor = await usuarios_service.usuarios_repository.get_list(
+                limit, after, proyeccion
+            )
         message = "Se obtuvo el resultado exitosamente."
         success = True
+    except InvalidId:
+        data = None
+        message = f"Cursor {after} invalido"
+        success = False
+        status_code = 400
     except Exception as ex:
         log = get_log()
         log.error(traceback.format_exc())
@@ -81,6 +104,8 @@ def actualizar_informacion(response: Response, usuario: UsuarioModel):
         status_code = 500
     finally:
         response.status_code = status_code
-        res = UsuariosCollection(data=data, success=success, msg=message)
+        res = UsuariosCollection(
+            data=data, success=success, msg=message, next_cursor=next_cursor
+        )
 
     return res
@@ -2,13 +2,18 @@
 
 # External libraries
 import traceback
+from typing import Callable, Optional
 
-from fastapi import APIRouter, Response
+from bson.errors import InvalidId
+from fastapi import APIRouter, Depends, Header, Query, Response
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
+from helpers.etag import calcular_etag, etag_coincide, respuesta_no_modificada
+from helpers.proyeccion import CampoInvalidoError, crear_proyeccion, respuesta_recortada
 from models.usuarios_model import UsuarioModel, UsuariosCollection
+from properties.settings import Settings
 from services.usuario_service import UsuarioService
 
 consultar_usuarios_controller = APIRouter(prefix="/usuarios", tags=["usuarios"])
@@ -20,7 +25,19 @@ consultar_usuarios_controller = APIRouter(prefix="/usuarios", tags=["usuarios"])
     response_model=UsuariosCollection,
     response_model_by_alias=False,
 )
-def consultar_usuarios(response: Response, identificador: str):
+async def consultar_usuarios(
+    response: Response,
+    identificador: str,
+    limit: int = Query(
+        default=Settings.paginacion_limite_defecto,
+        ge=1,
+        le=Settings.paginacion_limite_maximo,
+    ),
+    after: Optional[str] = None,
+    fields: Optional[str] = None,
+    if_none_match: Optional[str] = Header(default=None),
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Obtener informacion de un usuario registrado en la tabla REACTORES
         segun su ID.
 
@@ -28,6 +45,10 @@ def consultar_usuarios(response: Response, identificador: str):
         response: parametro de entrada para construir la respuesta en el
             decorador wrapper.
         identificador: ID que identifica al usuario que queremos consultar
+        limit: Numero maximo de registros a retornar en la pagina.
+        after: Cursor ``next_cursor`` retornado por la pagina anterior.
+        fields: Campos a retornar separados por coma, todos si no se envia.
+        if_none_match: ETag que tiene el cliente, si no cambio se responde 304.
 
     Returns:
         Información corespondiente al usuario que queremos consultar.
@@ -51,32 +72,53 @@ def consultar_usuarios(response: Response, identificador: str):
 
     """
     success = None
-    data = UsuarioModel()
+    data = None
+    next_cursor = None
     status_code = 200
     message = None
+    etag = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
-        with UsuarioService(cursor=cursor) as usuario_service:
-            # data = usuario_service.usuarios_repository.get_list(identificador)
-            data = usuario_service.usuarios_repository.get_list()
-            if data is None:
-                data = UsuarioModel()
+        proyeccion = crear_proyeccion(UsuarioModel, fields, ocultos=["password"])
+        async with UsuarioService(cursor=cursor) as usuario_service:
+            data, next_cursor = await usuario_service.usuarios_repository.get_list(
+                limit, after, proyeccion
+            )
+        etag = calcular_etag(data, next_cursor)
         message = "Se obtuvo el resultado exitosamente."
         success = True
+    except CampoInvalidoError as error:
+        data = None
+        message = str(error)
+        success = False
+        status_code = 400
+    except InvalidId:
+        data = None
+        message = f"Cursor {after} invalido"
+        success = False
+        status_code = 400
     except Exception:
         log = get_log()
         log.error(traceback.format_exc())
 
-        data = UsuarioModel()
+        data = None
         message = "Error al obtener el resultado"
         success = False
         status_code = 500
     finally:
         response.status_code = status_code
-        print("data: ", data)
-        res = UsuariosCollection(success=success, msg=message, data=data)
 
+    # Si el cliente ya tiene la version actual no se arma la respuesta.
+    if etag is not None:
+        if etag_coincide(if_none_match, etag):
+            return respuesta_no_modificada(etag)
+        response.headers["ETag"] = etag
+
+    print("data: ", data)
+    res = UsuariosCollection(
+        success=success, msg=message, data=data, next_cursor=next_cursor
+    )
+
+    if fields is not None:
+        return respuesta_recortada(res, response)
     return res
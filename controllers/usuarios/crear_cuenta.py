@@ -2,11 +2,13 @@
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, Response, status
+from fastapi import APIRouter, Depends, Response, status
+from pymongo.errors import DuplicateKeyError
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
 from models.usuarios_model import UsuarioCollection, UsuarioModel
 from services.usuario_service import UsuarioService
@@ -19,7 +21,11 @@ crear_cuenta_controller = APIRouter(prefix="/usuarios", tags=["usuarios"])
     status_code=status.HTTP_201_CREATED,
     response_model=UsuarioCollection,
 )
-def crear_cuenta(response: Response, usuario: UsuarioModel):
+async def crear_cuenta(
+    response: Response,
+    usuario: UsuarioModel,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Crea un usuario dada la informacion correspondiente al mismo.
 
     Args:
@@ -28,7 +34,8 @@ def crear_cuenta(response: Response, usuario: UsuarioModel):
         usuario: Informacion del usuario a crear en la base de datos
 
     Returns:
-        Si el usuario fue creado exitosamente o no.
+        Si el usuario fue creado exitosamente o no. Si ya existe una cuenta con el
+        email, sin distinguir mayusculas, regresara un status code de 409.
 
         .. code-block:: python
 
@@ -39,7 +46,6 @@ def crear_cuenta(response: Response, usuario: UsuarioModel):
                 '_id': ObjectId('670555dceb7cebdfcf1ba320'),
                 'nombre_completo': 'Emanuel Acevedo',
                 'email': 'emanuelacag@gmail.com',
-                'password': '1000306848',
                 'pais': 'Colombia',
                 'ciudad': 'Medellín',
                 'tipo': 'cliente',
@@ -55,20 +61,22 @@ def crear_cuenta(response: Response, usuario: UsuarioModel):
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
         data = {}
-        with UsuarioService(cursor=cursor) as reactor_service:
-            data = reactor_service.usuarios_repository.add(usuario)
+        async with UsuarioService(cursor=cursor) as reactor_service:
+            data = await reactor_service.usuarios_repository.add(usuario)
 
         message = "Se obtuvo el resultado exitosamente."
         success = True
+    except DuplicateKeyError:
+        data = UsuarioModel()
+        message = f"Ya existe una cuenta con el email {usuario.email}"
+        success = False
+        status_code = 409
     except Exception:
         log = get_log()
         log.error(traceback.format_exc())
 
-        data = None
+        data = UsuarioModel()
         message = "Error al obtener el resultado"
         success = False
         status_code = 500
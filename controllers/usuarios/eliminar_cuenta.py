@@ -2,11 +2,12 @@
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
 from services.usuario_service import UsuarioService
 
@@ -14,7 +15,11 @@ eliminar_cuenta_controller = APIRouter(prefix="/usuarios", tags=["usuarios"])
 
 
 @eliminar_cuenta_controller.delete("/eliminar-cuenta/{identificador}", status_code=200)
-def eliminar_cuenta(response: Response, identificador: str):
+async def eliminar_cuenta(
+    response: Response,
+    identificador: str,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
     """Elimina un registro correspondiente a un reactor en la base de datos
 
     Args:
@@ -33,12 +38,11 @@ def eliminar_cuenta(response: Response, identificador: str):
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
         data = "Usuario no eliminado correctamente"
-        with UsuarioService(cursor=cursor) as reactor_service:
-            delete_result = reactor_service.usuarios_repository.delete(identificador)
+        async with UsuarioService(cursor=cursor) as reactor_service:
+            delete_result = await reactor_service.usuarios_repository.delete(
+                identificador
+            )
 
         if delete_result.deleted_count != 1:
             raise HTTPException(
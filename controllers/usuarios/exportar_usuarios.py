@@ -0,0 +1,66 @@
+"""Modulo con el endpoint para exportar en NDJSON los usuarios registrados"""
+
+# External libraries
+import traceback
+from typing import AsyncIterator, Callable
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from models.usuarios_model import UsuarioModel
+from properties.settings import Settings
+from services.usuario_service import UsuarioService
+
+exportar_usuarios_controller = APIRouter(prefix="/usuarios", tags=["usuarios"])
+
+
+async def generar_usuarios_ndjson(cursor: Callable) -> AsyncIterator[str]:
+    """Genera una linea JSON por cada usuario leyendo la colleccion por lotes.
+
+    Args:
+        cursor: Cursor para ejecutar operaciones sobre la base de datos.
+
+    Returns:
+        Iterador asincrono con un usuario serializado por linea.
+    """
+    try:
+        async with UsuarioService(cursor=cursor) as usuario_service:
+            async for documento in usuario_service.usuarios_repository.iter_all(
+                Settings.exportacion_batch_size
+            ):
+                yield UsuarioModel(**documento).model_dump_json(
+                    exclude={"password"}
+                ) + "\n"
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+        raise
+
+
+@exportar_usuarios_controller.get("/exportar-usuarios", status_code=200)
+async def exportar_usuarios(cursor: Callable = Depends(obtener_cursor_mongo)):
+    """Exporta todos los usuarios registrados como NDJSON, un usuario por linea.
+
+    La respuesta se envia a medida que se lee el cursor de Mongo, por lo que la
+    memoria usada depende del tamaño del lote y no del tamaño de la colleccion.
+
+    Los password de los usuarios no se incluyen en la exportacion.
+
+    Args:
+        cursor: Cursor para ejecutar operaciones sobre la base de datos.
+
+    Returns:
+        Respuesta en streaming con los usuarios registrados.
+
+        .. code-block:: text
+
+            {"id": "662d0d325363bbc93a0c027c", ...}
+            {"id": "662d0d325363bbc93a0c027f", ...}
+
+    """
+    return StreamingResponse(
+        generar_usuarios_ndjson(cursor), media_type="application/x-ndjson"
+    )
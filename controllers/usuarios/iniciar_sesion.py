@@ -1,81 +1,86 @@
-"""Modulo con el endpoint para obtener un usuario por identificador (ID)"""
+"""Modulo con el endpoint para iniciar sesion con email y password"""
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Depends, Response
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
-from models.usuarios_model import UsuarioCollection, UsuarioModel
+from models.sesiones_model import CredencialesModel, TokensCollection
 from services.usuario_service import UsuarioService
 
 iniciar_sesion_controller = APIRouter(prefix="/usuarios", tags=["usuarios"])
 
 
-@iniciar_sesion_controller.get(
-    "/iniciar-sesion/{identificador}",
+@iniciar_sesion_controller.post(
+    "/iniciar-sesion",
     status_code=200,
-    response_model=UsuarioCollection,
-    response_model_by_alias=False,
+    response_model=TokensCollection,
 )
-def iniciar_sesion(response: Response, identificador: str):
-    """Obtener informacion de un usuario registrado en la tabla REACTORES
-        segun su ID.
+async def iniciar_sesion(
+    response: Response,
+    credenciales: CredencialesModel,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
+    """Verifica el email y password de un usuario y retorna sus tokens de sesion.
+
+    El ``access_token`` se envia en el header ``Authorization: Bearer`` de las
+    peticiones autenticadas, que lo validan sin consultar el usuario en la base
+    de datos. Cuando expira se renueva con ``refresh_token`` en
+    ``/usuarios/refrescar-sesion``.
 
     Args:
         response: parametro de entrada para construir la respuesta en el
             decorador wrapper.
-        identificador: ID que identifica al usuario que queremos consultar
+        credenciales: Email y password del usuario.
 
     Returns:
-        Información corespondiente al usuario que queremos consultar.
+        Tokens de la sesion.
 
          .. code-block:: python
 
             {
-              'msg': 'Se obtuvo el resultado exitosamente.',
+              'msg': 'Sesion iniciada exitosamente.',
               'success': true,
               'data': {
-                'id': '662d0d325363bbc93a0c027c',
-                'nombre_usuario': 'SUR Hannover',
-                'pais': 'Germany',
-                'ciudad': 'Hannover',
-                'tipo': 'HOMOG (S)',
-                'potencia_termica': 0.001,
-                'estado': 'DECOMMISSIONED',
-                'fecha_primera_reaccion': '1971-12-09T00:00:00'
+                'access_token': 'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...',
+                'refresh_token': 'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...',
+                'token_type': 'bearer',
+                'expires_in': 900
               }
             }
 
     """
     success = None
-    data = UsuarioModel()
+    data = None
     status_code = 200
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
-        with UsuarioService(cursor=cursor) as usuario_service:
-            data = usuario_service.usuarios_repository.get_by_id(identificador)
-            if data is None:
-                data = UsuarioModel()
-        message = "Se obtuvo el resultado exitosamente."
-        success = True
+        async with UsuarioService(cursor=cursor) as usuario_service:
+            data = await usuario_service.iniciar_sesion(
+                credenciales.email, credenciales.password
+            )
+        if data is not None:
+            message = "Sesion iniciada exitosamente."
+            success = True
+        else:
+            message = "Email o password incorrectos"
+            success = False
+            status_code = 401
     except Exception:
         log = get_log()
         log.error(traceback.format_exc())
 
-        data = UsuarioModel()
+        data = None
         message = "Error al obtener el resultado"
         success = False
         status_code = 500
     finally:
         response.status_code = status_code
-        print("data: ", data)
-        res = UsuarioCollection(success=success, msg=message, data=data)
+        res = TokensCollection(success=success, msg=message, data=data)
 
     return res
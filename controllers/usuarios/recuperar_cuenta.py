@@ -3,14 +3,15 @@
 
 # External libraries
 import traceback
+from typing import Callable
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Depends, Response
+from pymongo.errors import DuplicateKeyError
 
 # Own libraries
-from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.database import obtener_cursor_mongo
 from helpers.config import get_log
-from models.usuarios_model import (UpdateUsuarioModel, UsuarioCollection,
-                                   UsuarioModel)
+from models.usuarios_model import UpdateUsuarioModel, UsuarioCollection, UsuarioModel
 from services.usuario_service import UsuarioService
 
 recuperar_cuenta_controller = APIRouter(prefix="/usuarios", tags=["usuarios"])
@@ -22,8 +23,11 @@ recuperar_cuenta_controller = APIRouter(prefix="/usuarios", tags=["usuarios"])
     response_model=UsuarioCollection,
     response_model_by_alias=False,
 )
-def recuperar_cuenta(
-    response: Response, identificador: str, usuario: UpdateUsuarioModel
+async def recuperar_cuenta(
+    response: Response,
+    identificador: str,
+    usuario: UpdateUsuarioModel,
+    cursor: Callable = Depends(obtener_cursor_mongo),
 ):
     """Actualiza la informacion correspondiente a un usuario en la base de datos.
 
@@ -54,13 +58,10 @@ def recuperar_cuenta(
     message = None
 
     try:
-        conexion = crear_mongo_conexion()
-        cursor = crear_cursor_mongo(conexion)
-
-        with UsuarioService(cursor=cursor) as usuario_service:
-            data = usuario_service.usuarios_repository.get_by_id(identificador)
+        async with UsuarioService(cursor=cursor) as usuario_service:
+            data = await usuario_service.usuarios_repository.get_by_id(identificador)
             if data is not None:
-                data = usuario_service.inventarios_repository.update(
+                data = await usuario_service.usuarios_repository.update(
                     identificador, usuario
                 )
                 message = "Se obtuvo el resultado exitosamente."
@@ -70,6 +71,11 @@ def recuperar_cuenta(
                 status_code = 404
                 data = UsuarioModel()
                 success = False
+    except DuplicateKeyError:
+        data = UsuarioModel()
+        message = f"Ya existe una cuenta con el email {usuario.email}"
+        success = False
+        status_code = 409
     except Exception:
         log = get_log()
         log.error(traceback.format_exc())
@@ -0,0 +1,86 @@
+"""Modulo con el endpoint para renovar los tokens de sesion de un usuario"""
+
+# External libraries
+import traceback
+from typing import Callable
+
+from fastapi import APIRouter, Depends, Response
+
+# Own libraries
+from contexts.database import obtener_cursor_mongo
+from helpers.config import get_log
+from helpers.seguridad import TokenInvalidoError
+from models.sesiones_model import RefrescarSesionModel, TokensCollection
+from services.usuario_service import UsuarioService
+
+refrescar_sesion_controller = APIRouter(prefix="/usuarios", tags=["usuarios"])
+
+
+@refrescar_sesion_controller.post(
+    "/refrescar-sesion",
+    status_code=200,
+    response_model=TokensCollection,
+)
+async def refrescar_sesion(
+    response: Response,
+    sesion: RefrescarSesionModel,
+    cursor: Callable = Depends(obtener_cursor_mongo),
+):
+    """Emite un nuevo ``access_token`` y ``refresh_token`` a partir del
+    ``refresh_token`` de la sesion.
+
+    Args:
+        response: parametro de entrada para construir la respuesta en el
+            decorador wrapper.
+        sesion: ``refresh_token`` retornado al iniciar sesion.
+
+    Returns:
+        Nuevos tokens de la sesion.
+
+         .. code-block:: python
+
+            {
+              'msg': 'Sesion renovada exitosamente.',
+              'success': true,
+              'data': {
+                'access_token': 'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...',
+                'refresh_token': 'eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...',
+                'token_type': 'bearer',
+                'expires_in': 900
+              }
+            }
+
+    """
+    success = None
+    data = None
+    status_code = 200
+    message = None
+
+    try:
+        async with UsuarioService(cursor=cursor) as usuario_service:
+            data = await usuario_service.refrescar_sesion(sesion.refresh_token)
+        if data is not None:
+            message = "Sesion renovada exitosamente."
+            success = True
+        else:
+            message = "El usuario de la sesion ya no existe"
+            success = False
+            status_code = 401
+    except TokenInvalidoError as error:
+        data = None
+        message = str(error)
+        success = False
+        status_code = 401
+    except Exception:
+        log = get_log()
+        log.error(traceback.format_exc())
+
+        data = None
+        message = "Error al obtener el resultado"
+        success = False
+        status_code = 500
+    finally:
+        response.status_code = status_code
+        res = TokensCollection(success=success, msg=message, data=data)
+
+    return res
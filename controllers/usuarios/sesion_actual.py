@@ -0,0 +1,45 @@
+"""Modulo con el endpoint para consultar el usuario de la sesion actual"""
+
+# External libraries
+from fastapi import APIRouter, Depends
+
+# Own libraries
+from contexts.autenticacion import obtener_sesion
+from models.sesiones_model import SesionCollection, SesionModel
+
+sesion_actual_controller = APIRouter(prefix="/usuarios", tags=["usuarios"])
+
+
+@sesion_actual_controller.get(
+    "/sesion-actual",
+    status_code=200,
+    response_model=SesionCollection,
+)
+async def sesion_actual(sesion: SesionModel = Depends(obtener_sesion)):
+    """Obtener el usuario autenticado con el ``access_token`` de la peticion.
+
+    El token se valida en memoria, no se consulta la base de datos.
+
+    Args:
+        sesion: Usuario autenticado por la dependencia ``obtener_sesion``.
+
+    Returns:
+        Informacion del usuario guardada en el token.
+
+         .. code-block:: python
+
+            {
+              'msg': 'Se obtuvo el resultado exitosamente.',
+              'success': true,
+              'data': {
+                'id_usuario': '662d0d325363bbc93a0c0295',
+                'email': 'emanuelacag@gmail.com',
+                'tipo': 'cliente',
+                'expira': 1729600000
+              }
+            }
+
+    """
+    return SesionCollection(
+        success=True, msg="Se obtuvo el resultado exitosamente.", data=sesion
+    )
@@ -0,0 +1,123 @@
+"""Módulo con el cache en memoria (LRU con expiracion) usado por los repositorios."""
+
+# External libraries
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Hashable, Optional
+
+# Caches creados en el proceso, por nombre, para consultar sus estadisticas.
+CACHES: Dict[str, "CacheLRU"] = {}
+
+# Version de cada coleccion en el proceso, aumenta con cada escritura que hace el
+# api. Se usa en las claves de cache de los resultados calculados a partir de la
+# coleccion.
+VERSIONES: Dict[str, int] = defaultdict(int)
+
+
+def incrementar_version(coleccion: str) -> None:
+    """Registra una escritura en la coleccion y descarta los resultados anteriores.
+
+    Args:
+        coleccion: Nombre de la coleccion modificada.
+    """
+    VERSIONES[coleccion] += 1
+
+
+class CacheLRU:
+    """Cache acotado que descarta el elemento usado hace mas tiempo.
+
+    Cada elemento expira ``ttl`` segundos despues de guardarse. El cache vive en
+    la memoria del proceso, por lo que cada worker del api tiene el suyo.
+    """
+
+    def __init__(self, nombre: str, capacidad: int, ttl: float) -> None:
+        """Crea el cache y lo registra en ``CACHES``.
+
+        Args:
+            nombre: Nombre con el que se reportan las estadisticas.
+            capacidad: Numero maximo de elementos guardados.
+            ttl: Segundos que un elemento permanece valido.
+        """
+        self.nombre = nombre
+        self.capacidad = capacidad
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._elementos: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        CACHES[nombre] = self
+
+    def get(self, clave: Hashable) -> Optional[Any]:
+        """Obtiene un elemento del cache.
+
+        Args:
+            clave: Clave del elemento.
+
+        Returns:
+            Valor guardado, ``None`` si no existe o ya expiro.
+        """
+        elemento = self._elementos.get(clave)
+        if elemento is None or elemento[0] < time.monotonic():
+            if elemento is not None:
+                del self._elementos[clave]
+            self.misses += 1
+            return None
+
+        self._elementos.move_to_end(clave)
+        self.hits += 1
+        return elemento[1]
+
+    def set(self, clave: Hashable, valor: Any) -> None:
+        """Guarda un elemento y descarta el menos usado si se supera la capacidad.
+
+        Args:
+            clave: Clave del elemento.
+            valor: Valor a guardar.
+        """
+        self._elementos[clave] = (time.monotonic() + self.ttl, valor)
+        self._elementos.move_to_end(clave)
+
+        while len(self._elementos) > self.capacidad:
+            self._elementos.popitem(last=False)
+            self.evictions += 1
+
+    def invalidar(self, clave: Hashable) -> None:
+        """Elimina un elemento del cache si existe.
+
+        Args:
+            clave: Clave del elemento.
+        """
+        self._elementos.pop(clave, None)
+
+    def limpiar(self) -> None:
+        """Elimina todos los elementos del cache."""
+        self._elementos.clear()
+
+    def estadisticas(self) -> dict:
+        """Retorna el tamaño y los contadores del cache.
+
+        Returns:
+            Estadisticas del cache
+
+            .. code-block:: python
+
+                {
+                    'nombre': 'productos',
+                    'elementos': 120,
+                    'capacidad': 1000,
+                    'ttl': 60.0,
+                    'hits': 5400,
+                    'misses': 130,
+                    'evictions': 0
+                }
+
+        """
+        return {
+            "nombre": self.nombre,
+            "elementos": len(self._elementos),
+            "capacidad": self.capacidad,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,61 @@
+"""Módulo con funciones de apoyo para las peticiones condicionales (ETag)."""
+
+# External libraries
+import hashlib
+from typing import Any, Optional
+
+import bson
+from bson.codec_options import CodecOptions
+from fastapi import Response
+
+from contexts.database import TIPOS_MONGO
+
+_CODEC_OPTIONS = CodecOptions(type_registry=TIPOS_MONGO)
+
+
+def calcular_etag(*valores: Any) -> str:
+    """Calcula un ETag fuerte a partir del contenido BSON de los valores.
+
+    El hash se calcula sobre los documentos tal como vienen de Mongo, cualquier
+    cambio en un campo retornado produce un ETag diferente.
+
+    Args:
+        valores: Documentos o valores que forman la respuesta.
+
+    Returns:
+        ETag entre comillas listo para el header ``ETag``.
+    """
+    contenido = bson.encode({"valores": list(valores)}, codec_options=_CODEC_OPTIONS)
+    return f'"{hashlib.blake2b(contenido, digest_size=16).hexdigest()}"'
+
+
+def etag_coincide(if_none_match: Optional[str], etag: str) -> bool:
+    """Indica si el ETag actual esta en el header ``If-None-Match`` del cliente.
+
+    Args:
+        if_none_match: Valor del header ``If-None-Match``.
+        etag: ETag actual del recurso.
+
+    Returns:
+        ``True`` si el cliente ya tiene la version actual del recurso.
+    """
+    if if_none_match is None:
+        return False
+
+    etiquetas = [etiqueta.strip() for etiqueta in if_none_match.split(",")]
+    # If-None-Match usa comparacion debil, se ignora el prefijo W/.
+    return "*" in etiquetas or any(
+        etiqueta.removeprefix("W/") == etag for etiqueta in etiquetas
+    )
+
+
+def respuesta_no_modificada(etag: str) -> Response:
+    """Respuesta 304 sin cuerpo para el cliente que ya tiene el recurso.
+
+    Args:
+        etag: ETag actual del recurso.
+
+    Returns:
+        Respuesta con codigo 304 y el header ``ETag``.
+    """
+    return Response(status_code=304, headers={"ETag": etag})
@@ -0,0 +1,48 @@
+"""Módulo con funciones de apoyo para la importación masiva de registros."""
+
+# External libraries
+from typing import Iterator, List, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+Modelo = TypeVar("Modelo", bound=BaseModel)
+
+
+def validar_filas(
+    modelo: Type[Modelo], filas: List[dict]
+) -> Tuple[List[Tuple[int, Modelo]], List[dict]]:
+    """Valida cada fila contra el modelo sin detenerse en la primera invalida.
+
+    Args:
+        modelo: Modelo de pydantic con el que se valida cada fila.
+        filas: Filas recibidas en la petición.
+
+    Returns:
+        Filas validas junto a su posicion original y errores por posicion.
+    """
+    validos = []
+    errores = []
+
+    for indice, fila in enumerate(filas):
+        try:
+            validos.append((indice, modelo.model_validate(fila)))
+        except ValidationError as error:
+            errores.append(
+                {"indice": indice, "error": str(error.errors(include_url=False))}
+            )
+
+    return validos, errores
+
+
+def dividir_en_lotes(elementos: list, tamano: int) -> Iterator[list]:
+    """Divide una lista en lotes consecutivos de un tamaño maximo.
+
+    Args:
+        elementos: Lista a dividir.
+        tamano: Numero maximo de elementos por lote.
+
+    Returns:
+        Iterador con cada lote.
+    """
+    for inicio in range(0, len(elementos), tamano):
+        yield elementos[inicio : inicio + tamano]
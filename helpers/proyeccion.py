@@ -0,0 +1,89 @@
+"""Módulo con funciones de apoyo para consultar solo algunos campos (``fields``)."""
+
+# External libraries
+from typing import Iterable, Optional, Type
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class CampoInvalidoError(ValueError):
+    """Se lanza cuando ``fields`` contiene campos que no tiene el modelo."""
+
+    def __init__(self, campos: list) -> None:
+        self.campos = campos
+        super().__init__(f"Campos invalidos: {', '.join(campos)}")
+
+
+def crear_proyeccion(
+    modelo: Type[BaseModel], fields: Optional[str], ocultos: Iterable[str] = ()
+) -> Optional[dict]:
+    """Convierte el parametro ``fields`` en la proyeccion de Mongo de la consulta.
+
+    Args:
+        modelo: Modelo de pydantic con los campos que se pueden solicitar.
+        fields: Campos separados por coma, ``None`` para consultar todos.
+        ocultos: Campos que nunca se retornan en la respuesta.
+
+    Returns:
+        Proyeccion de Mongo, ``None`` si se deben consultar todos los campos.
+    """
+    ocultos = set(ocultos)
+
+    if fields is None:
+        return {campo: 0 for campo in ocultos} or None
+
+    campos = [campo.strip() for campo in fields.split(",") if campo.strip()]
+    permitidos = set(modelo.model_fields) - ocultos
+    invalidos = [campo for campo in campos if campo not in permitidos]
+    if invalidos:
+        raise CampoInvalidoError(invalidos)
+
+    # El _id siempre se retorna en la proyeccion de Mongo.
+    proyeccion = {campo: 1 for campo in campos if campo != "id"}
+    return proyeccion or {"_id": 1}
+
+
+def proyectar_documento(documento: dict, proyeccion: Optional[dict]) -> dict:
+    """Aplica en memoria una proyeccion de inclusion sobre un documento.
+
+    Args:
+        documento: Documento completo de Mongo.
+        proyeccion: Proyeccion creada con ``crear_proyeccion``, ``None`` para todos.
+
+    Returns:
+        Copia del documento con los campos de la proyeccion y el ``_id``.
+    """
+    if proyeccion is None:
+        return dict(documento)
+    return {
+        campo: valor
+        for campo, valor in documento.items()
+        if campo == "_id" or proyeccion.get(campo)
+    }
+
+
+def respuesta_recortada(respuesta: BaseModel, response: Response) -> JSONResponse:
+    """Serializa la respuesta solo con los campos que retorno la consulta.
+
+    Los campos que no vinieron en la proyeccion quedan sin asignar en el modelo y
+    se omiten del json en lugar de retornarse en ``null``.
+
+    Args:
+        respuesta: Respuesta del endpoint construida con los documentos de Mongo.
+        response: Respuesta de FastAPI con el codigo de estado y los headers.
+
+    Returns:
+        Respuesta json con los campos solicitados.
+    """
+    headers = {
+        clave: valor
+        for clave, valor in response.headers.items()
+        if clave != "content-length"
+    }
+    return JSONResponse(
+        content=respuesta.model_dump(mode="json", exclude_unset=True),
+        status_code=response.status_code,
+        headers=headers,
+    )
@@ -0,0 +1,221 @@
+"""Módulo con el hash de los password y los tokens de sesion (JWT) del api."""
+
+# External libraries
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from typing import Optional, Tuple
+
+# Own libraries
+from properties.settings import Settings
+
+_ENCABEZADO_JWT = {"alg": "HS256", "typ": "JWT"}
+
+
+class TokenInvalidoError(ValueError):
+    """Se lanza cuando un token no tiene formato JWT, su firma no coincide o ya
+    expiro."""
+
+
+def verificar_secreto_jwt() -> None:
+    """Valida que la clave de firma de los tokens este configurada.
+
+    Se llama al iniciar el api; con una clave generada por proceso los tokens
+    emitidos por un worker serian rechazados por los demas y se invalidarian en
+    cada reinicio.
+
+    Raises:
+        RuntimeError: Si la variable de entorno ``JWT_SECRETO`` no esta definida.
+    """
+    if not Settings.jwt_secreto:
+        raise RuntimeError(
+            "La variable de entorno JWT_SECRETO es obligatoria para firmar los "
+            "tokens de sesion"
+        )
+
+
+def _parametros_actuales() -> Tuple[int, int, int]:
+    return (
+        Settings.password_scrypt_n,
+        Settings.password_scrypt_r,
+        Settings.password_scrypt_p,
+    )
+
+
+def _scrypt(password: str, sal: bytes, n: int, r: int, p: int) -> bytes:
+    # scrypt necesita 128 * r * (n + p) bytes, se deja margen sobre el limite
+    # por defecto de 32 MiB para permitir costos mayores.
+    return hashlib.scrypt(
+        password.encode(),
+        salt=sal,
+        n=n,
+        r=r,
+        p=p,
+        maxmem=128 * r * (n + p + 2) + 2**20,
+    )
+
+
+def hashear_password(password: str) -> str:
+    """Calcula el hash scrypt de un password con una sal aleatoria.
+
+    Consume CPU por diseño, desde el api se ejecuta con ``ejecutar_en_proceso``.
+
+    Args:
+        password: Password en texto plano.
+
+    Returns:
+        Hash con el formato ``scrypt$n$r$p$sal$hash`` (sal y hash en base64).
+    """
+    n, r, p = _parametros_actuales()
+    sal = secrets.token_bytes(16)
+    digest = _scrypt(password, sal, n, r, p)
+    return "$".join(
+        [
+            "scrypt",
+            str(n),
+            str(r),
+            str(p),
+            base64.b64encode(sal).decode(),
+            base64.b64encode(digest).decode(),
+        ]
+    )
+
+
+def crear_hash_falso() -> str:
+    """Arma un hash con el formato y los parametros actuales sin calcular scrypt.
+
+    Sirve para verificar un password cuando el usuario no existe: la
+    verificacion cuesta lo mismo que con un hash real y nunca es valida, pero
+    armarlo no consume CPU.
+
+    Returns:
+        Hash con el formato ``scrypt$n$r$p$sal$hash`` y digest aleatorio.
+    """
+    n, r, p = _parametros_actuales()
+    return "$".join(
+        [
+            "scrypt",
+            str(n),
+            str(r),
+            str(p),
+            base64.b64encode(secrets.token_bytes(16)).decode(),
+            base64.b64encode(secrets.token_bytes(64)).decode(),
+        ]
+    )
+
+
+def verificar_password(password: str, guardado: Optional[str]) -> Tuple[bool, bool]:
+    """Compara un password con el hash guardado del usuario.
+
+    Los usuarios creados antes del hash tienen el password en texto plano, se
+    comparan directamente y se indica que el hash se debe actualizar.
+
+    Args:
+        password: Password en texto plano recibido en el inicio de sesion.
+        guardado: Valor de ``password`` guardado en Mongo.
+
+    Returns:
+        Si el password es correcto y si el valor guardado se debe reemplazar por
+        un hash con los parametros actuales.
+    """
+    if not guardado:
+        return False, False
+
+    partes = guardado.split("$")
+    if len(partes) != 6 or partes[0] != "scrypt":
+        valido = hmac.compare_digest(password.encode(), guardado.encode())
+        return valido, valido
+
+    _, n, r, p, sal, digest = partes
+    parametros = (int(n), int(r), int(p))
+    calculado = _scrypt(password, base64.b64decode(sal), *parametros)
+    valido = hmac.compare_digest(calculado, base64.b64decode(digest))
+    return valido, valido and parametros != _parametros_actuales()
+
+
+def _base64url(datos: bytes) -> str:
+    return base64.urlsafe_b64encode(datos).rstrip(b"=").decode()
+
+
+def _desde_base64url(texto: str) -> bytes:
+    return base64.urlsafe_b64decode(texto + "=" * (-len(texto) % 4))
+
+
+def _firmar(contenido: str) -> bytes:
+    verificar_secreto_jwt()
+    return hmac.new(
+        Settings.jwt_secreto.encode(), contenido.encode(), hashlib.sha256
+    ).digest()
+
+
+def crear_token(usuario: dict, tipo_token: str, duracion: int) -> str:
+    """Crea un JWT firmado con HS256 para un usuario.
+
+    Args:
+        usuario: Documento del usuario en Mongo.
+        tipo_token: ``access`` para autenticar peticiones o ``refresh`` para
+            renovar la sesion.
+        duracion: Segundos de validez del token.
+
+    Returns:
+        Token JWT.
+    """
+    ahora = int(time.time())
+    carga = {
+        "sub": str(usuario["_id"]),
+        "email": usuario.get("email"),
+        "tipo": usuario.get("tipo"),
+        "token": tipo_token,
+        "iat": ahora,
+        "exp": ahora + duracion,
+        "jti": secrets.token_hex(8),
+    }
+    contenido = ".".join(
+        _base64url(json.dumps(parte, separators=(",", ":")).encode())
+        for parte in (_ENCABEZADO_JWT, carga)
+    )
+    return f"{contenido}.{_base64url(_firmar(contenido))}"
+
+
+def decodificar_token(token: str, tipo_token: str) -> dict:
+    """Valida la firma, la expiracion y el tipo de un JWT sin consultar Mongo.
+
+    Args:
+        token: Token JWT recibido.
+        tipo_token: Tipo que debe tener el token, ``access`` o ``refresh``.
+
+    Returns:
+        Carga del token.
+
+    Raises:
+        TokenInvalidoError: Si el token no es valido para ``tipo_token``.
+    """
+    partes = token.split(".")
+    if len(partes) != 3:
+        raise TokenInvalidoError("Token con formato invalido")
+
+    encabezado, carga, firma = partes
+    try:
+        # Se comparan bytes, con texto compare_digest falla si no es ASCII.
+        firma_valida = hmac.compare_digest(
+            firma.encode(), _base64url(_firmar(f"{encabezado}.{carga}")).encode()
+        )
+        algoritmo = json.loads(_desde_base64url(encabezado)).get("alg")
+        carga = json.loads(_desde_base64url(carga))
+    except (ValueError, binascii.Error) as error:
+        raise TokenInvalidoError("Token con formato invalido") from error
+
+    if not firma_valida:
+        raise TokenInvalidoError("Firma del token invalida")
+
+    if algoritmo != "HS256":
+        raise TokenInvalidoError("Algoritmo del token no soportado")
+    if carga.get("token") != tipo_token:
+        raise TokenInvalidoError("Tipo de token invalido")
+    if carga.get("exp", 0) <= time.time():
+        raise TokenInvalidoError("Token expirado")
+    return carga
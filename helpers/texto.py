@@ -0,0 +1,37 @@
+"""Módulo con funciones de apoyo para comparar textos sin tildes ni mayusculas."""
+
+# External libraries
+import unicodedata
+from typing import Any
+
+_VIRGULILLA = "\u0303"
+
+
+def normalizar_texto(valor: Any) -> str:
+    """Convierte un texto a minusculas y sin tildes para buscarlo por prefijo.
+
+    ``"Lécithine"`` y ``"LECHE"`` quedan como ``"lecithine"`` y ``"leche"``, de
+    esta forma la busqueda ``"lec"`` encuentra ambos con el mismo indice. Como en
+    la colacion en español la ``ñ`` es una letra y no una ``n`` con tilde, se
+    conserva:
+
+    >>> normalizar_texto("Año") == normalizar_texto("año") != normalizar_texto("ano")
+    True
+
+    Args:
+        valor: Texto a normalizar, los numeros se convierten a texto.
+
+    Returns:
+        Texto normalizado, vacio si ``valor`` es ``None``.
+    """
+    if valor is None:
+        return ""
+    descompuesto = unicodedata.normalize("NFKD", str(valor).casefold())
+    caracteres = []
+    for caracter in descompuesto:
+        # La virgulilla (U+0303) despues de una n es la ñ, no una tilde.
+        es_enie = caracter == _VIRGULILLA and caracteres and caracteres[-1] == "n"
+        if unicodedata.combining(caracter) and not es_enie:
+            continue
+        caracteres.append(caracter)
+    return unicodedata.normalize("NFC", "".join(caracteres)).strip()
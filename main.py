@@ -2,12 +2,34 @@
 
 # External libraries
 import os
+from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI(title="Api MiniMarket", version="1.0.0")
+# Own libraries
+from contexts.database import cerrar_pool_mongo, obtener_cursor_mongo
+from contexts.indices import asegurar_indices
+from contexts.procesos import cerrar_pool_procesos
+from helpers.seguridad import verificar_secreto_jwt
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """Valida la configuracion, abre el pool de conexiones a Mongo y asegura los
+    indices al iniciar, y cierra los pools de Mongo y de procesos al apagar."""
+    verificar_secreto_jwt()
+    cursor = obtener_cursor_mongo()
+    try:
+        await asegurar_indices(cursor())
+        yield
+    finally:
+        cerrar_pool_mongo()
+        cerrar_pool_procesos()
+
+
+app = FastAPI(title="Api MiniMarket", version="1.0.0", lifespan=lifespan)
 
 origins = ["*"]
 
@@ -0,0 +1,85 @@
+"""Modulo con las funciones comunes para las migraciones de datos en Mongo."""
+
+# External libraries
+import argparse
+from typing import Awaitable, Callable, List
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
+
+# Own libraries
+from helpers.config import get_log
+
+ConvertirLote = Callable[[List[dict]], Awaitable[List[UpdateOne]]]
+
+
+async def migrar_por_lotes(
+    coleccion: AsyncIOMotorCollection,
+    filtro: dict,
+    convertir_lote: ConvertirLote,
+    batch_size: int,
+    proyeccion: dict = None,
+) -> int:
+    """Recorre por ``_id`` los documentos pendientes y los actualiza por lotes.
+
+    El filtro debe seleccionar solo los documentos que aun no se han migrado, de
+    esta forma si la migracion se interrumpe basta con volver a ejecutarla para
+    continuar donde quedo.
+
+    Args:
+        coleccion: Coleccion a migrar.
+        filtro: Filtro que selecciona los documentos pendientes de migrar.
+        convertir_lote: Funcion que recibe un lote de documentos y retorna las
+            operaciones ``UpdateOne`` a ejecutar.
+        batch_size: Numero de documentos por lote.
+        proyeccion: Campos a leer de cada documento, todos si es ``None``.
+
+    Returns:
+        Numero de documentos modificados.
+    """
+    log = get_log()
+    modificados = 0
+    ultimo_id = None
+
+    while True:
+        filtro_lote = dict(filtro)
+        if ultimo_id is not None:
+            filtro_lote["_id"] = {"$gt": ultimo_id}
+
+        lote = (
+            await coleccion.find(filtro_lote, proyeccion)
+            .sort("_id", 1)
+            .limit(batch_size)
+            .to_list(length=batch_size)
+        )
+        if not lote:
+            break
+
+        operaciones = await convertir_lote(lote)
+        if operaciones:
+            resultado = await coleccion.bulk_write(operaciones, ordered=False)
+            modificados += resultado.modified_count
+
+        ultimo_id = lote[-1]["_id"]
+        log.info("%s: %s documentos migrados", coleccion.name, modificados)
+
+    return modificados
+
+
+def crear_parser(descripcion: str) -> argparse.ArgumentParser:
+    """Crea el parser de argumentos comun a los comandos de migracion.
+
+    Args:
+        descripcion: Descripcion del comando.
+
+    Returns:
+        Parser con el argumento ``--batch-size``.
+    """
+    parser = argparse.ArgumentParser(description=descripcion)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Numero de documentos que se actualizan en cada bulk_write.",
+    )
+    return parser
@@ -0,0 +1,95 @@
+"""Migracion que reemplaza el indice ``usuarios.email_unico`` por uno que no
+distingue mayusculas.
+
+Mongo no permite cambiar la colacion de un indice existente, por lo que al
+iniciar el api se registra un error y se mantiene el indice anterior. Esta
+migracion verifica que no existan emails repetidos sin distinguir mayusculas,
+elimina el indice anterior y crea el del registro de indices. Si encuentra
+emails repetidos los reporta y no modifica el indice::
+
+    python -m migraciones.email_unico
+"""
+
+# External libraries
+import argparse
+import asyncio
+import logging
+from typing import List
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+# Own libraries
+from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from contexts.indices import COLACION_EMAIL, INDICES
+from helpers.config import get_log
+
+
+async def emails_repetidos(mongo_db: AsyncIOMotorDatabase) -> List[dict]:
+    """Busca los emails registrados mas de una vez sin distinguir mayusculas.
+
+    Args:
+        mongo_db: Base de datos con los usuarios.
+
+    Returns:
+        Email repetido y ``_id`` de los usuarios que lo tienen.
+    """
+    pipeline = [
+        {"$match": {"email": {"$type": "string"}}},
+        {"$group": {"_id": "$email", "usuarios": {"$push": "$_id"}}},
+        {"$match": {"usuarios.1": {"$exists": True}}},
+    ]
+    # El $group usa la colacion del email, agrupa los que solo cambian en
+    # mayusculas.
+    return await mongo_db.usuarios.aggregate(
+        pipeline, collation=COLACION_EMAIL
+    ).to_list(length=None)
+
+
+async def migrar(mongo_db: AsyncIOMotorDatabase) -> None:
+    """Reemplaza el indice ``email_unico`` si su colacion no es la del registro.
+
+    Args:
+        mongo_db: Base de datos a migrar.
+    """
+    log = get_log()
+
+    existentes = await mongo_db.usuarios.index_information()
+    colacion = existentes.get("email_unico", {}).get("collation", {})
+    esperada = COLACION_EMAIL.document
+    if "email_unico" in existentes and all(
+        colacion.get(clave) == valor for clave, valor in esperada.items()
+    ):
+        log.info("usuarios.email_unico ya no distingue mayusculas")
+        return
+
+    repetidos = await emails_repetidos(mongo_db)
+    if repetidos:
+        for repetido in repetidos:
+            usuarios = ", ".join(str(usuario) for usuario in repetido["usuarios"])
+            log.error("Email repetido %r en usuarios: %s", repetido["_id"], usuarios)
+        log.error(
+            "usuarios.email_unico: %s emails repetidos, se deben corregir antes "
+            "de crear el indice",
+            len(repetidos),
+        )
+        return
+
+    if "email_unico" in existentes:
+        await mongo_db.usuarios.drop_index("email_unico")
+    await mongo_db.usuarios.create_indexes(INDICES["usuarios"])
+    log.info("usuarios.email_unico: indice creado sin distinguir mayusculas")
+
+
+async def main() -> None:
+    """Abre la conexion con Mongo y ejecuta la migracion."""
+    cliente = crear_mongo_conexion()
+    try:
+        await migrar(crear_cursor_mongo(cliente)())
+    finally:
+        cliente.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    argparse.ArgumentParser(description=__doc__.splitlines()[0]).parse_args()
+    asyncio.run(main())
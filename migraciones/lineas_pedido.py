@@ -0,0 +1,123 @@
+"""Migracion que convierte ``pedidos.productos`` de texto a lineas del pedido.
+
+Cada pedido con ``productos`` como ids separados por coma pasa a tener una lista
+de ``{id_producto, cantidad, precio_unitario}``, tomando el precio actual de cada
+producto. Se puede ejecutar varias veces, solo procesa los pedidos que aun
+tienen ``productos`` como texto::
+
+    python -m migraciones.lineas_pedido --batch-size 500
+"""
+
+# External libraries
+import asyncio
+import logging
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from bson.decimal128 import Decimal128
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+# Own libraries
+from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from helpers.config import get_log
+from migraciones.base_migracion import crear_parser, migrar_por_lotes
+from models.pedidos_model import convertir_productos_legado
+
+
+def convertir_precio(precio: Any) -> Optional[Decimal128]:
+    """Convierte el precio de un producto a Decimal128, ``None`` si no es valido."""
+    if precio is None or isinstance(precio, Decimal128):
+        return precio
+    try:
+        return Decimal128(Decimal(str(precio).strip()))
+    except InvalidOperation:
+        return None
+
+
+def crear_convertidor(mongo_db: AsyncIOMotorDatabase):
+    """Crea la funcion que arma las lineas de los pedidos de un lote.
+
+    Args:
+        mongo_db: Base de datos de donde se leen los precios de los productos.
+
+    Returns:
+        Funcion asincrona que recibe el lote y retorna las operaciones.
+    """
+
+    async def convertir_lote(lote: List[dict]) -> List[UpdateOne]:
+        lineas_por_pedido = {
+            pedido["_id"]: convertir_productos_legado(pedido["productos"])
+            for pedido in lote
+        }
+
+        # Una sola consulta con $in trae los precios de todos los productos
+        # del lote.
+        identificadores = {
+            ObjectId(linea["id_producto"])
+            for lineas in lineas_por_pedido.values()
+            for linea in lineas
+            if ObjectId.is_valid(linea["id_producto"])
+        }
+        precios: Dict[str, Any] = {
+            str(producto["_id"]): producto.get("precio")
+            async for producto in mongo_db.productos.find(
+                {"_id": {"$in": list(identificadores)}}, {"precio": 1}
+            )
+        }
+
+        operaciones = []
+        for pedido in lote:
+            lineas = [
+                {
+                    **linea,
+                    "precio_unitario": convertir_precio(
+                        precios.get(linea["id_producto"])
+                    ),
+                }
+                for linea in lineas_por_pedido[pedido["_id"]]
+            ]
+            # Se filtra tambien por el valor leido para no pisar cambios hechos
+            # mientras corre la migracion.
+            operaciones.append(
+                UpdateOne(
+                    {"_id": pedido["_id"], "productos": pedido["productos"]},
+                    {"$set": {"productos": lineas}},
+                )
+            )
+        return operaciones
+
+    return convertir_lote
+
+
+async def migrar(mongo_db: AsyncIOMotorDatabase, batch_size: int) -> None:
+    """Ejecuta la conversion de los productos de todos los pedidos.
+
+    Args:
+        mongo_db: Base de datos a migrar.
+        batch_size: Numero de pedidos por lote.
+    """
+    modificados = await migrar_por_lotes(
+        mongo_db.pedidos,
+        {"productos": {"$type": "string"}},
+        crear_convertidor(mongo_db),
+        batch_size,
+        proyeccion={"productos": 1},
+    )
+    get_log().info("pedidos.productos: %s documentos convertidos", modificados)
+
+
+async def main(batch_size: int) -> None:
+    """Abre la conexion con Mongo y ejecuta la migracion."""
+    cliente = crear_mongo_conexion()
+    try:
+        await migrar(crear_cursor_mongo(cliente)(), batch_size)
+    finally:
+        cliente.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    argumentos = crear_parser(__doc__.splitlines()[0]).parse_args()
+    asyncio.run(main(argumentos.batch_size))
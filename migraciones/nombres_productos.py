@@ -0,0 +1,77 @@
+"""Migracion que agrega ``productos.nombre_normalizado`` para la busqueda por nombre.
+
+Guarda el nombre de cada producto en minusculas y sin tildes, el campo que usa el
+endpoint ``buscar-productos`` con el indice ``nombre_normalizado``. Se puede
+ejecutar varias veces, solo procesa los productos que aun no tienen el campo o
+cuyo nombre tiene una ``ñ`` que se guardo como ``n``::
+
+    python -m migraciones.nombres_productos --batch-size 500
+"""
+
+# External libraries
+import asyncio
+import logging
+from typing import List
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+# Own libraries
+from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from helpers.config import get_log
+from helpers.texto import normalizar_texto
+from migraciones.base_migracion import crear_parser, migrar_por_lotes
+
+
+async def convertir_lote(lote: List[dict]) -> List[UpdateOne]:
+    """Arma las actualizaciones con el nombre normalizado de un lote de productos."""
+    # Se filtra tambien por el nombre leido para no pisar cambios hechos
+    # mientras corre la migracion.
+    return [
+        UpdateOne(
+            {"_id": producto["_id"], "nombre": producto.get("nombre")},
+            {"$set": {"nombre_normalizado": normalizar_texto(producto.get("nombre"))}},
+        )
+        for producto in lote
+    ]
+
+
+async def migrar(mongo_db: AsyncIOMotorDatabase, batch_size: int) -> None:
+    """Ejecuta la normalizacion del nombre de todos los productos.
+
+    Args:
+        mongo_db: Base de datos a migrar.
+        batch_size: Numero de productos por lote.
+    """
+    modificados = await migrar_por_lotes(
+        mongo_db.productos,
+        {
+            "$or": [
+                {"nombre_normalizado": {"$exists": False}},
+                # Nombres normalizados cuando la ñ se convertia en n.
+                {
+                    "nombre": {"$regex": "[ñÑ]"},
+                    "nombre_normalizado": {"$not": {"$regex": "ñ"}},
+                },
+            ]
+        },
+        convertir_lote,
+        batch_size,
+        proyeccion={"nombre": 1},
+    )
+    get_log().info("productos.nombre_normalizado: %s documentos migrados", modificados)
+
+
+async def main(batch_size: int) -> None:
+    """Abre la conexion con Mongo y ejecuta la migracion."""
+    cliente = crear_mongo_conexion()
+    try:
+        await migrar(crear_cursor_mongo(cliente)(), batch_size)
+    finally:
+        cliente.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    argumentos = crear_parser(__doc__.splitlines()[0]).parse_args()
+    asyncio.run(main(argumentos.batch_size))
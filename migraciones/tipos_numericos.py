@@ -0,0 +1,114 @@
+"""Migracion que convierte a numeros las cantidades y precios guardados como texto.
+
+Convierte ``inventarios.cantidad_disponibles`` a entero y ``productos.precio`` y
+``pedidos.precio_total`` a ``Decimal128``. Se puede ejecutar varias veces, solo
+procesa los documentos que aun tienen el campo como texto::
+
+    python -m migraciones.tipos_numericos --batch-size 500
+"""
+
+# External libraries
+import asyncio
+import logging
+from decimal import Decimal, InvalidOperation
+from typing import Callable, List
+
+from bson.decimal128 import Decimal128
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+# Own libraries
+from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from helpers.config import get_log
+from migraciones.base_migracion import crear_parser, migrar_por_lotes
+
+
+def convertir_entero(texto: str) -> int:
+    """Convierte un texto numerico a entero, falla si tiene parte decimal."""
+    numero = Decimal(texto)
+    if numero != numero.to_integral_value():
+        raise ValueError(f"{texto} no es un entero")
+    return int(numero)
+
+
+def convertir_decimal(texto: str) -> Decimal128:
+    """Convierte un texto numerico a Decimal128."""
+    return Decimal128(Decimal(texto))
+
+
+# Campos numericos guardados como texto y la funcion que los convierte.
+CAMPOS = [
+    ("inventarios", "cantidad_disponibles", convertir_entero),
+    ("productos", "precio", convertir_decimal),
+    ("pedidos", "precio_total", convertir_decimal),
+]
+
+
+def crear_convertidor(campo: str, convertir: Callable):
+    """Crea la funcion que arma las actualizaciones de un lote para un campo.
+
+    Args:
+        campo: Campo a convertir.
+        convertir: Funcion que convierte el texto al nuevo tipo.
+
+    Returns:
+        Funcion asincrona que recibe el lote y retorna las operaciones.
+    """
+    log = get_log()
+
+    async def convertir_lote(lote: List[dict]) -> List[UpdateOne]:
+        operaciones = []
+        for documento in lote:
+            texto = documento[campo].strip()
+            try:
+                valor = convertir(texto) if texto else None
+            except (InvalidOperation, ValueError):
+                log.warning("%s invalido en %s: %r", campo, documento["_id"], texto)
+                continue
+
+            # Se filtra tambien por el valor leido para no pisar cambios hechos
+            # mientras corre la migracion.
+            operaciones.append(
+                UpdateOne(
+                    {"_id": documento["_id"], campo: documento[campo]},
+                    {"$set": {campo: valor}},
+                )
+            )
+        return operaciones
+
+    return convertir_lote
+
+
+async def migrar(mongo_db: AsyncIOMotorDatabase, batch_size: int) -> None:
+    """Ejecuta la conversion de todos los campos numericos.
+
+    Args:
+        mongo_db: Base de datos a migrar.
+        batch_size: Numero de documentos por lote.
+    """
+    log = get_log()
+
+    for coleccion, campo, convertir in CAMPOS:
+        modificados = await migrar_por_lotes(
+            mongo_db[coleccion],
+            {campo: {"$type": "string"}},
+            crear_convertidor(campo, convertir),
+            batch_size,
+            proyeccion={campo: 1},
+        )
+        log.info("%s.%s: %s documentos convertidos", coleccion, campo, modificados)
+
+
+async def main(batch_size: int) -> None:
+    """Abre la conexion con Mongo y ejecuta la migracion."""
+    cliente = crear_mongo_conexion()
+    try:
+        await migrar(crear_cursor_mongo(cliente)(), batch_size)
+    finally:
+        cliente.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    argumentos = crear_parser(__doc__.splitlines()[0]).parse_args()
+    asyncio.run(main(argumentos.batch_size))
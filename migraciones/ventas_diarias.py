@@ -0,0 +1,113 @@
+"""Migracion que reconstruye el resumen ``ventas_diarias`` a partir de los pedidos.
+
+Recorre todos los pedidos por lotes, suma su venta por tienda y dia con la misma
+regla que usa el api al crear, modificar o eliminar un pedido y reemplaza los
+registros del resumen. Los registros de dias sin pedidos se eliminan. Se puede
+ejecutar varias veces; conviene hacerlo con poco trafico porque los pedidos que
+cambien mientras corre pueden quedar por fuera del resumen::
+
+    python -m migraciones.ventas_diarias --batch-size 500
+"""
+
+# External libraries
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import DeleteMany, ReplaceOne
+
+# Own libraries
+from contexts.database import crear_cursor_mongo, crear_mongo_conexion
+from helpers.config import get_log
+from migraciones.base_migracion import crear_parser
+from repositories.venta_diaria_repositorie import calcular_venta
+
+
+async def calcular_resumen(
+    mongo_db: AsyncIOMotorDatabase, batch_size: int
+) -> Dict[Tuple[str, str], dict]:
+    """Suma la venta de todos los pedidos por tienda y dia.
+
+    Args:
+        mongo_db: Base de datos con los pedidos.
+        batch_size: Numero de pedidos que se traen de Mongo por lote.
+
+    Returns:
+        Valores del resumen por ``(id_tienda, dia)``.
+    """
+    resumen: Dict[Tuple[str, str], dict] = defaultdict(dict)
+    pedidos = mongo_db.pedidos.find(
+        {}, {"id_tienda": 1, "fecha_creacion": 1, "precio_total": 1, "productos": 1}
+    ).batch_size(batch_size)
+
+    async for pedido in pedidos:
+        venta = calcular_venta(pedido)
+        if venta is None:
+            continue
+        clave, valores = venta
+        acumulado = resumen[(clave["id_tienda"], clave["dia"])]
+        for campo, valor in valores.items():
+            acumulado[campo] = acumulado.get(campo, 0) + valor
+
+    return resumen
+
+
+async def migrar(mongo_db: AsyncIOMotorDatabase, batch_size: int) -> None:
+    """Reemplaza el resumen ``ventas_diarias`` por el calculado de los pedidos.
+
+    Args:
+        mongo_db: Base de datos a migrar.
+        batch_size: Numero de documentos por lote.
+    """
+    log = get_log()
+    resumen = await calcular_resumen(mongo_db, batch_size)
+
+    operaciones = [
+        ReplaceOne(
+            {"id_tienda": id_tienda, "dia": dia},
+            {"id_tienda": id_tienda, "dia": dia, **valores},
+            upsert=True,
+        )
+        for (id_tienda, dia), valores in resumen.items()
+    ]
+
+    # Registros del resumen cuya tienda y dia ya no tienen pedidos.
+    sobrantes = [
+        documento["_id"]
+        async for documento in mongo_db.ventas_diarias.find(
+            {}, {"id_tienda": 1, "dia": 1}
+        )
+        if (documento.get("id_tienda"), documento.get("dia")) not in resumen
+    ]
+    for inicio in range(0, len(sobrantes), batch_size):
+        operaciones.append(
+            DeleteMany({"_id": {"$in": sobrantes[inicio : inicio + batch_size]}})
+        )
+
+    for inicio in range(0, len(operaciones), batch_size):
+        await mongo_db.ventas_diarias.bulk_write(
+            operaciones[inicio : inicio + batch_size], ordered=False
+        )
+
+    log.info(
+        "ventas_diarias: %s registros reconstruidos, %s eliminados",
+        len(resumen),
+        len(sobrantes),
+    )
+
+
+async def main(batch_size: int) -> None:
+    """Abre la conexion con Mongo y ejecuta la migracion."""
+    cliente = crear_mongo_conexion()
+    try:
+        await migrar(crear_cursor_mongo(cliente)(), batch_size)
+    finally:
+        cliente.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    argumentos = crear_parser(__doc__.splitlines()[0]).parse_args()
+    asyncio.run(main(argumentos.batch_size))
@@ -1,7 +1,44 @@
 """Modulo con los modelos de la base de datos"""
 
 # External libraries
+from decimal import Decimal
+from typing import Any, Optional
+
+from bson.decimal128 import Decimal128
 from pydantic import BaseModel
+from pydantic.functional_validators import BeforeValidator
+from typing_extensions import Annotated
+
+
+def convertir_numero_legado(valor: Any) -> Any:
+    """Normaliza los valores numericos que se guardaban como texto.
+
+    Los registros antiguos guardan cantidades y precios como ``str``; los textos
+    vacios se tratan como ``None`` y los ``Decimal128`` de Mongo se convierten a
+    ``Decimal`` para que pydantic los valide.
+
+    Args:
+        valor: Valor recibido en la petición o leido de Mongo.
+
+    Returns:
+        Valor listo para ser validado como numero.
+    """
+    if isinstance(valor, Decimal128):
+        return valor.to_decimal()
+    if isinstance(valor, str):
+        valor = valor.strip()
+        return valor or None
+    return valor
+
+
+# Cantidad entera, acepta los textos numericos de los registros antiguos.
+Cantidad = Annotated[Optional[int], BeforeValidator(convertir_numero_legado)]
+
+# Cantidad entera obligatoria, rechaza ``null`` y los textos vacios.
+CantidadRequerida = Annotated[int, BeforeValidator(convertir_numero_legado)]
+
+# Valor monetario que se guarda en Mongo como Decimal128.
+Dinero = Annotated[Optional[Decimal], BeforeValidator(convertir_numero_legado)]
 
 
 class RespuestaEstandar(BaseModel):
@@ -0,0 +1,52 @@
+"""Modulo con los modelos de la base de datos"""
+
+# External libraries
+from typing import List
+
+from pydantic import BaseModel, ConfigDict
+
+from models.base_model import RespuestaEstandar
+
+
+class CacheModel(BaseModel):
+
+    nombre: str
+    """Nombre del cache."""
+
+    elementos: int = 0
+    """Numero de elementos guardados actualmente."""
+
+    capacidad: int = 0
+    """Numero maximo de elementos que se pueden guardar."""
+
+    ttl: float = 0
+    """Segundos que un elemento permanece valido."""
+
+    hits: int = 0
+    """Consultas resueltas desde el cache."""
+
+    misses: int = 0
+    """Consultas que no estaban en el cache o ya habian expirado."""
+
+    evictions: int = 0
+    """Elementos descartados por superar la capacidad."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "nombre": "productos",
+                "elementos": 120,
+                "capacidad": 1000,
+                "ttl": 60.0,
+                "hits": 5400,
+                "misses": 130,
+                "evictions": 0,
+            }
+        },
+    )
+
+
+class CachesCollection(RespuestaEstandar):
+
+    data: List[CacheModel] | None = None
+    """Contiene la información generada por los endpoints."""
@@ -0,0 +1,39 @@
+"""Modulo con los modelos de la base de datos"""
+
+# External libraries
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from models.base_model import RespuestaEstandar
+
+
+class ErrorImportacionModel(BaseModel):
+
+    indice: int
+    """Posicion de la fila en la petición."""
+
+    error: str
+    """Motivo por el que la fila no se importo."""
+
+
+class ImportacionModel(BaseModel):
+
+    insertados: int = 0
+    """Numero de filas insertadas."""
+
+    fallidos: int = 0
+    """Numero de filas que no se insertaron."""
+
+    ids: List[Optional[str]] = []
+    """Identificador de cada fila en el mismo orden de la petición, ``None`` en
+    las filas que no se importaron."""
+
+    errores: List[ErrorImportacionModel] = []
+    """Errores de validacion o escritura por fila."""
+
+
+class ImportacionCollection(RespuestaEstandar):
+
+    data: ImportacionModel | None = None
+    """Contiene la información generada por los endpoints."""
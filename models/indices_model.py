@@ -0,0 +1,44 @@
+"""Modulo con los modelos de la base de datos"""
+
+# External libraries
+from typing import Dict, List
+
+from pydantic import BaseModel, ConfigDict
+
+from models.base_model import RespuestaEstandar
+
+
+class IndiceModel(BaseModel):
+
+    coleccion: str
+    """Coleccion de Mongo a la que pertenece el indice."""
+
+    nombre: str
+    """Nombre del indice en Mongo."""
+
+    claves: Dict[str, int]
+    """Campos del indice y su orden (1 ascendente, -1 descendente)."""
+
+    unico: bool = False
+    """Indica si el indice obliga valores unicos."""
+
+    existe: bool = False
+    """Indica si el indice ya esta creado en Mongo."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "coleccion": "usuarios",
+                "nombre": "email_unico",
+                "claves": {"email": 1},
+                "unico": True,
+                "existe": True,
+            }
+        },
+    )
+
+
+class IndicesCollection(RespuestaEstandar):
+
+    data: List[IndiceModel] | None = None
+    """Contiene la información generada por los endpoints."""
@@ -8,7 +8,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from pydantic.functional_validators import BeforeValidator
 from typing_extensions import Annotated
 
-from models.base_model import RespuestaEstandar
+from models.base_model import Cantidad, Dinero, RespuestaEstandar
 
 # Representa un campo ObjectId en la base de datos.
 # Se representará como una `str` en el modelo para que pueda serializarse en JSON.
@@ -26,7 +26,7 @@ class InventarioModel(BaseModel):
     id_tienda: str = None
     """Contiene la información generada por los endpoints."""
 
-    cantidad_disponibles: str = None
+    cantidad_disponibles: Cantidad = None
     """Contiene la información generada por los endpoints."""
 
     fecha_creacion: str = None
@@ -43,7 +43,7 @@ class InventarioModel(BaseModel):
                 "id": "662d0d325363bbc93a0c0295",
                 "id_producto": "662d0d325363bbc93a0c0295",
                 "id_tienda": "662d0d325363bbc93a0c0295",
-                "cantidad_disponibles": "700",
+                "cantidad_disponibles": 700,
                 "fecha_creacion": "2024-10-22T00:00:00",
                 "fecha_actualizacion": "2024-10-22T00:00:00",
             }
@@ -59,7 +59,7 @@ class UpdateInventarioModel(BaseModel):
     id_tienda: str = None
     """Contiene la información generada por los endpoints."""
 
-    cantidad_disponibles: str = None
+    cantidad_disponibles: Cantidad = None
     """Contiene la información generada por los endpoints."""
 
     fecha_actualizacion: str = None
@@ -75,8 +75,52 @@ class InventariosCollection(RespuestaEstandar):
     data: List[InventarioModel] | None = None
     """Contiene la información generada por los endpoints."""
 
+    next_cursor: Optional[str] = None
+    """Cursor para solicitar la pagina siguiente, ``None`` si no hay mas registros."""
+
 
 class InventarioCollection(RespuestaEstandar):
 
     data: InventarioModel = {}
     """Contiene la información generada por los endpoints."""
+
+
+class InventariosIdentificadoresCollection(RespuestaEstandar):
+
+    data: List[InventarioModel] | None = None
+    """Contiene la información generada por los endpoints."""
+
+    faltantes: List[str] = []
+    """Identificadores solicitados que no existen en la coleccion."""
+
+
+class ValoracionInventarioModel(BaseModel):
+
+    grupo: Optional[str] = None
+    """Tienda, tipo o sub tipo del grupo, ``None`` si el producto no lo tiene."""
+
+    unidades: Cantidad = 0
+    """Suma de ``cantidad_disponibles`` de los inventarios del grupo."""
+
+    valor: Dinero = None
+    """Suma de ``cantidad_disponibles`` por ``precio`` del producto."""
+
+    inventarios: int = 0
+    """Numero de inventarios del grupo."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "grupo": "Lacteo",
+                "unidades": 340,
+                "valor": "1870000",
+                "inventarios": 12,
+            }
+        },
+    )
+
+
+class ValoracionInventarioCollection(RespuestaEstandar):
+
+    data: List[ValoracionInventarioModel] | None = None
+    """Contiene la información generada por los endpoints."""
@@ -1,20 +1,68 @@
 """Modulo con los modelos de la base de datos"""
 
 # External libraries
-from typing import List, Optional
+from collections import Counter
+from typing import Any, List, Optional
 
 from bson import ObjectId
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.functional_validators import BeforeValidator
 from typing_extensions import Annotated
 
-from models.base_model import RespuestaEstandar
+from models.base_model import CantidadRequerida, Dinero, RespuestaEstandar
+from models.productos_model import ProductoModel
+from models.tiendas_model import TiendaModel
+from models.usuarios_model import ClienteModel
 
 # Representa un campo ObjectId en la base de datos.
 # Se representará como una `str` en el modelo para que pueda serializarse en JSON.
 PyObjectId = Annotated[str, BeforeValidator(str)]
 
 
+def convertir_productos_legado(valor: Any) -> Any:
+    """Convierte el texto de ids separados por coma a lineas del pedido.
+
+    Los pedidos antiguos guardan ``productos`` como ``"id1,id2,id1"``; cada id
+    repetido suma una unidad a la cantidad de su linea y el precio unitario
+    queda sin definir.
+
+    Args:
+        valor: Valor de ``productos`` recibido en la petición o leido de Mongo.
+
+    Returns:
+        Lista de lineas del pedido.
+    """
+    if isinstance(valor, str):
+        cantidades = Counter(
+            identificador.strip()
+            for identificador in valor.split(",")
+            if identificador.strip()
+        )
+        return [
+            {"id_producto": identificador, "cantidad": cantidad}
+            for identificador, cantidad in cantidades.items()
+        ]
+    return valor
+
+
+class LineaPedidoModel(BaseModel):
+
+    id_producto: str
+    """Identificador del producto vendido."""
+
+    cantidad: CantidadRequerida = Field(default=1, ge=1)
+    """Unidades del producto en el pedido, una si no se envia. No admite ``null``,
+    una linea sin cantidad no reservaria stock."""
+
+    precio_unitario: Dinero = None
+    """Precio del producto al momento de crear el pedido."""
+
+
+LineasPedido = Annotated[
+    Optional[List[LineaPedidoModel]], BeforeValidator(convertir_productos_legado)
+]
+
+
 class PedidoModel(BaseModel):
 
     id: Optional[PyObjectId] = Field(alias="_id", default=None)
@@ -26,10 +74,10 @@ class PedidoModel(BaseModel):
     id_cliente: str = None
     """Contiene la información generada por los endpoints."""
 
-    productos: str = None
+    productos: LineasPedido = None
     """Contiene la información generada por los endpoints."""
 
-    precio_total: str = None
+    precio_total: Dinero = None
     """Contiene la información generada por los endpoints."""
 
     direccion: str = None
@@ -52,7 +100,13 @@ class PedidoModel(BaseModel):
                 "id": "662d0d325363bbc93a0c0295",
                 "id_tienda": "662d0d325363bbc93a0c0295",
                 "id_cliente": "662d0d325363bbc93a0c0295",
-                "productos": "662d0d325363bbc93a0c0295,662d0d325363bbc93a0c0295",
+                "productos": [
+                    {
+                        "id_producto": "662d0d325363bbc93a0c0295",
+                        "cantidad": 2,
+                        "precio_unitario": "350",
+                    }
+                ],
                 "precio_total": "700",
                 "direccion": "UNDER DECOMMISSIONING",
                 "fecha_entrega": "1966-04-28T00:00:00",
@@ -63,6 +117,24 @@ class PedidoModel(BaseModel):
     )
 
 
+class LineaPedidoDetalleModel(LineaPedidoModel):
+
+    producto: Optional[ProductoModel] = None
+    """Informacion del producto, ``None`` si ya no existe."""
+
+
+class PedidoDetalleModel(PedidoModel):
+
+    productos: Optional[List[LineaPedidoDetalleModel]] = None
+    """Lineas del pedido con la informacion de cada producto."""
+
+    tienda: Optional[TiendaModel] = None
+    """Tienda del pedido, ``None`` si ya no existe."""
+
+    cliente: Optional[ClienteModel] = None
+    """Cliente del pedido sin su password, ``None`` si ya no existe."""
+
+
 class UpdatePedidoModel(BaseModel):
 
     id_tienda: str | int = None
@@ -71,10 +143,10 @@ class UpdatePedidoModel(BaseModel):
     id_cliente: str = None
     """Contiene la información generada por los endpoints."""
 
-    productos: str = None
+    productos: LineasPedido = None
     """Contiene la información generada por los endpoints."""
 
-    precio_total: str = None
+    precio_total: Dinero = None
     """Contiene la información generada por los endpoints."""
 
     direccion: int | float = None
@@ -99,8 +171,26 @@ class PedidosCollection(RespuestaEstandar):
     data: List[PedidoModel] | None = None
     """Contiene la información generada por los endpoints."""
 
+    next_cursor: Optional[str] = None
+    """Cursor para solicitar la pagina siguiente, ``None`` si no hay mas registros."""
+
 
 class PedidoCollection(RespuestaEstandar):
 
     data: PedidoModel = {}
     """Contiene la información generada por los endpoints."""
+
+
+class PedidosIdentificadoresCollection(RespuestaEstandar):
+
+    data: List[PedidoModel] | None = None
+    """Contiene la información generada por los endpoints."""
+
+    faltantes: List[str] = []
+    """Identificadores solicitados que no existen en la coleccion."""
+
+
+class PedidoDetalleCollection(RespuestaEstandar):
+
+    data: PedidoDetalleModel = {}
+    """Contiene la información generada por los endpoints."""
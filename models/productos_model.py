@@ -8,7 +8,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from pydantic.functional_validators import BeforeValidator
 from typing_extensions import Annotated
 
-from models.base_model import RespuestaEstandar
+from models.base_model import Dinero, RespuestaEstandar
 
 # Representa un campo ObjectId en la base de datos.
 # Se representará como una `str` en el modelo para que pueda serializarse en JSON.
@@ -32,7 +32,7 @@ class ProductoModel(BaseModel):
     sub_tipo: Optional[str] = None
     """Contiene la información generada por los endpoints."""
 
-    precio: Optional[str] = None
+    precio: Dinero = None
     """Contiene la información generada por los endpoints."""
 
     fecha_creacion: str = None
@@ -70,7 +70,7 @@ class UpdateProductoModel(BaseModel):
     sub_tipo: Optional[str] = None
     """Contiene la información generada por los endpoints."""
 
-    precio: Optional[str] = None
+    precio: Dinero = None
     """Contiene la información generada por los endpoints."""
 
     fecha_creacion: str = None
@@ -84,13 +84,77 @@ class UpdateProductoModel(BaseModel):
     )
 
 
+class FacetaTipoModel(BaseModel):
+
+    tipo: Optional[str] = None
+    """Tipo de los productos, ``None`` para los productos sin tipo."""
+
+    total: int = 0
+    """Numero de productos del tipo."""
+
+
+class FacetaSubTipoModel(BaseModel):
+
+    tipo: Optional[str] = None
+    """Tipo de los productos, ``None`` para los productos sin tipo."""
+
+    sub_tipo: Optional[str] = None
+    """Sub tipo de los productos, ``None`` para los productos sin sub tipo."""
+
+    total: int = 0
+    """Numero de productos del tipo y sub tipo."""
+
+
+class FacetasProductosModel(BaseModel):
+
+    total: int = 0
+    """Numero de productos que cumplen los filtros."""
+
+    tipos: List[FacetaTipoModel] = []
+    """Numero de productos por tipo."""
+
+    sub_tipos: List[FacetaSubTipoModel] = []
+    """Numero de productos por tipo y sub tipo."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "total": 3,
+                "tipos": [{"tipo": "Lacteo", "total": 3}],
+                "sub_tipos": [
+                    {"tipo": "Lacteo", "sub_tipo": "Leche", "total": 2},
+                    {"tipo": "Lacteo", "sub_tipo": "Queso", "total": 1},
+                ],
+            }
+        },
+    )
+
+
 class ProductosCollection(RespuestaEstandar):
 
     data: List[ProductoModel] | None = None
     """Contiene la información generada por los endpoints."""
 
+    next_cursor: Optional[str] = None
+    """Cursor para solicitar la pagina siguiente, ``None`` si no hay mas registros."""
+
 
 class ProductoCollection(RespuestaEstandar):
 
     data: ProductoModel = {}
     """Contiene la información generada por los endpoints."""
+
+
+class ProductosIdentificadoresCollection(RespuestaEstandar):
+
+    data: List[ProductoModel] | None = None
+    """Contiene la información generada por los endpoints."""
+
+    faltantes: List[str] = []
+    """Identificadores solicitados que no existen en la coleccion."""
+
+
+class FacetasProductosCollection(RespuestaEstandar):
+
+    data: FacetasProductosModel | None = None
+    """Contiene la información generada por los endpoints."""
@@ -0,0 +1,157 @@
+"""Modulo con los modelos de la base de datos"""
+
+# External libraries
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.functional_validators import BeforeValidator
+from typing_extensions import Annotated
+
+from models.base_model import Cantidad, Dinero, RespuestaEstandar
+
+# Representa un campo ObjectId en la base de datos.
+# Se representará como una `str` en el modelo para que pueda serializarse en JSON.
+PyObjectId = Annotated[str, BeforeValidator(str)]
+
+
+class VentaTiendaDiaModel(BaseModel):
+
+    id_tienda: str
+    """Tienda que despacho los pedidos."""
+
+    dia: str
+    """Dia de creacion de los pedidos en formato ``YYYY-MM-DD``."""
+
+    pedidos: int = 0
+    """Numero de pedidos de la tienda en el dia."""
+
+    ingresos: Dinero = 0
+    """Suma de ``precio_total`` de los pedidos."""
+
+    ticket_promedio: Dinero = 0
+    """Ingresos divididos por el numero de pedidos."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id_tienda": "662d0d325363bbc93a0c0296",
+                "dia": "2024-10-22",
+                "pedidos": 42,
+                "ingresos": "840000",
+                "ticket_promedio": "20000.00",
+            }
+        },
+    )
+
+
+class TicketPromedioModel(BaseModel):
+
+    id_tienda: Optional[str] = None
+    """Tienda del ticket promedio, ``None`` para el general de todas las tiendas."""
+
+    pedidos: int = 0
+    """Numero de pedidos."""
+
+    ingresos: Dinero = 0
+    """Suma de ``precio_total`` de los pedidos."""
+
+    ticket_promedio: Dinero = 0
+    """Ingresos divididos por el numero de pedidos."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id_tienda": None,
+                "pedidos": 1200,
+                "ingresos": "25200000",
+                "ticket_promedio": "21000.00",
+            }
+        },
+    )
+
+
+class ProductoVendidoModel(BaseModel):
+
+    id_producto: str
+    """Producto vendido."""
+
+    unidades: int = 0
+    """Suma de las cantidades vendidas."""
+
+    ingresos: Dinero = 0
+    """Suma de cantidad por ``precio_unitario`` de las lineas."""
+
+    pedidos: int = 0
+    """Numero de lineas de pedido con el producto."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id_producto": "6717c43ef963e95aa4789246",
+                "unidades": 310,
+                "ingresos": "1705000",
+                "pedidos": 180,
+            }
+        },
+    )
+
+
+class VentaDiariaModel(BaseModel):
+
+    id: Optional[PyObjectId] = Field(alias="_id", default=None)
+    """Identificador del registro del resumen."""
+
+    id_tienda: str
+    """Tienda que despacho los pedidos."""
+
+    dia: str
+    """Dia de creacion de los pedidos en formato ``YYYY-MM-DD``."""
+
+    pedidos: Cantidad = 0
+    """Numero de pedidos de la tienda en el dia."""
+
+    unidades: Cantidad = 0
+    """Suma de las cantidades de las lineas de los pedidos."""
+
+    ingresos: Dinero = 0
+    """Suma de ``precio_total`` de los pedidos."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id": "6717c43ef963e95aa4789300",
+                "id_tienda": "662d0d325363bbc93a0c0296",
+                "dia": "2024-10-22",
+                "pedidos": 42,
+                "unidades": 130,
+                "ingresos": "840000",
+            }
+        },
+    )
+
+
+class VentasTiendaDiaCollection(RespuestaEstandar):
+
+    data: List[VentaTiendaDiaModel] | None = None
+    """Contiene la información generada por los endpoints."""
+
+
+class TicketsPromedioCollection(RespuestaEstandar):
+
+    data: List[TicketPromedioModel] | None = None
+    """Contiene la información generada por los endpoints."""
+
+
+class ProductosVendidosCollection(RespuestaEstandar):
+
+    data: List[ProductoVendidoModel] | None = None
+    """Contiene la información generada por los endpoints."""
+
+
+class VentasDiariasCollection(RespuestaEstandar):
+
+    data: List[VentaDiariaModel] | None = None
+    """Contiene la información generada por los endpoints."""
+
+    next_cursor: Optional[str] = None
+    """Cursor para solicitar la pagina siguiente, ``None`` si no hay mas registros."""
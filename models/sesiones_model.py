@@ -0,0 +1,71 @@
+"""Modulo con los modelos de la base de datos"""
+
+# External libraries
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from models.base_model import RespuestaEstandar
+
+
+class CredencialesModel(BaseModel):
+
+    email: str
+    """Email con el que se registro el usuario."""
+
+    password: str
+    """Password del usuario en texto plano."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {"email": "emanuelacag@gmail.com", "password": "Ytpgs9m2!"}
+        },
+    )
+
+
+class RefrescarSesionModel(BaseModel):
+
+    refresh_token: str
+    """Token ``refresh_token`` retornado al iniciar sesion."""
+
+
+class TokensModel(BaseModel):
+
+    access_token: str
+    """Token para autenticar las peticiones en el header ``Authorization``."""
+
+    refresh_token: str
+    """Token para obtener un nuevo ``access_token`` cuando expire."""
+
+    token_type: str = "bearer"
+    """Tipo de autenticacion del ``access_token``."""
+
+    expires_in: int
+    """Segundos de validez del ``access_token``."""
+
+
+class SesionModel(BaseModel):
+
+    id_usuario: str
+    """Identificador del usuario autenticado."""
+
+    email: Optional[str] = None
+    """Email del usuario al momento de iniciar sesion."""
+
+    tipo: Optional[str] = None
+    """Tipo del usuario (cliente, tendero) al momento de iniciar sesion."""
+
+    expira: int
+    """Fecha de expiracion del token como timestamp unix."""
+
+
+class TokensCollection(RespuestaEstandar):
+
+    data: TokensModel | None = None
+    """Contiene la información generada por los endpoints."""
+
+
+class SesionCollection(RespuestaEstandar):
+
+    data: SesionModel | None = None
+    """Contiene la información generada por los endpoints."""
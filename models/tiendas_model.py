@@ -9,6 +9,8 @@ from pydantic.functional_validators import BeforeValidator
 from typing_extensions import Annotated
 
 from models.base_model import RespuestaEstandar
+from models.inventarios_model import InventarioModel
+from models.productos_model import ProductoModel
 
 # Representa un campo ObjectId en la base de datos.
 # Se representará como una `str` en el modelo para que pueda serializarse en JSON.
@@ -120,8 +122,35 @@ class TiendasCollection(RespuestaEstandar):
     data: List[TiendaModel] | None = None
     """Contiene la información generada por los endpoints."""
 
+    next_cursor: Optional[str] = None
+    """Cursor para solicitar la pagina siguiente, ``None`` si no hay mas registros."""
+
 
 class TiendaCollection(RespuestaEstandar):
 
     data: TiendaModel = {}
     """Contiene la información generada por los endpoints."""
+
+
+class TiendasIdentificadoresCollection(RespuestaEstandar):
+
+    data: List[TiendaModel] | None = None
+    """Contiene la información generada por los endpoints."""
+
+    faltantes: List[str] = []
+    """Identificadores solicitados que no existen en la coleccion."""
+
+
+class CatalogoTiendaModel(InventarioModel):
+
+    producto: Optional[ProductoModel] = None
+    """Informacion del producto del inventario, ``None`` si ya no existe."""
+
+
+class CatalogoTiendaCollection(RespuestaEstandar):
+
+    data: List[CatalogoTiendaModel] | None = None
+    """Contiene la información generada por los endpoints."""
+
+    next_cursor: Optional[str] = None
+    """Cursor para solicitar la pagina siguiente, ``None`` si no hay mas registros."""
@@ -63,6 +63,12 @@ class UsuarioModel(BaseModel):
     )
 
 
+class ClienteModel(UsuarioModel):
+
+    password: str = Field(default=None, exclude=True)
+    """El password nunca se incluye en la respuesta."""
+
+
 class UpdateUsuarioModel(BaseModel):
 
     nombre_completo: str | int = None
@@ -96,8 +102,20 @@ class UsuariosCollection(RespuestaEstandar):
     data: List[UsuarioModel] | None = None
     """Contiene la información generada por los endpoints."""
 
+    next_cursor: Optional[str] = None
+    """Cursor para solicitar la pagina siguiente, ``None`` si no hay mas registros."""
+
 
 class UsuarioCollection(RespuestaEstandar):
 
     data: UsuarioModel = {}
     """Contiene la información generada por los endpoints."""
+
+
+class UsuariosIdentificadoresCollection(RespuestaEstandar):
+
+    data: List[UsuarioModel] | None = None
+    """Contiene la información generada por los endpoints."""
+
+    faltantes: List[str] = []
+    """Identificadores solicitados que no existen en la coleccion."""
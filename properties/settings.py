@@ -1,5 +1,8 @@
 """Modulo con configuraciones necesaria en el api"""
 
+# External libraries
+import os
+
 
 class Settings:
     """Clase de configuración de la aplicación, contiene todas las
@@ -13,6 +16,85 @@ class Settings:
         f"/?retryWrites=true&w=majority&appName=ClusterMiniMarket&authMechanism=SCRAM-SHA-1"
     )
 
+    mongo_max_pool_size = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+    """Numero maximo de conexiones abiertas en el pool del cliente de Mongo."""
+
+    mongo_min_pool_size = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+    """Numero minimo de conexiones que el pool mantiene abiertas."""
+
+    mongo_max_idle_time_ms = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "60000"))
+    """Tiempo maximo que una conexion puede estar inactiva antes de cerrarse."""
+
+    mongo_wait_queue_timeout_ms = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "5000"))
+    """Tiempo maximo de espera por una conexion libre del pool."""
+
+    mongo_connect_timeout_ms = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "10000"))
+    """Tiempo maximo para establecer una conexion nueva con el servidor."""
+
+    mongo_server_selection_timeout_ms = int(
+        os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "10000")
+    )
+    """Tiempo maximo para seleccionar un servidor disponible del cluster."""
+
+    mongo_usar_transacciones = (
+        os.getenv("MONGO_USAR_TRANSACCIONES", "true").lower() == "true"
+    )
+    """Indica si el cluster soporta transacciones (replica set o sharded)."""
+
+    mongo_transaccion_reintentos = int(os.getenv("MONGO_TRANSACCION_REINTENTOS", "3"))
+    """Intentos de una transaccion que falla por conflicto con otra escritura."""
+
+    paginacion_limite_defecto = 50
+    """Numero de registros por pagina cuando no se envia ``limit``."""
+
+    paginacion_limite_maximo = 500
+    """Numero maximo de registros que se pueden solicitar por pagina."""
+
+    exportacion_batch_size = int(os.getenv("EXPORTACION_BATCH_SIZE", "1000"))
+    """Numero de documentos por lote que se leen de Mongo en las exportaciones."""
+
+    importacion_batch_size = int(os.getenv("IMPORTACION_BATCH_SIZE", "1000"))
+    """Numero de registros que se envian a Mongo en cada insert_many al importar."""
+
+    cache_productos_capacidad = int(os.getenv("CACHE_PRODUCTOS_CAPACIDAD", "1000"))
+    """Numero maximo de productos y paginas de productos guardados en memoria."""
+
+    cache_productos_ttl = float(os.getenv("CACHE_PRODUCTOS_TTL", "60"))
+    """Segundos que un producto permanece en el cache antes de consultarse de nuevo."""
+
+    cache_reportes_capacidad = int(os.getenv("CACHE_REPORTES_CAPACIDAD", "100"))
+    """Numero maximo de reportes calculados guardados en memoria."""
+
+    cache_reportes_ttl = float(os.getenv("CACHE_REPORTES_TTL", "5"))
+    """Segundos que un reporte cacheado se retorna sin volver a calcularse."""
+
+    analitica_chunk_size = int(os.getenv("ANALITICA_CHUNK_SIZE", "50000"))
+    """Numero de pedidos que se cargan en cada DataFrame de los reportes."""
+
+    password_scrypt_n = int(os.getenv("PASSWORD_SCRYPT_N", str(2**14)))
+    """Costo de CPU y memoria de scrypt (potencia de 2) para los password nuevos."""
+
+    password_scrypt_r = int(os.getenv("PASSWORD_SCRYPT_R", "8"))
+    """Tamaño de bloque de scrypt para los password nuevos."""
+
+    password_scrypt_p = int(os.getenv("PASSWORD_SCRYPT_P", "1"))
+    """Paralelismo de scrypt para los password nuevos."""
+
+    procesos_hash_workers = int(
+        os.getenv("PROCESOS_HASH_WORKERS", str(os.cpu_count() or 1))
+    )
+    """Numero de procesos que calculan los hash de los password."""
+
+    jwt_secreto = os.getenv("JWT_SECRETO")
+    """Clave con la que se firman los tokens de sesion, debe ser la misma en todos
+    los workers. Es obligatoria, el api no inicia si no se configura."""
+
+    jwt_access_ttl = int(os.getenv("JWT_ACCESS_TTL", "900"))
+    """Segundos de validez del token de acceso."""
+
+    jwt_refresh_ttl = int(os.getenv("JWT_REFRESH_TTL", "604800"))
+    """Segundos de validez del token para renovar la sesion."""
+
     class Config:
         env_prefix = "prod"
         case_sensitive = False
@@ -0,0 +1,291 @@
+"""Modulo con la clase base de todos los repositorios."""
+
+# External libraries
+from abc import ABC
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import BulkWriteError
+
+
+class RepositoryBase(ABC):
+    """Base de los repositorios"""
+
+    async def _paginar(
+        self,
+        coleccion: AsyncIOMotorCollection,
+        filtro: dict,
+        limit: int,
+        after: Optional[str] = None,
+        proyeccion: Optional[dict] = None,
+        orden: Optional[Tuple[str, int]] = None,
+    ) -> Tuple[list, Optional[str]]:
+        """Obtiene una pagina de documentos ordenados por ``_id`` (keyset).
+
+        Se consulta un documento adicional al limite solicitado para saber si
+        existe una pagina siguiente sin necesidad de contar la coleccion.
+
+        Con ``orden`` los documentos se ordenan por ese campo y luego por ``_id``.
+        El cursor sigue siendo el ``_id`` del ultimo documento, su valor en el
+        campo de orden se consulta en Mongo para continuar desde esa posicion.
+
+        Args:
+            coleccion: Coleccion de Motor sobre la que se consulta.
+            filtro: Filtro de Mongo que deben cumplir los documentos.
+            limit: Numero maximo de documentos de la pagina.
+            after: ``_id`` del ultimo documento de la pagina anterior.
+            proyeccion: Campos de los documentos a retornar, ``None`` para todos.
+            orden: Campo y direccion (1 o -1) del orden, ``None`` para ``_id``.
+
+        Returns:
+            Documentos de la pagina y cursor de la pagina siguiente, ``None`` si
+            no hay mas documentos.
+        """
+        campo, direccion = orden or ("_id", 1)
+        sort = (
+            [("_id", direccion)]
+            if campo == "_id"
+            else [(campo, direccion), ("_id", direccion)]
+        )
+
+        if after is not None:
+            filtro = {
+                "$and": [
+                    filtro,
+                    await self._despues_de(
+                        coleccion, ObjectId(after), campo, direccion
+                    ),
+                ]
+            }
+
+        documentos = (
+            await coleccion.find(filtro, proyeccion)
+            .sort(sort)
+            .limit(limit + 1)
+            .to_list(length=limit + 1)
+        )
+
+        respuesta = self._cortar_pagina(documentos, limit)
+        return respuesta
+
+    async def _paginar_agregacion(
+        self,
+        coleccion: AsyncIOMotorCollection,
+        filtro: dict,
+        limit: int,
+        after: Optional[str],
+        etapas: List[dict],
+    ) -> Tuple[list, Optional[str]]:
+        """Obtiene una pagina por ``_id`` (keyset) y le aplica etapas de agregacion.
+
+        Las ``etapas`` se ejecutan despues del ``$limit``, por lo que los
+        ``$lookup`` solo se resuelven para los documentos de la pagina.
+
+        Args:
+            coleccion: Coleccion de Motor sobre la que se consulta.
+            filtro: Filtro de Mongo que deben cumplir los documentos.
+            limit: Numero maximo de documentos de la pagina.
+            after: ``_id`` del ultimo documento de la pagina anterior.
+            etapas: Etapas de agregacion que se aplican a la pagina.
+
+        Returns:
+            Documentos de la pagina y cursor de la pagina siguiente, ``None`` si
+            no hay mas documentos.
+        """
+        filtro = dict(filtro)
+        if after is not None:
+            filtro["_id"] = {"$gt": ObjectId(after)}
+
+        pipeline = [
+            {"$match": filtro},
+            {"$sort": {"_id": 1}},
+            {"$limit": limit + 1},
+            *etapas,
+        ]
+        documentos = await coleccion.aggregate(pipeline).to_list(length=limit + 1)
+
+        respuesta = self._cortar_pagina(documentos, limit)
+        return respuesta
+
+    @staticmethod
+    def _cortar_pagina(documentos: list, limit: int) -> Tuple[list, Optional[str]]:
+        """Deja ``limit`` documentos y calcula el cursor de la pagina siguiente.
+
+        Args:
+            documentos: Documentos consultados, hasta ``limit + 1``.
+            limit: Numero maximo de documentos de la pagina.
+
+        Returns:
+            Documentos de la pagina y cursor de la pagina siguiente.
+        """
+        next_cursor = None
+        if len(documentos) > limit:
+            documentos = documentos[:limit]
+            next_cursor = str(documentos[-1]["_id"])
+
+        return documentos, next_cursor
+
+    async def _despues_de(
+        self,
+        coleccion: AsyncIOMotorCollection,
+        after: ObjectId,
+        campo: str,
+        direccion: int,
+    ) -> dict:
+        """Arma el filtro de los documentos posteriores al cursor en el orden dado.
+
+        Args:
+            coleccion: Coleccion de Motor sobre la que se consulta.
+            after: ``_id`` del ultimo documento de la pagina anterior.
+            campo: Campo por el que se ordenan los documentos.
+            direccion: 1 para orden ascendente y -1 para descendente.
+
+        Returns:
+            Filtro de Mongo con los documentos de las paginas siguientes.
+        """
+        operador = "$gt" if direccion == 1 else "$lt"
+        if campo == "_id":
+            return {"_id": {operador: after}}
+
+        ancla = await coleccion.find_one({"_id": after}, {campo: 1})
+        if ancla is None:
+            raise InvalidId(f"{after} no existe en {coleccion.name}")
+
+        # Los nulos (o el campo ausente) van primero en orden ascendente y al final
+        # en descendente; ``$gt``/``$lt`` nunca los incluyen, por eso se agregan
+        # aparte. ``{campo: None}`` cubre tanto ``null`` como el campo ausente.
+        valor = ancla.get(campo)
+        if valor is None:
+            # Entre los nulos solo se desempata por ``_id``.
+            empate = {campo: None, "_id": {operador: after}}
+            if direccion == 1:
+                return {"$or": [{campo: {"$ne": None}}, empate]}
+            return empate
+
+        condiciones = [
+            {campo: {operador: valor}},
+            {campo: valor, "_id": {operador: after}},
+        ]
+        if direccion == -1:
+            condiciones.append({campo: None})
+        return {"$or": condiciones}
+
+    async def _obtener_varios(
+        self,
+        coleccion: AsyncIOMotorCollection,
+        identificadores: List[str],
+        proyeccion: Optional[dict] = None,
+    ) -> Dict[str, dict]:
+        """Obtiene varios documentos por ``_id`` con una sola consulta ``$in``.
+
+        Args:
+            coleccion: Coleccion de Motor sobre la que se consulta.
+            identificadores: Identificadores ObjectId a consultar, los invalidos
+                se ignoran.
+            proyeccion: Campos de los documentos a retornar, ``None`` para todos.
+
+        Returns:
+            Documentos encontrados por el identificador recibido.
+        """
+        object_ids = {
+            identificador: ObjectId(identificador)
+            for identificador in identificadores
+            if ObjectId.is_valid(identificador)
+        }
+        if not object_ids:
+            return {}
+
+        documentos = {}
+        async for documento in coleccion.find(
+            {"_id": {"$in": list(set(object_ids.values()))}}, proyeccion
+        ):
+            documentos[documento["_id"]] = documento
+
+        return {
+            identificador: documentos[object_id]
+            for identificador, object_id in object_ids.items()
+            if object_id in documentos
+        }
+
+    @staticmethod
+    def _ordenar_por_identificador(
+        identificadores: List[str], documentos: Dict[str, dict]
+    ) -> Tuple[List[dict], List[str]]:
+        """Ordena los documentos segun los identificadores solicitados.
+
+        Args:
+            identificadores: Identificadores en el orden solicitado.
+            documentos: Documentos encontrados por identificador.
+
+        Returns:
+            Documentos en el orden solicitado e identificadores no encontrados.
+        """
+        encontrados = [
+            documentos[identificador]
+            for identificador in identificadores
+            if identificador in documentos
+        ]
+        faltantes = [
+            identificador
+            for identificador in identificadores
+            if identificador not in documentos
+        ]
+        return encontrados, faltantes
+
+    async def _iterar(
+        self,
+        coleccion: AsyncIOMotorCollection,
+        filtro: dict,
+        batch_size: int,
+        proyeccion: Optional[dict] = None,
+    ) -> AsyncIterator[dict]:
+        """Recorre los documentos de una coleccion sin cargarlos todos en memoria.
+
+        Args:
+            coleccion: Coleccion de Motor sobre la que se consulta.
+            filtro: Filtro de Mongo que deben cumplir los documentos.
+            batch_size: Numero de documentos que se traen del servidor por lote.
+            proyeccion: Campos de los documentos a retornar, ``None`` para todos.
+
+        Returns:
+            Iterador asincrono con los documentos ordenados por ``_id``.
+        """
+        documentos = (
+            coleccion.find(filtro, proyeccion).sort("_id", 1).batch_size(batch_size)
+        )
+        async for documento in documentos:
+            yield documento
+
+    async def _insertar_muchos(
+        self, coleccion: AsyncIOMotorCollection, documentos: List[dict]
+    ) -> Tuple[List[Optional[str]], Dict[int, str]]:
+        """Inserta un lote de documentos con un unico ``insert_many`` desordenado.
+
+        Con ``ordered=False`` Mongo sigue insertando el resto del lote cuando un
+        documento falla, y reporta los errores por posicion.
+
+        Args:
+            coleccion: Coleccion de Motor en la que se insertan los documentos.
+            documentos: Documentos a insertar.
+
+        Returns:
+            Identificador de cada documento en el mismo orden recibido (``None``
+            si fallo) y errores por posicion dentro del lote.
+        """
+        errores = {}
+        try:
+            await coleccion.insert_many(documentos, ordered=False)
+        except BulkWriteError as error:
+            errores = {
+                detalle["index"]: detalle["errmsg"]
+                for detalle in error.details.get("writeErrors", [])
+            }
+
+        # insert_many asigna el _id en cada documento antes de enviarlo.
+        identificadores = [
+            None if posicion in errores else str(documento["_id"])
+            for posicion, documento in enumerate(documentos)
+        ]
+        return identificadores, errores
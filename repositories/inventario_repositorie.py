@@ -2,31 +2,45 @@
     la base de datos."""
 
 # External libraries
-from abc import ABC
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from bson import ObjectId
-from pymongo import ReturnDocument
-from sqlmodel import Session
+from motor.motor_asyncio import AsyncIOMotorClientSession, AsyncIOMotorDatabase
+from pymongo import ReturnDocument, UpdateOne
 
+from helpers.cache import VERSIONES, CacheLRU, incrementar_version
 from models.inventarios_model import InventarioModel
+from properties.settings import Settings
+from repositories.base_repositorie import RepositoryBase
 
+# Reportes calculados, la clave incluye la version de inventarios y productos.
+cache_reportes_inventario = CacheLRU(
+    "reportes_inventario",
+    Settings.cache_reportes_capacidad,
+    Settings.cache_reportes_ttl,
+)
 
-class InventarioRepository(ABC):
+
+class InventarioRepository(RepositoryBase):
     """Repositorio correspondiente al manejo del inventario en la aplicación"""
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncIOMotorDatabase) -> None:
         """Crea una nueva instancia del repositorio y la conexion de Mongo.
 
         Args:
-            session: MongoDb session.
+            session: Base de datos de Motor sobre la que se ejecutan las operaciones.
         """
         self._session = session
 
-    def get_by_id(self, identificador: str) -> dict:
+    async def get_by_id(
+        self, identificador: str, proyeccion: Optional[dict] = None
+    ) -> dict:
         """Obtiene la informacion de un inventario segun su identificador
 
         Args:
             identificador (str): Identificador ObjectId de MongoDb
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
 
         Returns:
             Informacion correspondiente al inventario
@@ -45,14 +59,23 @@ class InventarioRepository(ABC):
                 }
 
         """
-        respuesta = self._session.inventarios.find_one({"_id": ObjectId(identificador)})
+        respuesta = await self._session.inventarios.find_one(
+            {"_id": ObjectId(identificador)}, proyeccion
+        )
         return respuesta
 
-    def get_list(self) -> list:
-        """Obtener todos los inventarios registrados en la colleccion de Mongo Db
+    async def get_list(
+        self, limit: int, after: Optional[str] = None, proyeccion: Optional[dict] = None
+    ) -> Tuple[list, Optional[str]]:
+        """Obtener una pagina de los inventarios registrados en Mongo Db
+
+        Args:
+            limit (int): Numero maximo de inventarios a retornar.
+            after (str): Cursor ``next_cursor`` de la pagina anterior.
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
 
         Returns:
-            Todos los inventarios
+            Pagina de inventarios y cursor de la pagina siguiente
 
             .. code-block:: python
 
@@ -80,11 +103,208 @@ class InventarioRepository(ABC):
                 ]
 
         """
-        inventarios = self._session.inventarios.find({})
-        respuesta = list(inventarios)
+        respuesta = await self._paginar(
+            self._session.inventarios, {}, limit, after, proyeccion
+        )
         return respuesta
 
-    def add(self, record: InventarioModel) -> dict:
+    async def get_many(
+        self, identificadores: List[str], proyeccion: Optional[dict] = None
+    ) -> Tuple[List[dict], List[str]]:
+        """Obtiene varios inventarios por ``_id`` con una sola consulta a Mongo.
+
+        Args:
+            identificadores (List[str]): Identificadores ObjectId de MongoDb.
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
+
+        Returns:
+            Inventarios en el orden de ``identificadores`` e identificadores
+            que no existen en la coleccion.
+
+        """
+        documentos = await self._obtener_varios(
+            self._session.inventarios, identificadores, proyeccion
+        )
+        respuesta = self._ordenar_por_identificador(identificadores, documentos)
+        return respuesta
+
+    async def get_catalogo(
+        self, id_tienda: str, limit: int, after: Optional[str] = None
+    ) -> Tuple[list, Optional[str]]:
+        """Obtener una pagina del inventario de una tienda con sus productos.
+
+        La pagina se filtra con el indice ``id_tienda_id`` y cada inventario se
+        une a su producto con un ``$lookup`` por ``_id``.
+
+        Args:
+            id_tienda (str): Identificador de la tienda.
+            limit (int): Numero maximo de inventarios a retornar.
+            after (str): Cursor ``next_cursor`` de la pagina anterior.
+
+        Returns:
+            Pagina de inventarios con el producto y cursor de la pagina siguiente
+
+            .. code-block:: python
+
+                [
+                    {
+                        'id': '6717c43ef963e95aa4789250',
+                        'id_producto': '6717c43ef963e95aa4789246',
+                        'id_tienda': '662d0d325363bbc93a0c0296',
+                        'cantidad_disponibles': 12,
+                        'producto': {
+                            'id': '6717c43ef963e95aa4789246',
+                            'nombre': 'Leche',
+                            'precio': '5500'
+                        }
+                    }
+                ]
+
+        """
+        respuesta = await self._paginar_agregacion(
+            self._session.inventarios,
+            {"id_tienda": id_tienda},
+            limit,
+            after,
+            self._etapas_producto(),
+        )
+        return respuesta
+
+    async def get_valoracion(
+        self, agrupar: str, id_tienda: Optional[str] = None, usar_cache: bool = False
+    ) -> List[dict]:
+        """Calcula en Mongo las unidades y el valor del inventario por grupo.
+
+        El valor de cada inventario es ``cantidad_disponibles`` por el ``precio``
+        del producto, los productos sin precio suman unidades con valor cero. Las
+        cantidades y precios guardados como texto se convierten en Mongo, los que
+        no son numericos cuentan como cero.
+
+        Args:
+            agrupar (str): Campo por el que se agrupa: ``id_tienda`` o un campo
+                del producto (``producto.tipo``, ``producto.sub_tipo``).
+            id_tienda (str): Tienda a la que se limita el reporte, ``None`` para
+                todas.
+            usar_cache (bool): Retorna el ultimo reporte calculado mientras no
+                cambien inventarios ni productos y no expire.
+
+        Returns:
+            Unidades, valor y numero de inventarios por grupo, de mayor a menor
+            valor
+
+            .. code-block:: python
+
+                [
+                    {
+                        'grupo': 'Lacteo',
+                        'unidades': 340,
+                        'valor': Decimal('1870000'),
+                        'inventarios': 12
+                    }
+                ]
+
+        """
+        clave = (agrupar, id_tienda, VERSIONES["inventarios"], VERSIONES["productos"])
+        if usar_cache:
+            reporte = cache_reportes_inventario.get(clave)
+            if reporte is not None:
+                return [dict(grupo) for grupo in reporte]
+
+        filtro = {} if id_tienda is None else {"id_tienda": id_tienda}
+        # Los documentos legados guardan cantidades y precios como texto, se
+        # convierten y los valores vacios o invalidos cuentan como cero.
+        cantidad = {
+            "$convert": {
+                "input": "$cantidad_disponibles",
+                "to": "int",
+                "onError": 0,
+                "onNull": 0,
+            }
+        }
+        precio = {
+            "$convert": {
+                "input": "$producto.precio",
+                "to": "decimal",
+                "onError": 0,
+                "onNull": 0,
+            }
+        }
+        pipeline = [
+            {"$match": filtro},
+            *self._etapas_producto(),
+            {
+                "$group": {
+                    "_id": f"${agrupar}",
+                    "unidades": {"$sum": cantidad},
+                    "valor": {"$sum": {"$multiply": [cantidad, precio]}},
+                    "inventarios": {"$sum": 1},
+                }
+            },
+            {"$sort": {"valor": -1, "_id": 1}},
+            {
+                "$project": {
+                    "_id": 0,
+                    "grupo": "$_id",
+                    "unidades": 1,
+                    "valor": 1,
+                    "inventarios": 1,
+                }
+            },
+        ]
+        respuesta = await self._session.inventarios.aggregate(pipeline).to_list(
+            length=None
+        )
+        cache_reportes_inventario.set(clave, respuesta)
+        return [dict(grupo) for grupo in respuesta]
+
+    @staticmethod
+    def _etapas_producto() -> List[dict]:
+        """Etapas de agregacion que agregan a cada inventario su ``producto``.
+
+        Returns:
+            Etapas que convierten ``id_producto`` a ObjectId y hacen el ``$lookup``
+            por ``_id`` en productos.
+        """
+        return [
+            # id_producto se guarda como texto, se convierte para usar el _id.
+            {
+                "$addFields": {
+                    "_id_producto": {
+                        "$convert": {
+                            "input": "$id_producto",
+                            "to": "objectId",
+                            "onError": None,
+                            "onNull": None,
+                        }
+                    }
+                }
+            },
+            {
+                "$lookup": {
+                    "from": "productos",
+                    "localField": "_id_producto",
+                    "foreignField": "_id",
+                    "as": "producto",
+                }
+            },
+            {"$unwind": {"path": "$producto", "preserveNullAndEmptyArrays": True}},
+            {"$project": {"_id_producto": 0}},
+        ]
+
+    async def iter_all(self, batch_size: int) -> AsyncIterator[dict]:
+        """Recorre todos los inventarios de la colleccion por lotes para exportarlos.
+
+        Args:
+            batch_size (int): Numero de inventarios que se traen de Mongo por lote.
+
+        Returns:
+            Iterador asincrono con los inventarios ordenados por ``_id``.
+
+        """
+        async for documento in self._iterar(self._session.inventarios, {}, batch_size):
+            yield documento
+
+    async def add(self, record: InventarioModel) -> dict:
         """Crea un nuevo registro en la coreccion de inventarios
 
         Args:
@@ -108,16 +328,167 @@ class InventarioRepository(ABC):
 
         """
 
-        nuevo_inventario = self._session.inventarios.insert_one(
-            record.model_dump(by_alias=True, exclude=["id"])
+        inventario_creado = record.model_dump(by_alias=True, exclude=["id"])
+        nuevo_inventario = await self._session.inventarios.insert_one(inventario_creado)
+        # Se arma la respuesta con el documento insertado para evitar una
+        # segunda consulta a Mongo.
+        inventario_creado["_id"] = nuevo_inventario.inserted_id
+        incrementar_version("inventarios")
+
+        return inventario_creado
+
+    async def add_many(
+        self, records: List[InventarioModel]
+    ) -> Tuple[List[Optional[str]], Dict[int, str]]:
+        """Crea varios registros en la coleccion de inventarios con una sola escritura.
+
+        Args:
+            records (List[InventarioModel]): inventarios a agregar a la colleccion.
+
+        Returns:
+            Identificador de cada inventario creado (``None`` si fallo) y errores por
+            posicion en ``records``.
+
+        """
+        documentos = [
+            record.model_dump(by_alias=True, exclude=["id"]) for record in records
+        ]
+        respuesta = await self._insertar_muchos(self._session.inventarios, documentos)
+        incrementar_version("inventarios")
+        return respuesta
+
+    async def reservar_stock(
+        self,
+        id_tienda: str,
+        cantidades: Dict[str, int],
+        session: AsyncIOMotorClientSession = None,
+    ) -> int:
+        """Descuenta el stock de varios productos de una tienda en un bulk_write.
+
+        Cada producto solo se descuenta si ``cantidad_disponibles`` alcanza para
+        la cantidad pedida, la condicion y el ``$inc`` se evaluan atomicamente en
+        Mongo.
+
+        Args:
+            id_tienda (str): Identificador de la tienda que despacha el pedido.
+            cantidades (Dict[str, int]): Cantidad a descontar por id de producto.
+            session: Sesion de Mongo cuando la reserva hace parte de una
+                transaccion.
+
+        Returns:
+            Numero de productos a los que se les desconto el stock.
+
+        """
+        operaciones = [
+            UpdateOne(
+                {
+                    "id_tienda": id_tienda,
+                    "id_producto": id_producto,
+                    "cantidad_disponibles": {"$gte": cantidad},
+                },
+                {"$inc": {"cantidad_disponibles": -cantidad}},
+            )
+            for id_producto, cantidad in cantidades.items()
+        ]
+        resultado = await self._session.inventarios.bulk_write(
+            operaciones, ordered=False, session=session
         )
-        inventario_creado = self._session.inventarios.find_one(
-            {"_id": nuevo_inventario.inserted_id}
+        incrementar_version("inventarios")
+        return resultado.modified_count
+
+    async def reservar_stock_por_producto(
+        self, id_tienda: str, cantidades: Dict[str, int]
+    ) -> List[str]:
+        """Descuenta el stock de cada producto con un update condicional propio.
+
+        Se usa cuando Mongo no soporta transacciones: las actualizaciones se
+        envian en paralelo y se sabe cuales productos se reservaron para poder
+        devolver su stock si el pedido no se crea.
+
+        Args:
+            id_tienda (str): Identificador de la tienda que despacha el pedido.
+            cantidades (Dict[str, int]): Cantidad a descontar por id de producto.
+
+        Returns:
+            Identificadores de los productos a los que se les desconto el stock.
+
+        """
+
+        async def reservar(id_producto: str, cantidad: int) -> bool:
+            resultado = await self._session.inventarios.update_one(
+                {
+                    "id_tienda": id_tienda,
+                    "id_producto": id_producto,
+                    "cantidad_disponibles": {"$gte": cantidad},
+                },
+                {"$inc": {"cantidad_disponibles": -cantidad}},
+            )
+            return resultado.modified_count == 1
+
+        reservados = await asyncio.gather(
+            *(
+                reservar(id_producto, cantidad)
+                for id_producto, cantidad in cantidades.items()
+            )
         )
+        incrementar_version("inventarios")
+        return [
+            id_producto
+            for id_producto, reservado in zip(cantidades, reservados)
+            if reservado
+        ]
 
-        return inventario_creado
+    async def liberar_stock(self, id_tienda: str, cantidades: Dict[str, int]) -> None:
+        """Devuelve al stock de una tienda las cantidades reservadas.
+
+        Args:
+            id_tienda (str): Identificador de la tienda.
+            cantidades (Dict[str, int]): Cantidad a devolver por id de producto.
+
+        """
+        if not cantidades:
+            return
+
+        await self._session.inventarios.bulk_write(
+            [
+                UpdateOne(
+                    {"id_tienda": id_tienda, "id_producto": id_producto},
+                    {"$inc": {"cantidad_disponibles": cantidad}},
+                )
+                for id_producto, cantidad in cantidades.items()
+            ],
+            ordered=False,
+        )
+        incrementar_version("inventarios")
+
+    async def productos_sin_stock(
+        self, id_tienda: str, cantidades: Dict[str, int]
+    ) -> List[str]:
+        """Obtiene los productos de una tienda sin stock para la cantidad pedida.
+
+        Args:
+            id_tienda (str): Identificador de la tienda.
+            cantidades (Dict[str, int]): Cantidad pedida por id de producto.
 
-    def update(self, identificador: str, record: InventarioModel) -> dict:
+        Returns:
+            Identificadores de los productos sin inventario suficiente.
+
+        """
+        inventarios = self._session.inventarios.find(
+            {"id_tienda": id_tienda, "id_producto": {"$in": list(cantidades)}},
+            {"id_producto": 1, "cantidad_disponibles": 1},
+        )
+        disponibles = {
+            inventario["id_producto"]: inventario.get("cantidad_disponibles") or 0
+            async for inventario in inventarios
+        }
+        return [
+            id_producto
+            for id_producto, cantidad in cantidades.items()
+            if disponibles.get(id_producto, 0) < cantidad
+        ]
+
+    async def update(self, identificador: str, record: InventarioModel) -> dict:
         """Actualiza informacion de un inventario segun su identificador.
 
         Args:
@@ -148,15 +519,18 @@ class InventarioRepository(ABC):
         }
 
         if len(inventario) >= 1:
-            inventario_actualizado = self._session.inventarios.find_one_and_update(
-                {"_id": ObjectId(identificador)},
-                {"$set": inventario},
-                return_document=ReturnDocument.AFTER,
+            inventario_actualizado = (
+                await self._session.inventarios.find_one_and_update(
+                    {"_id": ObjectId(identificador)},
+                    {"$set": inventario},
+                    return_document=ReturnDocument.AFTER,
+                )
             )
+            incrementar_version("inventarios")
 
         return inventario_actualizado
 
-    def delete(self, identificador: str):
+    async def delete(self, identificador: str):
         """Elimina un inventario segun su identificador en la coleccion de inventarios.
 
         Args:
@@ -166,6 +540,9 @@ class InventarioRepository(ABC):
             Elementos eliminados de la colleccion.
 
         """
-        record = self._session.inventarios.delete_one({"_id": ObjectId(identificador)})
+        record = await self._session.inventarios.delete_one(
+            {"_id": ObjectId(identificador)}
+        )
+        incrementar_version("inventarios")
 
         return record
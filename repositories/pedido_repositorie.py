@@ -2,31 +2,35 @@
     la base de datos."""
 
 # External libraries
-from abc import ABC
+from typing import AsyncIterator, List, Optional, Tuple
 
 from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClientSession, AsyncIOMotorDatabase
 from pymongo import ReturnDocument
-from sqlmodel import Session
 
 from models.pedidos_model import PedidoModel
+from repositories.base_repositorie import RepositoryBase
 
 
-class PedidoRepository(ABC):
+class PedidoRepository(RepositoryBase):
     """Repositorio correspondiente a las Ubicaciones de los pedidos."""
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncIOMotorDatabase) -> None:
         """Crea una nueva instancia del repositorio y la conexion de Mongo.
 
         Args:
-            session: MongoDb session.
+            session: Base de datos de Motor sobre la que se ejecutan las operaciones.
         """
         self._session = session
 
-    def get_by_id(self, identificador: str) -> dict:
+    async def get_by_id(
+        self, identificador: str, proyeccion: Optional[dict] = None
+    ) -> dict:
         """Obtiene la informacion de un pedido segun su identificador
 
         Args:
             identificador (str): Identificador ObjectId de MongoDb
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
 
         Returns:
             Informacion correspondiente al pedido
@@ -45,14 +49,23 @@ class PedidoRepository(ABC):
                 }
 
         """
-        respuesta = self._session.pedidos.find_one({"_id": ObjectId(identificador)})
+        respuesta = await self._session.pedidos.find_one(
+            {"_id": ObjectId(identificador)}, proyeccion
+        )
         return respuesta
 
-    def get_list(self) -> list:
-        """Obtener todos los pedidos registrados en la colleccion de Mongo Db
+    async def get_list(
+        self, limit: int, after: Optional[str] = None, proyeccion: Optional[dict] = None
+    ) -> Tuple[list, Optional[str]]:
+        """Obtener una pagina de los pedidos registrados en Mongo Db
+
+        Args:
+            limit (int): Numero maximo de pedidos a retornar.
+            after (str): Cursor ``next_cursor`` de la pagina anterior.
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
 
         Returns:
-            Todos los pedidos
+            Pagina de pedidos y cursor de la pagina siguiente
 
             .. code-block:: python
 
@@ -80,15 +93,110 @@ class PedidoRepository(ABC):
                 ]
 
         """
-        pedidos = self._session.pedidos.find({})
-        respuesta = list(pedidos)
+        respuesta = await self._paginar(
+            self._session.pedidos, {}, limit, after, proyeccion
+        )
         return respuesta
 
-    def add(self, record: PedidoModel) -> dict:
+    async def get_list_by_producto(
+        self, id_producto: str, limit: int, after: Optional[str] = None
+    ) -> Tuple[list, Optional[str]]:
+        """Obtener una pagina de los pedidos que contienen un producto
+
+        Args:
+            id_producto (str): Identificador del producto a buscar en las lineas.
+            limit (int): Numero maximo de pedidos a retornar.
+            after (str): Cursor ``next_cursor`` de la pagina anterior.
+
+        Returns:
+            Pagina de pedidos y cursor de la pagina siguiente
+
+        """
+        respuesta = await self._paginar(
+            self._session.pedidos,
+            {"productos.id_producto": id_producto},
+            limit,
+            after,
+        )
+        return respuesta
+
+    async def get_many(
+        self, identificadores: List[str], proyeccion: Optional[dict] = None
+    ) -> Tuple[List[dict], List[str]]:
+        """Obtiene varios pedidos por ``_id`` con una sola consulta a Mongo.
+
+        Args:
+            identificadores (List[str]): Identificadores ObjectId de MongoDb.
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
+
+        Returns:
+            Pedidos en el orden de ``identificadores`` e identificadores
+            que no existen en la coleccion.
+
+        """
+        documentos = await self._obtener_varios(
+            self._session.pedidos, identificadores, proyeccion
+        )
+        respuesta = self._ordenar_por_identificador(identificadores, documentos)
+        return respuesta
+
+    async def iter_all(self, batch_size: int) -> AsyncIterator[dict]:
+        """Recorre todos los pedidos de la colleccion por lotes para exportarlos.
+
+        Args:
+            batch_size (int): Numero de pedidos que se traen de Mongo por lote.
+
+        Returns:
+            Iterador asincrono con los pedidos ordenados por ``_id``.
+
+        """
+        async for documento in self._iterar(self._session.pedidos, {}, batch_size):
+            yield documento
+
+    async def iter_by_fecha(
+        self,
+        desde: Optional[str],
+        hasta: Optional[str],
+        batch_size: int,
+        proyeccion: Optional[dict] = None,
+    ) -> AsyncIterator[dict]:
+        """Recorre por lotes los pedidos creados en un rango de fechas.
+
+        ``fecha_creacion`` se guarda en formato ISO, por lo que el rango se compara
+        como texto con el indice ``fecha_creacion``. No se ordena el resultado.
+
+        Args:
+            desde (str): Fecha ISO inicial (inclusiva), ``None`` sin limite.
+            hasta (str): Fecha ISO final (exclusiva), ``None`` sin limite.
+            batch_size (int): Numero de pedidos que se traen de Mongo por lote.
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
+
+        Returns:
+            Iterador asincrono con los pedidos del rango.
+
+        """
+        rango = {}
+        if desde is not None:
+            rango["$gte"] = desde
+        if hasta is not None:
+            rango["$lt"] = hasta
+        filtro = {"fecha_creacion": rango} if rango else {}
+
+        documentos = self._session.pedidos.find(filtro, proyeccion).batch_size(
+            batch_size
+        )
+        async for documento in documentos:
+            yield documento
+
+    async def add(
+        self, record: PedidoModel, session: AsyncIOMotorClientSession = None
+    ) -> dict:
         """Crea un nuevo registro en la coreccion de pedidos
 
         Args:
             record (PedidoModel): informacion del pedido a agregar a la colleccion
+            session: Sesion de Mongo cuando el registro hace parte de una
+                transaccion.
 
         Returns:
             Informacion del pedido agregado
@@ -108,37 +216,46 @@ class PedidoRepository(ABC):
 
         """
 
-        nuevo_pedido = self._session.pedidos.insert_one(
-            record.model_dump(by_alias=True, exclude=["id"])
-        )
-        pedido_creado = self._session.pedidos.find_one(
-            {"_id": nuevo_pedido.inserted_id}
+        pedido_creado = record.model_dump(by_alias=True, exclude=["id"])
+        nuevo_pedido = await self._session.pedidos.insert_one(
+            pedido_creado, session=session
         )
+        # Se arma la respuesta con el documento insertado para evitar una
+        # segunda consulta a Mongo.
+        pedido_creado["_id"] = nuevo_pedido.inserted_id
 
         return pedido_creado
 
-    def update(self, identificador: str, record: PedidoModel) -> dict:
+    async def update(
+        self, identificador: str, record: PedidoModel
+    ) -> Tuple[Optional[dict], Optional[dict]]:
         """Actualiza informacion de un pedido segun su identificador.
 
+        El pedido anterior se obtiene de la misma operacion que lo actualiza, de
+        esta forma dos actualizaciones concurrentes no leen la misma version.
+
         Args:
             identificador (str): Identificador del pedido a actualizar informacion.
             record (PedidoModel): Informacion que se actualizara del registro.
 
         Returns:
-            Informacion del pedido actualizado
+            Informacion del pedido antes y despues de actualizarlo, ``(None, None)``
+            si el pedido no existe
 
             .. code-block:: python
 
-                {
-                    'id': '662d0d325363bbc93a0c027c',
-                    'nombre_pedido': 'SUR Hannover',
-                    'pais': 'Germany',
-                    'ciudad': 'Hannover',
-                    'tipo': 'HOMOG (S)',
-                    'potencia_termica': 0.001,
-                    'estado': 'DECOMMISSIONED',
-                    'fecha_primera_reaccion': '1971-12-09T00:00:00'
-                }
+                (
+                    {
+                        'id': '662d0d325363bbc93a0c027c',
+                        'estado': 'PENDIENTE',
+                        'precio_total': 12000
+                    },
+                    {
+                        'id': '662d0d325363bbc93a0c027c',
+                        'estado': 'ENTREGADO',
+                        'precio_total': 12000
+                    }
+                )
 
         """
         pedido = {
@@ -147,25 +264,34 @@ class PedidoRepository(ABC):
             if valor is not None
         }
 
-        if len(pedido) >= 1:
-            pedido_actualizado = self._session.pedidos.find_one_and_update(
-                {"_id": ObjectId(identificador)},
-                {"$set": pedido},
-                return_document=ReturnDocument.AFTER,
-            )
+        if not pedido:
+            actual = await self.get_by_id(identificador)
+            return actual, actual
 
-        return pedido_actualizado
+        anterior = await self._session.pedidos.find_one_and_update(
+            {"_id": ObjectId(identificador)},
+            {"$set": pedido},
+            return_document=ReturnDocument.BEFORE,
+        )
+        if anterior is None:
+            return None, None
 
-    def delete(self, identificador: str):
+        # ``$set`` solo reemplaza campos de primer nivel, aplicarlo sobre el
+        # documento anterior da el mismo resultado que guardo Mongo.
+        return anterior, {**anterior, **pedido}
+
+    async def delete(self, identificador: str) -> Optional[dict]:
         """Elimina un pedido segun su identificador en la coleccion de pedidos.
 
         Args:
-            identificador (str): Identificador del pedido a actualizar informacion.
+            identificador (str): Identificador del pedido a eliminar.
 
         Returns:
-            Elementos eliminados de la colleccion.
+            Pedido eliminado, ``None`` si no existia o ya lo elimino otra peticion.
 
         """
-        record = self._session.pedidos.delete_one({"_id": ObjectId(identificador)})
+        eliminado = await self._session.pedidos.find_one_and_delete(
+            {"_id": ObjectId(identificador)}
+        )
 
-        return record
+        return eliminado
@@ -2,33 +2,57 @@
     la base de datos."""
 
 # External libraries
-from abc import ABC
+import asyncio
+import re
+from decimal import Decimal
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from bson import ObjectId
 from imagekitio import ImageKit
 from imagekitio.models.UploadFileRequestOptions import UploadFileRequestOptions
+from motor.motor_asyncio import AsyncIOMotorDatabase
 from pymongo import ReturnDocument
-from sqlmodel import Session
 
+from helpers.cache import CacheLRU, incrementar_version
+from helpers.proyeccion import proyectar_documento
+from helpers.texto import normalizar_texto
 from models.productos_model import ProductoModel
+from properties.settings import Settings
+from repositories.base_repositorie import RepositoryBase
 
+# Caches compartidos por todas las instancias del repositorio en el proceso.
+cache_productos = CacheLRU(
+    "productos", Settings.cache_productos_capacidad, Settings.cache_productos_ttl
+)
+cache_paginas_productos = CacheLRU(
+    "paginas_productos",
+    Settings.cache_productos_capacidad,
+    Settings.cache_productos_ttl,
+)
 
-class ProductoRepository(ABC):
+
+class ProductoRepository(RepositoryBase):
     """Repositorio correspondiente a las Ubicaciones de los productos."""
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncIOMotorDatabase) -> None:
         """Crea una nueva instancia del repositorio y la conexion de Mongo.
 
         Args:
-            session: MongoDb session.
+            session: Base de datos de Motor sobre la que se ejecutan las operaciones.
         """
         self._session = session
 
-    def get_by_id(self, identificador: str) -> dict:
+    async def get_by_id(
+        self, identificador: str, proyeccion: Optional[dict] = None
+    ) -> dict:
         """Obtiene la informacion de un producto segun su identificador
 
+        El producto se sirve desde ``cache_productos`` mientras no expire ni se
+        modifique con ``add``, ``update`` o ``delete``.
+
         Args:
             identificador (str): Identificador ObjectId de MongoDb
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
 
         Returns:
             Informacion correspondiente al producto
@@ -47,14 +71,50 @@ class ProductoRepository(ABC):
                 }
 
         """
-        respuesta = self._session.productos.find_one({"_id": ObjectId(identificador)})
+        documento = cache_productos.get(identificador)
+        if documento is None:
+            documento = await self._session.productos.find_one(
+                {"_id": ObjectId(identificador)}
+            )
+            if documento is None:
+                return None
+            cache_productos.set(identificador, documento)
+
+        # Se guarda el documento completo y la proyeccion se aplica en memoria.
+        respuesta = proyectar_documento(documento, proyeccion)
         return respuesta
 
-    def get_list(self) -> list:
-        """Obtener todos los productos registrados en la colleccion de Mongo Db
+    async def get_list(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        proyeccion: Optional[dict] = None,
+        tipo: Optional[str] = None,
+        sub_tipo: Optional[str] = None,
+        precio_min: Optional[Decimal] = None,
+        precio_max: Optional[Decimal] = None,
+        orden: Optional[Tuple[str, int]] = None,
+    ) -> Tuple[list, Optional[str]]:
+        """Obtener una pagina de los productos registrados en Mongo Db
+
+        Las paginas consultadas se guardan en ``cache_paginas_productos`` y se
+        descartan con cualquier escritura sobre la coleccion.
+
+        Los filtros se resuelven en Mongo con los indices ``tipo_sub_tipo_*`` y
+        ``precio``/``nombre`` del registro de indices.
+
+        Args:
+            limit (int): Numero maximo de productos a retornar.
+            after (str): Cursor ``next_cursor`` de la pagina anterior.
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
+            tipo (str): Tipo que deben tener los productos.
+            sub_tipo (str): Sub tipo que deben tener los productos.
+            precio_min (Decimal): Precio minimo (inclusivo) de los productos.
+            precio_max (Decimal): Precio maximo (inclusivo) de los productos.
+            orden (tuple): Campo y direccion (1 o -1) del orden, ``None`` por ``_id``.
 
         Returns:
-            Todos los productos
+            Pagina de productos y cursor de la pagina siguiente
 
             .. code-block:: python
 
@@ -82,11 +142,206 @@ class ProductoRepository(ABC):
                 ]
 
         """
-        productos = self._session.productos.find({})
-        respuesta = list(productos)
-        return respuesta
+        filtro = self._filtro(tipo, sub_tipo, precio_min, precio_max)
+
+        clave = (
+            limit,
+            after,
+            tuple(sorted(proyeccion.items())) if proyeccion else None,
+            tipo,
+            sub_tipo,
+            precio_min,
+            precio_max,
+            orden,
+        )
+        pagina = cache_paginas_productos.get(clave)
+        if pagina is None:
+            pagina = await self._paginar(
+                self._session.productos, filtro, limit, after, proyeccion, orden
+            )
+            cache_paginas_productos.set(clave, pagina)
+
+        documentos, next_cursor = pagina
+        return [dict(documento) for documento in documentos], next_cursor
+
+    async def get_facetas(
+        self,
+        tipo: Optional[str] = None,
+        sub_tipo: Optional[str] = None,
+        precio_min: Optional[Decimal] = None,
+        precio_max: Optional[Decimal] = None,
+    ) -> dict:
+        """Cuenta los productos por ``tipo`` y por ``tipo``/``sub_tipo``.
+
+        Los conteos se calculan con una sola agregacion ``$facet`` y se guardan en
+        ``cache_paginas_productos`` hasta la siguiente escritura sobre la
+        coleccion.
+
+        Args:
+            tipo (str): Tipo que deben tener los productos.
+            sub_tipo (str): Sub tipo que deben tener los productos.
+            precio_min (Decimal): Precio minimo (inclusivo) de los productos.
+            precio_max (Decimal): Precio maximo (inclusivo) de los productos.
+
+        Returns:
+            Total de productos y conteos ordenados por tipo y sub tipo
+
+            .. code-block:: python
+
+                {
+                    'total': 3,
+                    'tipos': [{'tipo': 'Lacteo', 'total': 3}],
+                    'sub_tipos': [
+                        {'tipo': 'Lacteo', 'sub_tipo': 'Leche', 'total': 2},
+                        {'tipo': 'Lacteo', 'sub_tipo': 'Queso', 'total': 1}
+                    ]
+                }
+
+        """
+        clave = ("facetas", tipo, sub_tipo, precio_min, precio_max)
+        facetas = cache_paginas_productos.get(clave)
+        if facetas is not None:
+            return facetas
+
+        pipeline = [
+            {"$match": self._filtro(tipo, sub_tipo, precio_min, precio_max)},
+            {
+                "$facet": {
+                    "total": [{"$count": "total"}],
+                    "tipos": [
+                        {"$group": {"_id": "$tipo", "total": {"$sum": 1}}},
+                        {"$sort": {"_id": 1}},
+                        {"$project": {"_id": 0, "tipo": "$_id", "total": 1}},
+                    ],
+                    "sub_tipos": [
+                        {
+                            "$group": {
+                                "_id": {"tipo": "$tipo", "sub_tipo": "$sub_tipo"},
+                                "total": {"$sum": 1},
+                            }
+                        },
+                        {"$sort": {"_id.tipo": 1, "_id.sub_tipo": 1}},
+                        {
+                            "$project": {
+                                "_id": 0,
+                                "tipo": "$_id.tipo",
+                                "sub_tipo": "$_id.sub_tipo",
+                                "total": 1,
+                            }
+                        },
+                    ],
+                }
+            },
+        ]
+        resultado = await self._session.productos.aggregate(pipeline).to_list(length=1)
+
+        total = resultado[0]["total"]
+        facetas = {
+            "total": total[0]["total"] if total else 0,
+            "tipos": resultado[0]["tipos"],
+            "sub_tipos": resultado[0]["sub_tipos"],
+        }
+        cache_paginas_productos.set(clave, facetas)
+        return facetas
+
+    async def buscar(
+        self, texto: str, limit: int, proyeccion: Optional[dict] = None
+    ) -> List[dict]:
+        """Busca los productos cuyo nombre empieza por un texto.
+
+        La comparacion se hace sobre ``nombre_normalizado`` (minusculas y sin
+        tildes), el prefijo se resuelve como un rango del indice
+        ``nombre_normalizado``. Los resultados se guardan en
+        ``cache_paginas_productos`` para las busquedas repetidas del autocompletado.
+
+        Args:
+            texto (str): Inicio del nombre de los productos.
+            limit (int): Numero maximo de productos a retornar.
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
+
+        Returns:
+            Productos ordenados por nombre, vacio si el texto esta en blanco.
+
+        """
+        prefijo = normalizar_texto(texto)
+        if not prefijo:
+            return []
+
+        clave = (
+            "buscar",
+            prefijo,
+            limit,
+            tuple(sorted(proyeccion.items())) if proyeccion else None,
+        )
+        documentos = cache_paginas_productos.get(clave)
+        if documentos is None:
+            documentos = (
+                await self._session.productos.find(
+                    {"nombre_normalizado": {"$regex": f"^{re.escape(prefijo)}"}},
+                    proyeccion,
+                )
+                .sort([("nombre_normalizado", 1), ("_id", 1)])
+                .limit(limit)
+                .to_list(length=limit)
+            )
+            cache_paginas_productos.set(clave, documentos)
 
-    def add(self, record: ProductoModel) -> dict:
+        return [dict(documento) for documento in documentos]
+
+    async def get_many(
+        self, identificadores: List[str], proyeccion: Optional[dict] = None
+    ) -> Tuple[List[dict], List[str]]:
+        """Obtiene varios productos por ``_id`` con una sola consulta a Mongo.
+
+        Los productos que estan en ``cache_productos`` no se consultan, los demas
+        se traen con un ``$in`` y se agregan al cache.
+
+        Args:
+            identificadores (List[str]): Identificadores ObjectId de MongoDb.
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
+
+        Returns:
+            Productos en el orden de ``identificadores`` e identificadores que no
+            existen en la coleccion.
+
+        """
+        documentos = {}
+        pendientes = []
+        for identificador in dict.fromkeys(identificadores):
+            documento = cache_productos.get(identificador)
+            if documento is None:
+                pendientes.append(identificador)
+            else:
+                documentos[identificador] = documento
+
+        if pendientes:
+            nuevos = await self._obtener_varios(self._session.productos, pendientes)
+            for identificador, documento in nuevos.items():
+                cache_productos.set(identificador, documento)
+            documentos.update(nuevos)
+
+        encontrados, faltantes = self._ordenar_por_identificador(
+            identificadores, documentos
+        )
+        respuesta = [
+            proyectar_documento(documento, proyeccion) for documento in encontrados
+        ]
+        return respuesta, faltantes
+
+    async def iter_all(self, batch_size: int) -> AsyncIterator[dict]:
+        """Recorre todos los productos de la colleccion por lotes para exportarlos.
+
+        Args:
+            batch_size (int): Numero de productos que se traen de Mongo por lote.
+
+        Returns:
+            Iterador asincrono con los productos ordenados por ``_id``.
+
+        """
+        async for documento in self._iterar(self._session.productos, {}, batch_size):
+            yield documento
+
+    async def add(self, record: ProductoModel) -> dict:
         """Crea un nuevo registro en la coreccion de productos
 
         Args:
@@ -116,7 +371,10 @@ class ProductoRepository(ABC):
             url_endpoint="https://ik.imagekit.io/muk5lqji5",
         )
 
-        upload = imagekit.upload_file(
+        # El SDK de ImageKit es sincrono, se ejecuta en un hilo para no bloquear
+        # el event loop mientras se sube la imagen.
+        upload = await asyncio.to_thread(
+            imagekit.upload_file,
             file=record.imagen,
             file_name=f"{record.imagen[0:10]}.png",
         )
@@ -125,16 +383,44 @@ class ProductoRepository(ABC):
         imagen_url = upload.response_metadata.raw.get("url")
         record.imagen = imagen_url
 
-        nuevo_producto = self._session.productos.insert_one(
-            record.model_dump(by_alias=True, exclude=["id"])
-        )
-        producto_creado = self._session.productos.find_one(
-            {"_id": nuevo_producto.inserted_id}
-        )
+        producto_creado = record.model_dump(by_alias=True, exclude=["id"])
+        producto_creado["nombre_normalizado"] = normalizar_texto(record.nombre)
+        nuevo_producto = await self._session.productos.insert_one(producto_creado)
+        # Se arma la respuesta con el documento insertado para evitar una
+        # segunda consulta a Mongo.
+        producto_creado["_id"] = nuevo_producto.inserted_id
+        self._invalidar_cache()
 
         return producto_creado
 
-    def update(self, identificador: str, record: ProductoModel) -> dict:
+    async def add_many(
+        self, records: List[ProductoModel]
+    ) -> Tuple[List[Optional[str]], Dict[int, str]]:
+        """Crea varios registros en la coleccion de productos con una sola escritura.
+
+        A diferencia de ``add`` la imagen no se sube a ImageKit, se guarda la
+        url recibida en ``imagen``.
+
+        Args:
+            records (List[ProductoModel]): productos a agregar a la colleccion.
+
+        Returns:
+            Identificador de cada producto creado (``None`` si fallo) y errores por
+            posicion en ``records``.
+
+        """
+        documentos = [
+            {
+                **record.model_dump(by_alias=True, exclude=["id"]),
+                "nombre_normalizado": normalizar_texto(record.nombre),
+            }
+            for record in records
+        ]
+        respuesta = await self._insertar_muchos(self._session.productos, documentos)
+        self._invalidar_cache()
+        return respuesta
+
+    async def update(self, identificador: str, record: ProductoModel) -> dict:
         """Actualiza informacion de un producto segun su identificador.
 
         Args:
@@ -163,17 +449,20 @@ class ProductoRepository(ABC):
             for clave, valor in record.model_dump(by_alias=True).items()
             if valor is not None
         }
+        if "nombre" in producto:
+            producto["nombre_normalizado"] = normalizar_texto(producto["nombre"])
 
         if len(producto) >= 1:
-            producto_actualizado = self._session.productos.find_one_and_update(
+            producto_actualizado = await self._session.productos.find_one_and_update(
                 {"_id": ObjectId(identificador)},
                 {"$set": producto},
                 return_document=ReturnDocument.AFTER,
             )
+            self._invalidar_cache(identificador)
 
         return producto_actualizado
 
-    def delete(self, identificador: str):
+    async def delete(self, identificador: str):
         """Elimina un producto segun su identificador en la coleccion de productos.
 
         Args:
@@ -183,6 +472,48 @@ class ProductoRepository(ABC):
             Elementos eliminados de la colleccion.
 
         """
-        record = self._session.productos.delete_one({"_id": ObjectId(identificador)})
+        record = await self._session.productos.delete_one(
+            {"_id": ObjectId(identificador)}
+        )
+        self._invalidar_cache(identificador)
 
         return record
+
+    @staticmethod
+    def _filtro(
+        tipo: Optional[str],
+        sub_tipo: Optional[str],
+        precio_min: Optional[Decimal],
+        precio_max: Optional[Decimal],
+    ) -> dict:
+        """Arma el filtro de Mongo de los parametros de consulta de productos."""
+        filtro = {}
+        if tipo is not None:
+            filtro["tipo"] = tipo
+        if sub_tipo is not None:
+            filtro["sub_tipo"] = sub_tipo
+
+        rango = {}
+        if precio_min is not None:
+            rango["$gte"] = precio_min
+        if precio_max is not None:
+            rango["$lte"] = precio_max
+        if rango:
+            filtro["precio"] = rango
+        return filtro
+
+    def _invalidar_cache(self, identificador: Optional[str] = None) -> None:
+        """Elimina del cache el producto modificado y todas las paginas guardadas.
+
+        Tambien aumenta la version de la coleccion para descartar los reportes
+        calculados con los productos anteriores.
+
+        Args:
+            identificador (str): Identificador del producto modificado, ``None``
+                cuando solo se agregaron productos.
+
+        """
+        if identificador is not None:
+            cache_productos.invalidar(identificador)
+        cache_paginas_productos.limpiar()
+        incrementar_version("productos")
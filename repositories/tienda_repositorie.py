@@ -2,31 +2,38 @@
     la base de datos."""
 
 # External libraries
-from abc import ABC
+from typing import AsyncIterator, List, Optional, Tuple
 
 from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
 from pymongo import ReturnDocument
-from sqlmodel import Session
 
 from models.tiendas_model import TiendaModel
+from repositories.base_repositorie import RepositoryBase
 
 
-class TiendaRepository(ABC):
+class TiendaRepository(RepositoryBase):
     """Repositorio correspondiente a las Ubicaciones de los tiendas."""
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncIOMotorDatabase) -> None:
         """Crea una nueva instancia del repositorio y la conexion de Mongo.
 
         Args:
-            session: MongoDb session.
+            session: Base de datos de Motor sobre la que se ejecutan las operaciones.
         """
         self._session = session
 
-    def get_by_id(self, identificador: str) -> dict:
-        """Obtiene la informacion de un tienda segun su identificador
+    async def get_by_id(
+        self, identificador: str, proyeccion: Optional[dict] = None
+    ) -> dict:
+        """Obtiene la informacion de un tienda segun el usuario tendero
+
+        A diferencia de ``get_many`` la tienda se busca por ``id_usuario_tendero``
+        y no por su ``_id``.
 
         Args:
-            identificador (str): Identificador ObjectId de MongoDb
+            identificador (str): Identificador del usuario tendero de la tienda.
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
 
         Returns:
             Informacion correspondiente al tienda
@@ -45,13 +52,22 @@ class TiendaRepository(ABC):
                 }
 
         """
-        return self._session.tiendas.find_one({"id_usuario_tendero": identificador})
+        return await self._session.tiendas.find_one(
+            {"id_usuario_tendero": identificador}, proyeccion
+        )
 
-    def get_list(self) -> list:
-        """Obtener todos los tiendas registrados en la colleccion de Mongo Db
+    async def get_list(
+        self, limit: int, after: Optional[str] = None, proyeccion: Optional[dict] = None
+    ) -> Tuple[list, Optional[str]]:
+        """Obtener una pagina de los tiendas registrados en Mongo Db
+
+        Args:
+            limit (int): Numero maximo de tiendas a retornar.
+            after (str): Cursor ``next_cursor`` de la pagina anterior.
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
 
         Returns:
-            Todos los tiendas
+            Pagina de tiendas y cursor de la pagina siguiente
 
             .. code-block:: python
 
@@ -79,11 +95,49 @@ class TiendaRepository(ABC):
                 ]
 
         """
-        tiendas = self._session.tiendas.find({})
-        respuesta = list(tiendas)
+        respuesta = await self._paginar(
+            self._session.tiendas, {}, limit, after, proyeccion
+        )
         return respuesta
 
-    def add(self, record: TiendaModel) -> dict:
+    async def get_many(
+        self, identificadores: List[str], proyeccion: Optional[dict] = None
+    ) -> Tuple[List[dict], List[str]]:
+        """Obtiene varios tiendas por ``_id`` con una sola consulta a Mongo.
+
+        Se buscan por el ``_id`` de la tienda, el mismo que guardan los pedidos e
+        inventarios en ``id_tienda``, y no por el usuario tendero como
+        ``get_by_id``.
+
+        Args:
+            identificadores (List[str]): ``_id`` ObjectId de las tiendas.
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
+
+        Returns:
+            Tiendas en el orden de ``identificadores`` e identificadores
+            que no existen en la coleccion.
+
+        """
+        documentos = await self._obtener_varios(
+            self._session.tiendas, identificadores, proyeccion
+        )
+        respuesta = self._ordenar_por_identificador(identificadores, documentos)
+        return respuesta
+
+    async def iter_all(self, batch_size: int) -> AsyncIterator[dict]:
+        """Recorre todos los tiendas de la colleccion por lotes para exportarlos.
+
+        Args:
+            batch_size (int): Numero de tiendas que se traen de Mongo por lote.
+
+        Returns:
+            Iterador asincrono con los tiendas ordenados por ``_id``.
+
+        """
+        async for documento in self._iterar(self._session.tiendas, {}, batch_size):
+            yield documento
+
+    async def add(self, record: TiendaModel) -> dict:
         """Crea un nuevo registro en la coreccion de tiendas
 
         Args:
@@ -111,16 +165,15 @@ class TiendaRepository(ABC):
 
         """
 
-        nueva_tienda = self._session.tiendas.insert_one(
-            record.model_dump(by_alias=True, exclude=["id"])
-        )
-        tienda_creado = self._session.tiendas.find_one(
-            {"_id": nueva_tienda.inserted_id}
-        )
+        tienda_creado = record.model_dump(by_alias=True, exclude=["id"])
+        nueva_tienda = await self._session.tiendas.insert_one(tienda_creado)
+        # Se arma la respuesta con el documento insertado para evitar una
+        # segunda consulta a Mongo.
+        tienda_creado["_id"] = nueva_tienda.inserted_id
 
         return tienda_creado
 
-    def update(self, identificador: str, record: TiendaModel) -> dict:
+    async def update(self, identificador: str, record: TiendaModel) -> dict:
         """Actualiza informacion de un tienda segun su identificador.
 
         Args:
@@ -151,7 +204,7 @@ class TiendaRepository(ABC):
         }
 
         if len(tienda) >= 1:
-            tienda_actualizado = self._session.tiendas.find_one_and_update(
+            tienda_actualizado = await self._session.tiendas.find_one_and_update(
                 {"_id": ObjectId(identificador)},
                 {"$set": tienda},
                 return_document=ReturnDocument.AFTER,
@@ -159,7 +212,7 @@ class TiendaRepository(ABC):
 
         return tienda_actualizado
 
-    def delete(self, identificador: str):
+    async def delete(self, identificador: str):
         """Elimina un tienda segun su identificador en la coleccion de tiendas.
 
         Args:
@@ -169,6 +222,8 @@ class TiendaRepository(ABC):
             Elementos eliminados de la colleccion.
 
         """
-        record = self._session.tiendas.delete_one({"_id": ObjectId(identificador)})
+        record = await self._session.tiendas.delete_one(
+            {"_id": ObjectId(identificador)}
+        )
 
         return record
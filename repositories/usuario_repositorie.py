@@ -2,31 +2,38 @@
     la base de datos."""
 
 # External libraries
-from abc import ABC
+from typing import AsyncIterator, List, Optional, Tuple
 
 from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
 from pymongo import ReturnDocument
-from sqlmodel import Session
 
+from contexts.indices import COLACION_EMAIL
+from contexts.procesos import ejecutar_en_proceso
+from helpers.seguridad import hashear_password
 from models.usuarios_model import UsuarioModel
+from repositories.base_repositorie import RepositoryBase
 
 
-class UsuarioRepository(ABC):
+class UsuarioRepository(RepositoryBase):
     """Repositorio correspondiente a las Ubicaciones de los usuarios."""
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncIOMotorDatabase) -> None:
         """Crea una nueva instancia del repositorio y la conexion de Mongo.
 
         Args:
-            session: MongoDb session.
+            session: Base de datos de Motor sobre la que se ejecutan las operaciones.
         """
         self._session = session
 
-    def get_by_id(self, identificador: str) -> dict:
+    async def get_by_id(
+        self, identificador: str, proyeccion: Optional[dict] = None
+    ) -> dict:
         """Obtiene la informacion de un usuario segun su identificador
 
         Args:
             identificador (str): Identificador ObjectId de MongoDb
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
 
         Returns:
             Informacion correspondiente al usuario
@@ -45,15 +52,60 @@ class UsuarioRepository(ABC):
                 }
 
         """
-        # respuesta = self._session.usuarios.find_one({"_id": ObjectId(identificador)})
-        respuesta = self._session.usuarios.find_one({"email": identificador})
+        respuesta = await self._session.usuarios.find_one(
+            {"_id": ObjectId(identificador)}, proyeccion
+        )
+        return respuesta
+
+    async def get_by_email(self, email: str) -> Optional[dict]:
+        """Obtiene el usuario registrado con un email, incluido su password.
+
+        El email se compara sin distinguir mayusculas con el indice
+        ``email_unico``.
+
+        Args:
+            email (str): Email del usuario.
+
+        Returns:
+            Informacion del usuario, ``None`` si no existe.
+
+        """
+        respuesta = await self._session.usuarios.find_one(
+            {"email": email}, collation=COLACION_EMAIL
+        )
         return respuesta
 
-    def get_list(self) -> list:
-        """Obtener todos los usuarios registrados en la colleccion de Mongo Db
+    async def reemplazar_password(
+        self, identificador: str, anterior: str, nuevo: str
+    ) -> None:
+        """Reemplaza el password guardado de un usuario si no ha cambiado.
+
+        Se usa para actualizar el hash de un password con los parametros actuales
+        al iniciar sesion.
+
+        Args:
+            identificador (str): Identificador del usuario.
+            anterior (str): Valor de ``password`` leido al iniciar sesion.
+            nuevo (str): Nuevo hash del password.
+
+        """
+        await self._session.usuarios.update_one(
+            {"_id": ObjectId(identificador), "password": anterior},
+            {"$set": {"password": nuevo}},
+        )
+
+    async def get_list(
+        self, limit: int, after: Optional[str] = None, proyeccion: Optional[dict] = None
+    ) -> Tuple[list, Optional[str]]:
+        """Obtener una pagina de los usuarios registrados en Mongo Db
+
+        Args:
+            limit (int): Numero maximo de usuarios a retornar.
+            after (str): Cursor ``next_cursor`` de la pagina anterior.
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
 
         Returns:
-            Todos los usuarios
+            Pagina de usuarios y cursor de la pagina siguiente
 
             .. code-block:: python
 
@@ -81,13 +133,54 @@ class UsuarioRepository(ABC):
                 ]
 
         """
-        usuarios = self._session.usuarios.find({})
-        respuesta = list(usuarios)
+        respuesta = await self._paginar(
+            self._session.usuarios, {}, limit, after, proyeccion
+        )
+        return respuesta
+
+    async def get_many(
+        self, identificadores: List[str], proyeccion: Optional[dict] = None
+    ) -> Tuple[List[dict], List[str]]:
+        """Obtiene varios usuarios por ``_id`` con una sola consulta a Mongo.
+
+        Args:
+            identificadores (List[str]): Identificadores ObjectId de MongoDb.
+            proyeccion (dict): Campos a retornar, ``None`` para todos.
+
+        Returns:
+            Usuarios en el orden de ``identificadores`` e identificadores
+            que no existen en la coleccion.
+
+        """
+        documentos = await self._obtener_varios(
+            self._session.usuarios, identificadores, proyeccion
+        )
+        respuesta = self._ordenar_por_identificador(identificadores, documentos)
         return respuesta
 
-    def add(self, record: UsuarioModel) -> dict:
+    async def iter_all(self, batch_size: int) -> AsyncIterator[dict]:
+        """Recorre todos los usuarios de la colleccion por lotes para exportarlos.
+
+        Args:
+            batch_size (int): Numero de usuarios que se traen de Mongo por lote.
+
+        Returns:
+            Iterador asincrono con los usuarios ordenados por ``_id``, sin el
+            ``password``.
+
+        """
+        # El password no se exporta, se excluye en Mongo para no transferirlo.
+        async for documento in self._iterar(
+            self._session.usuarios, {}, batch_size, {"password": 0}
+        ):
+            yield documento
+
+    async def add(self, record: UsuarioModel) -> dict:
         """Crea un nuevo registro en la coreccion de usuarios
 
+        El email no se consulta antes de insertar, el indice unico ``email_unico``
+        rechaza los emails repetidos sin distinguir mayusculas.
+
         Args:
             record (UsuarioModel): informacion del usuario a agregar a la colleccion
 
@@ -110,16 +203,22 @@ class UsuarioRepository(ABC):
 
         """
 
-        nuevo_usuario = self._session.usuarios.insert_one(
-            record.model_dump(by_alias=True, exclude=["id"])
-        )
-        usuario_creado = self._session.usuarios.find_one(
-            {"_id": nuevo_usuario.inserted_id}
-        )
+        usuario_creado = record.model_dump(by_alias=True, exclude=["id"])
+        if record.password:
+            # scrypt consume CPU, se ejecuta en el pool de procesos para no
+            # bloquear el event loop.
+            usuario_creado["password"] = await ejecutar_en_proceso(
+                hashear_password, record.password
+            )
+        nuevo_usuario = await self._session.usuarios.insert_one(usuario_creado)
+        # Se arma la respuesta con el documento insertado para evitar una
+        # segunda consulta a Mongo.
+        usuario_creado["_id"] = nuevo_usuario.inserted_id
+        usuario_creado.pop("password", None)
 
         return usuario_creado
 
-    def update(self, identificador: str, record: UsuarioModel) -> dict:
+    async def update(self, identificador: str, record: UsuarioModel) -> dict:
         """Actualiza informacion de un usuario segun su identificador.
 
         Args:
@@ -149,16 +248,22 @@ class UsuarioRepository(ABC):
             if valor is not None
         }
 
+        if "password" in usuario:
+            usuario["password"] = await ejecutar_en_proceso(
+                hashear_password, usuario["password"]
+            )
+
         if len(usuario) >= 1:
-            usuario_actualizado = self._session.usuarios.find_one_and_update(
+            usuario_actualizado = await self._session.usuarios.find_one_and_update(
                 {"_id": ObjectId(identificador)},
                 {"$set": usuario},
+                {"password": 0},
                 return_document=ReturnDocument.AFTER,
             )
 
         return usuario_actualizado
 
-    def delete(self, identificador: str):
+    async def delete(self, identificador: str):
         """Elimina un usuario segun su identificador en la coleccion de usuarios.
 
         Args:
@@ -168,6 +273,8 @@ class UsuarioRepository(ABC):
             Elementos eliminados de la colleccion.
 
         """
-        record = self._session.usuarios.delete_one({"_id": ObjectId(identificador)})
+        record = await self._session.usuarios.delete_one(
+            {"_id": ObjectId(identificador)}
+        )
 
         return record
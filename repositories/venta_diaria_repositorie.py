@@ -0,0 +1,152 @@
+"""Modulo con las clases correspondientes al repository de la tabla VENTAS_DIARIAS
+    en la base de datos."""
+
+# External libraries
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Any, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+# Own libraries
+from models.pedidos_model import convertir_productos_legado
+from repositories.base_repositorie import RepositoryBase
+
+# Prefijo ``YYYY-MM-DD`` de ``fecha_creacion`` que identifica el dia del pedido.
+_DIA = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+
+def _decimal(valor: Any, defecto: Decimal) -> Decimal:
+    """Convierte un precio o una cantidad guardada en Mongo a ``Decimal``."""
+    if valor is None:
+        return defecto
+    try:
+        return Decimal(str(valor).strip() or defecto)
+    except InvalidOperation:
+        return defecto
+
+
+def calcular_venta(pedido: Optional[dict]) -> Optional[Tuple[dict, dict]]:
+    """Calcula el aporte de un pedido al resumen de ventas de su tienda y dia.
+
+    Args:
+        pedido: Documento del pedido leido de Mongo, ``None`` si no existe.
+
+    Returns:
+        Clave ``{id_tienda, dia}`` del resumen y valores que suma el pedido,
+        ``None`` si el pedido no tiene tienda o fecha de creacion valida.
+    """
+    if not pedido or not pedido.get("id_tienda"):
+        return None
+    dia = _DIA.match(str(pedido.get("fecha_creacion") or ""))
+    if dia is None:
+        return None
+
+    lineas = convertir_productos_legado(pedido.get("productos")) or []
+    unidades = sum(int(_decimal(linea.get("cantidad"), Decimal(1))) for linea in lineas)
+    clave = {"id_tienda": str(pedido["id_tienda"]), "dia": dia.group()}
+    valores = {
+        "pedidos": 1,
+        "unidades": unidades,
+        "ingresos": _decimal(pedido.get("precio_total"), Decimal(0)),
+    }
+    return clave, valores
+
+
+class VentaDiariaRepository(RepositoryBase):
+    """Repositorio del resumen de ventas por tienda y dia.
+
+    Cada documento acumula los pedidos, unidades e ingresos de una tienda en un
+    dia y se actualiza con ``$inc`` cada vez que se crea, modifica o elimina un
+    pedido, de esta forma los reportes leen un registro por dia en lugar de
+    recorrer los pedidos.
+    """
+
+    def __init__(self, session: AsyncIOMotorDatabase) -> None:
+        """Crea una nueva instancia del repositorio y la conexion de Mongo.
+
+        Args:
+            session: Base de datos de Motor sobre la que se ejecutan las operaciones.
+        """
+        self._session = session
+
+    async def get_list(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        id_tienda: Optional[str] = None,
+        desde: Optional[str] = None,
+        hasta: Optional[str] = None,
+    ) -> Tuple[list, Optional[str]]:
+        """Obtener una pagina del resumen de ventas ordenado por dia
+
+        Args:
+            limit (int): Numero maximo de registros a retornar.
+            after (str): Cursor ``next_cursor`` de la pagina anterior.
+            id_tienda (str): Tienda a consultar, ``None`` para todas.
+            desde (str): Dia ``YYYY-MM-DD`` inicial (inclusivo).
+            hasta (str): Dia ``YYYY-MM-DD`` final (exclusivo).
+
+        Returns:
+            Pagina del resumen y cursor de la pagina siguiente
+
+            .. code-block:: python
+
+                [
+                    {
+                      'id': '6717c43ef963e95aa4789300',
+                      'id_tienda': '662d0d325363bbc93a0c0296',
+                      'dia': '2024-10-22',
+                      'pedidos': 42,
+                      'unidades': 130,
+                      'ingresos': Decimal('840000')
+                    }
+                ]
+
+        """
+        filtro = {}
+        if id_tienda is not None:
+            filtro["id_tienda"] = id_tienda
+        rango = {}
+        if desde is not None:
+            rango["$gte"] = desde
+        if hasta is not None:
+            rango["$lt"] = hasta
+        if rango:
+            filtro["dia"] = rango
+
+        respuesta = await self._paginar(
+            self._session.ventas_diarias, filtro, limit, after, orden=("dia", 1)
+        )
+        return respuesta
+
+    async def registrar(self, anterior: Optional[dict], actual: Optional[dict]) -> None:
+        """Aplica al resumen el cambio de un pedido.
+
+        Se resta el aporte de la version anterior del pedido y se suma el de la
+        actual, ``None`` en ``anterior`` para un pedido creado y en ``actual``
+        para uno eliminado. Los registros del resumen se crean con ``upsert``.
+
+        Args:
+            anterior (dict): Pedido antes del cambio.
+            actual (dict): Pedido despues del cambio.
+        """
+        venta_anterior = calcular_venta(anterior)
+        venta_actual = calcular_venta(actual)
+        if venta_anterior == venta_actual:
+            return
+
+        # Si el pedido sigue en la misma tienda y dia se aplica solo la diferencia.
+        incrementos = {}
+        for venta, signo in ((venta_anterior, -1), (venta_actual, 1)):
+            if venta is None:
+                continue
+            clave, valores = venta
+            acumulado = incrementos.setdefault(tuple(clave.items()), {})
+            for campo, valor in valores.items():
+                acumulado[campo] = acumulado.get(campo, 0) + valor * signo
+
+        for clave, valores in incrementos.items():
+            await self._session.ventas_diarias.update_one(
+                dict(clave), {"$inc": valores}, upsert=True
+            )
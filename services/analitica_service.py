@@ -0,0 +1,234 @@
+"""Modulo con los servicios de reportes de ventas calculados con pandas"""
+
+# External libraries
+import asyncio
+from decimal import Decimal
+from typing import Callable, List, Optional
+
+import pandas as pd
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+# Own libraries
+from models.pedidos_model import convertir_productos_legado
+from properties.settings import Settings
+from repositories.pedido_repositorie import PedidoRepository
+from repositories.venta_diaria_repositorie import VentaDiariaRepository
+from services.base_service import ServiceBase
+
+_CENTAVOS = Decimal("0.01")
+
+
+def _a_centavos(valores: pd.Series) -> pd.Series:
+    """Convierte una columna de montos leidos de Mongo a centavos enteros.
+
+    Los montos se agregan como ``int64`` en centavos, con float64 la suma de
+    muchos pedidos acumula errores de redondeo y con ``Decimal`` la agregacion
+    deja de ser vectorizada. Los ausentes o no numericos cuentan como cero.
+    """
+    numeros = pd.to_numeric(valores, errors="coerce")
+    # Solo los valores que ``to_numeric`` no reconoce (``Decimal128`` leido sin el
+    # codec del cliente) se convierten pasando por texto.
+    pendientes = numeros.isna() & valores.notna()
+    if pendientes.any():
+        numeros[pendientes] = pd.to_numeric(
+            valores[pendientes].astype(str), errors="coerce"
+        )
+    numeros = numeros.where(numeros.abs() != float("inf"))
+    return (numeros * 100).round().fillna(0).astype("int64")
+
+
+def _a_dinero(centavos: pd.Series) -> List[Decimal]:
+    """Convierte los centavos del reporte ya agregado a ``Decimal``."""
+    return [Decimal(int(valor)).scaleb(-2) for valor in centavos]
+
+
+def _promedio(centavos: pd.Series, pedidos: pd.Series) -> List[Decimal]:
+    """Ingresos divididos por el numero de pedidos redondeado a centavos."""
+    return [
+        (
+            (Decimal(int(total)) / int(numero)).scaleb(-2).quantize(_CENTAVOS)
+            if numero
+            else Decimal(0).scaleb(-2)
+        )
+        for total, numero in zip(centavos, pedidos)
+    ]
+
+
+def _ventas_tienda_dia(pedidos: List[dict]) -> pd.DataFrame:
+    """Ingresos en centavos y numero de pedidos por tienda y dia de un lote."""
+    df = pd.DataFrame.from_records(
+        pedidos, columns=["id_tienda", "fecha_creacion", "precio_total"]
+    )
+    df["dia"] = pd.to_datetime(
+        df["fecha_creacion"], errors="coerce", format="ISO8601"
+    ).dt.normalize()
+    df["precio_total"] = _a_centavos(df["precio_total"])
+    return df.groupby(["id_tienda", "dia"]).agg(
+        ingresos=("precio_total", "sum"), pedidos=("precio_total", "size")
+    )
+
+
+def _ventas_tienda(pedidos: List[dict]) -> pd.DataFrame:
+    """Ingresos en centavos y numero de pedidos por tienda de un lote."""
+    df = pd.DataFrame.from_records(pedidos, columns=["id_tienda", "precio_total"])
+    df["precio_total"] = _a_centavos(df["precio_total"])
+    return df.groupby("id_tienda").agg(
+        ingresos=("precio_total", "sum"), pedidos=("precio_total", "size")
+    )
+
+
+def _productos_vendidos(pedidos: List[dict]) -> pd.DataFrame:
+    """Unidades, ingresos en centavos y pedidos por producto de un lote."""
+    productos = pd.DataFrame.from_records(pedidos, columns=["productos"])["productos"]
+    lineas = productos.map(convertir_productos_legado).explode().dropna()
+    lineas = pd.DataFrame(lineas.tolist()).reindex(
+        columns=["id_producto", "cantidad", "precio_unitario"]
+    )
+
+    cantidad = pd.to_numeric(lineas["cantidad"], errors="coerce").fillna(1)
+    ingresos = (cantidad * _a_centavos(lineas["precio_unitario"])).round()
+    lineas = lineas.assign(cantidad=cantidad, ingresos=ingresos.astype("int64"))
+    return lineas.groupby("id_producto").agg(
+        unidades=("cantidad", "sum"),
+        ingresos=("ingresos", "sum"),
+        pedidos=("cantidad", "size"),
+    )
+
+
+class AnaliticaService(ServiceBase):
+    def __init__(self, cursor: Callable[[], AsyncIOMotorDatabase]) -> None:
+        """Crea una nueva instancia del servicio de reportes
+
+        Args:
+            cursor: Cursor para ejecutar operaciones sobre la base de datos.
+        """
+        self._cursor = cursor
+
+    async def __aenter__(self):
+        self._cursor = self._cursor()
+        self.pedidos_repository = PedidoRepository(self._cursor)
+        self.ventas_diarias_repository = VentaDiariaRepository(self._cursor)
+        return await super().__aenter__()
+
+    async def ventas_tienda_dia(
+        self, desde: Optional[str] = None, hasta: Optional[str] = None
+    ) -> List[dict]:
+        """Calcula los ingresos, pedidos y ticket promedio por tienda y dia.
+
+        Args:
+            desde: Fecha ISO inicial (inclusiva) de creacion de los pedidos.
+            hasta: Fecha ISO final (exclusiva) de creacion de los pedidos.
+
+        Returns:
+            Ventas de cada tienda por dia ordenadas por tienda y dia.
+        """
+        ventas = await self._agregar_por_lotes(
+            desde,
+            hasta,
+            {"_id": 0, "id_tienda": 1, "fecha_creacion": 1, "precio_total": 1},
+            _ventas_tienda_dia,
+        )
+        ventas = ventas.reset_index()
+        ventas["dia"] = ventas["dia"].dt.strftime("%Y-%m-%d")
+        ventas["ticket_promedio"] = _promedio(ventas["ingresos"], ventas["pedidos"])
+        ventas["ingresos"] = _a_dinero(ventas["ingresos"])
+        return ventas.to_dict("records")
+
+    async def ticket_promedio(
+        self, desde: Optional[str] = None, hasta: Optional[str] = None
+    ) -> List[dict]:
+        """Calcula el ticket promedio (ingresos / pedidos) general y por tienda.
+
+        Args:
+            desde: Fecha ISO inicial (inclusiva) de creacion de los pedidos.
+            hasta: Fecha ISO final (exclusiva) de creacion de los pedidos.
+
+        Returns:
+            Ticket promedio general (``id_tienda`` en ``None``) seguido del de cada
+            tienda de mayor a menor ingreso.
+        """
+        ventas = await self._agregar_por_lotes(
+            desde,
+            hasta,
+            {"_id": 0, "id_tienda": 1, "precio_total": 1},
+            _ventas_tienda,
+        )
+        ventas = ventas.sort_values("ingresos", ascending=False).reset_index()
+        general = pd.DataFrame(
+            [
+                {
+                    "id_tienda": None,
+                    "ingresos": ventas["ingresos"].sum(),
+                    "pedidos": ventas["pedidos"].sum(),
+                }
+            ]
+        )
+        ventas = pd.concat([general, ventas], ignore_index=True)
+        ventas["ticket_promedio"] = _promedio(ventas["ingresos"], ventas["pedidos"])
+        ventas["ingresos"] = _a_dinero(ventas["ingresos"])
+        ventas = ventas.astype({"id_tienda": object})
+        ventas["id_tienda"] = ventas["id_tienda"].where(
+            ventas["id_tienda"].notna(), None
+        )
+        return ventas.to_dict("records")
+
+    async def productos_mas_vendidos(
+        self, top: int, desde: Optional[str] = None, hasta: Optional[str] = None
+    ) -> List[dict]:
+        """Obtiene los productos con mas unidades vendidas.
+
+        Args:
+            top: Numero de productos a retornar.
+            desde: Fecha ISO inicial (inclusiva) de creacion de los pedidos.
+            hasta: Fecha ISO final (exclusiva) de creacion de los pedidos.
+
+        Returns:
+            Productos de mayor a menor numero de unidades vendidas.
+        """
+        productos = await self._agregar_por_lotes(
+            desde, hasta, {"_id": 0, "productos": 1}, _productos_vendidos
+        )
+        productos = productos.nlargest(top, "unidades").reset_index()
+        productos["ingresos"] = _a_dinero(productos["ingresos"])
+        return productos.round(2).to_dict("records")
+
+    async def _agregar_por_lotes(
+        self,
+        desde: Optional[str],
+        hasta: Optional[str],
+        proyeccion: dict,
+        agregar: Callable[[List[dict]], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """Agrega los pedidos por lotes para no cargarlos todos en memoria.
+
+        Cada lote de ``analitica_chunk_size`` pedidos se convierte en un DataFrame
+        y se agrega en un hilo aparte para no bloquear el event loop. Las
+        agregaciones parciales se suman al final por su indice.
+
+        Args:
+            desde: Fecha ISO inicial (inclusiva) de creacion de los pedidos.
+            hasta: Fecha ISO final (exclusiva) de creacion de los pedidos.
+            proyeccion: Campos de los pedidos que necesita ``agregar``.
+            agregar: Funcion que agrega un lote de pedidos en un DataFrame.
+
+        Returns:
+            Suma de las agregaciones de todos los lotes.
+        """
+        tamano = Settings.analitica_chunk_size
+        parciales = []
+        lote = []
+
+        async for pedido in self.pedidos_repository.iter_by_fecha(
+            desde, hasta, tamano, proyeccion
+        ):
+            lote.append(pedido)
+            if len(lote) >= tamano:
+                parciales.append(await asyncio.to_thread(agregar, lote))
+                lote = []
+
+        # El lote vacio genera un DataFrame vacio con las columnas del reporte.
+        if lote or not parciales:
+            parciales.append(await asyncio.to_thread(agregar, lote))
+
+        agregado = pd.concat(parciales)
+        return agregado.groupby(level=agregado.index.names).sum()
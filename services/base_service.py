@@ -3,16 +3,14 @@
 # External libraries
 from abc import ABC
 
-# Own libraries
-from contexts.database import crear_mongo_conexion
-
 
 class ServiceBase(ABC):
     """Base de los servicios"""
 
-    def __enter__(self):
+    async def __aenter__(self):
         return self
 
-    def __exit__(self, exc_type, exc_value, traceback):
-        conexion = crear_mongo_conexion()
-        conexion.close()
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        # El cliente de Mongo es compartido por todo el proceso y se cierra en el
+        # apagado de la aplicación, por lo que aqui no se libera ninguna conexion.
+        return None
@@ -1,17 +1,69 @@
 """Modulo con los servicios correspondientes a los reactores en la base de datos"""
 
 # External libraries
-from typing import Callable
+import asyncio
+import traceback
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
 
-from sqlmodel import Session
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import PyMongoError
 
 # Own libraries
+from helpers.config import get_log
+from models.pedidos_model import (
+    PedidoModel,
+    UpdatePedidoModel,
+    convertir_productos_legado,
+)
+from properties.settings import Settings
+from repositories.inventario_repositorie import InventarioRepository
 from repositories.pedido_repositorie import PedidoRepository
+from repositories.producto_repositorie import ProductoRepository
+from repositories.tienda_repositorie import TiendaRepository
+from repositories.usuario_repositorie import UsuarioRepository
+from repositories.venta_diaria_repositorie import VentaDiariaRepository
 from services.base_service import ServiceBase
 
 
+class StockInsuficienteError(Exception):
+    """Error cuando la tienda no tiene inventario para alguna linea del pedido."""
+
+    def __init__(self, productos: List[str]) -> None:
+        """Crea el error con los productos sin stock suficiente.
+
+        Args:
+            productos: Identificadores de los productos sin stock.
+        """
+        super().__init__(f"Stock insuficiente para: {', '.join(productos)}")
+        self.productos = productos
+
+
+class CantidadInvalidaError(ValueError):
+    """Error cuando alguna linea del pedido tiene una cantidad menor a uno."""
+
+    def __init__(self, productos: List[str]) -> None:
+        """Crea el error con los productos con cantidad invalida.
+
+        Args:
+            productos: Identificadores de los productos con cantidad invalida.
+        """
+        super().__init__(f"Cantidad invalida para: {', '.join(productos)}")
+        self.productos = productos
+
+
+class PedidoEnConflictoError(Exception):
+    """Error cuando la transaccion del pedido sigue en conflicto con otros pedidos
+    despues de los reintentos."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            "El inventario esta siendo modificado por otros pedidos, intente de nuevo"
+        )
+
+
 class PedidoService(ServiceBase):
-    def __init__(self, cursor: Callable[[], Session]) -> None:
+    def __init__(self, cursor: Callable[[], AsyncIOMotorDatabase]) -> None:
         """Crea una nueva instancia del servicio de reactores
 
         Args:
@@ -19,7 +71,226 @@ class PedidoService(ServiceBase):
         """
         self._cursor = cursor
 
-    def __enter__(self):
+    async def __aenter__(self):
         self._cursor = self._cursor()
         self.pedidos_repository = PedidoRepository(self._cursor)
-        return super().__enter__()
+        self.inventarios_repository = InventarioRepository(self._cursor)
+        self.productos_repository = ProductoRepository(self._cursor)
+        self.tiendas_repository = TiendaRepository(self._cursor)
+        self.usuarios_repository = UsuarioRepository(self._cursor)
+        self.ventas_diarias_repository = VentaDiariaRepository(self._cursor)
+        return await super().__aenter__()
+
+    async def obtener_detalle(self, identificador: str) -> Optional[dict]:
+        """Obtiene un pedido con su tienda, su cliente y sus productos embebidos.
+
+        Despues de leer el pedido, la tienda, el cliente y todos los productos se
+        consultan en paralelo con un ``$in`` por coleccion, en lugar de una
+        consulta por producto.
+
+        Args:
+            identificador: Identificador ObjectId del pedido.
+
+        Returns:
+            Pedido con ``tienda``, ``cliente`` y ``producto`` en cada linea,
+            ``None`` si el pedido no existe.
+        """
+        pedido = await self.pedidos_repository.get_by_id(identificador)
+        if pedido is None:
+            return None
+
+        lineas = [
+            dict(linea)
+            for linea in convertir_productos_legado(pedido.get("productos")) or []
+        ]
+        ids_productos = list(dict.fromkeys(linea["id_producto"] for linea in lineas))
+
+        (tiendas, _), (clientes, _), (productos, _) = await asyncio.gather(
+            self.tiendas_repository.get_many([str(pedido.get("id_tienda"))]),
+            self.usuarios_repository.get_many(
+                [str(pedido.get("id_cliente"))], {"password": 0}
+            ),
+            self.productos_repository.get_many(ids_productos),
+        )
+
+        productos_por_id = {str(producto["_id"]): producto for producto in productos}
+        for linea in lineas:
+            linea["producto"] = productos_por_id.get(linea["id_producto"])
+
+        pedido["productos"] = lineas
+        pedido["tienda"] = tiendas[0] if tiendas else None
+        pedido["cliente"] = clientes[0] if clientes else None
+        return pedido
+
+    async def crear_pedido(self, pedido: PedidoModel) -> dict:
+        """Crea un pedido descontando del inventario de la tienda sus productos.
+
+        El stock se descuenta con actualizaciones condicionales, por lo que dos
+        pedidos concurrentes nunca venden mas unidades de las disponibles. Si
+        Mongo soporta transacciones la reserva y la creacion del pedido se hacen
+        en una sola transaccion, que se reintenta si entra en conflicto con otro
+        pedido; si no se devuelve el stock reservado cuando el pedido no se puede
+        crear. El pedido creado se suma al resumen de
+        ``ventas_diarias``.
+
+        Args:
+            pedido: Informacion del pedido a crear.
+
+        Returns:
+            Informacion del pedido creado.
+
+        Raises:
+            CantidadInvalidaError: Si alguna linea no tiene cantidad o es menor a
+                uno.
+            StockInsuficienteError: Si algun producto no tiene stock suficiente.
+            PedidoEnConflictoError: Si la transaccion sigue en conflicto con otros
+                pedidos despues de ``mongo_transaccion_reintentos`` intentos.
+        """
+        # Una cantidad negativa convertiria la reserva en un aumento del stock y
+        # una linea sin cantidad se crearia sin reservar stock.
+        invalidas = [
+            linea.id_producto
+            for linea in pedido.productos or []
+            if linea.cantidad is None or linea.cantidad <= 0
+        ]
+        if invalidas:
+            raise CantidadInvalidaError(invalidas)
+
+        cantidades: Dict[str, int] = defaultdict(int)
+        for linea in pedido.productos or []:
+            cantidades[linea.id_producto] += linea.cantidad
+
+        if not cantidades:
+            creado = await self.pedidos_repository.add(pedido)
+        elif Settings.mongo_usar_transacciones:
+            creado = await self._crear_pedido_en_transaccion(pedido, cantidades)
+        else:
+            creado = await self._crear_pedido_con_compensacion(pedido, cantidades)
+
+        await self._registrar_venta(None, creado)
+        return creado
+
+    async def actualizar_pedido(
+        self, identificador: str, pedido: UpdatePedidoModel
+    ) -> Optional[dict]:
+        """Actualiza un pedido y ajusta el resumen de ``ventas_diarias``.
+
+        Args:
+            identificador: Identificador ObjectId del pedido.
+            pedido: Campos del pedido a actualizar.
+
+        Returns:
+            Informacion del pedido actualizado, ``None`` si el pedido no existe.
+        """
+        # El pedido anterior lo retorna la misma operacion que lo modifica, con
+        # una lectura previa dos peticiones concurrentes descuentan la misma
+        # version y el resumen se desvia.
+        anterior, actualizado = await self.pedidos_repository.update(
+            identificador, pedido
+        )
+        if anterior is None:
+            return None
+
+        await self._registrar_venta(anterior, actualizado)
+        return actualizado
+
+    async def eliminar_pedido(self, identificador: str) -> bool:
+        """Elimina un pedido y resta su venta del resumen de ``ventas_diarias``.
+
+        Args:
+            identificador: Identificador ObjectId del pedido.
+
+        Returns:
+            ``True`` si el pedido existia y se elimino.
+        """
+        # Solo la peticion que elimina el pedido lo recibe y descuenta su venta.
+        eliminado = await self.pedidos_repository.delete(identificador)
+        if eliminado is None:
+            return False
+
+        await self._registrar_venta(eliminado, None)
+        return True
+
+    async def _registrar_venta(
+        self, anterior: Optional[dict], actual: Optional[dict]
+    ) -> None:
+        # El resumen se puede reconstruir con ``migraciones.ventas_diarias``, un
+        # error al actualizarlo no debe hacer fallar la operacion del pedido.
+        try:
+            await self.ventas_diarias_repository.registrar(anterior, actual)
+        except PyMongoError:
+            get_log().error(traceback.format_exc())
+
+    async def _crear_pedido_en_transaccion(
+        self, pedido: PedidoModel, cantidades: Dict[str, int]
+    ) -> dict:
+        async with await self._cursor.client.start_session() as sesion:
+            for intento in range(1, Settings.mongo_transaccion_reintentos + 1):
+                sesion.start_transaction()
+                try:
+                    reservados = await self.inventarios_repository.reservar_stock(
+                        pedido.id_tienda, cantidades, session=sesion
+                    )
+                    if reservados != len(cantidades):
+                        raise StockInsuficienteError([])
+                    creado = await self.pedidos_repository.add(pedido, session=sesion)
+                    await self._confirmar_transaccion(sesion)
+                    return creado
+                except StockInsuficienteError as error:
+                    # Al abortar se deshacen los descuentos que si se aplicaron.
+                    await sesion.abort_transaction()
+                    productos = await self.inventarios_repository.productos_sin_stock(
+                        pedido.id_tienda, cantidades
+                    )
+                    raise StockInsuficienteError(productos) from error
+                except PyMongoError as error:
+                    if sesion.in_transaction:
+                        await sesion.abort_transaction()
+                    # Dos pedidos concurrentes del mismo producto generan un
+                    # WriteConflict, la transaccion completa se vuelve a intentar.
+                    if not error.has_error_label("TransientTransactionError"):
+                        raise
+                    if intento == Settings.mongo_transaccion_reintentos:
+                        raise PedidoEnConflictoError() from error
+
+    @staticmethod
+    async def _confirmar_transaccion(sesion) -> None:
+        # Si no se sabe si el commit se aplico solo se reintenta el commit, repetir
+        # la transaccion podria crear el pedido dos veces.
+        for intento in range(1, Settings.mongo_transaccion_reintentos + 1):
+            try:
+                await sesion.commit_transaction()
+                return
+            except PyMongoError as error:
+                if (
+                    not error.has_error_label("UnknownTransactionCommitResult")
+                    or intento == Settings.mongo_transaccion_reintentos
+                ):
+                    raise
+
+    async def _crear_pedido_con_compensacion(
+        self, pedido: PedidoModel, cantidades: Dict[str, int]
+    ) -> dict:
+        reservados = await self.inventarios_repository.reservar_stock_por_producto(
+            pedido.id_tienda, cantidades
+        )
+        if len(reservados) != len(cantidades):
+            await self.inventarios_repository.liberar_stock(
+                pedido.id_tienda,
+                {id_producto: cantidades[id_producto] for id_producto in reservados},
+            )
+            raise StockInsuficienteError(
+                [
+                    id_producto
+                    for id_producto in cantidades
+                    if id_producto not in reservados
+                ]
+            )
+
+        try:
+            return await self.pedidos_repository.add(pedido)
+        except Exception:
+            await self.inventarios_repository.liberar_stock(
+                pedido.id_tienda, cantidades
+            )
+            raise
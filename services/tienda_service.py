@@ -3,7 +3,7 @@
 # External libraries
 from typing import Callable
 
-from sqlmodel import Session
+from motor.motor_asyncio import AsyncIOMotorDatabase
 
 # Own libraries
 from repositories.tienda_repositorie import TiendaRepository
@@ -11,7 +11,7 @@ from services.base_service import ServiceBase
 
 
 class TiendaService(ServiceBase):
-    def __init__(self, cursor: Callable[[], Session]) -> None:
+    def __init__(self, cursor: Callable[[], AsyncIOMotorDatabase]) -> None:
         """Crea una nueva instancia del servicio de reactores
 
         Args:
@@ -19,7 +19,7 @@ class TiendaService(ServiceBase):
         """
         self._cursor = cursor
 
-    def __enter__(self):
+    async def __aenter__(self):
         self._cursor = self._cursor()
         self.tiendas_repository = TiendaRepository(self._cursor)
-        return super().__enter__()
+        return await super().__aenter__()
@@ -1,17 +1,26 @@
 """Modulo con los servicios correspondientes a los reactores en la base de datos"""
 
 # External libraries
-from typing import Callable
+from typing import Callable, Optional
 
-from sqlmodel import Session
+from motor.motor_asyncio import AsyncIOMotorDatabase
 
 # Own libraries
+from contexts.procesos import ejecutar_en_proceso
+from helpers.seguridad import (
+    crear_hash_falso,
+    crear_token,
+    decodificar_token,
+    hashear_password,
+    verificar_password,
+)
+from properties.settings import Settings
 from repositories.usuario_repositorie import UsuarioRepository
 from services.base_service import ServiceBase
 
 
 class UsuarioService(ServiceBase):
-    def __init__(self, cursor: Callable[[], Session]) -> None:
+    def __init__(self, cursor: Callable[[], AsyncIOMotorDatabase]) -> None:
         """Crea una nueva instancia del servicio de reactores
 
         Args:
@@ -19,7 +28,73 @@ class UsuarioService(ServiceBase):
         """
         self._cursor = cursor
 
-    def __enter__(self):
+    async def __aenter__(self):
         self._cursor = self._cursor()
         self.usuarios_repository = UsuarioRepository(self._cursor)
-        return super().__enter__()
+        return await super().__aenter__()
+
+    async def iniciar_sesion(self, email: str, password: str) -> Optional[dict]:
+        """Verifica las credenciales de un usuario y emite sus tokens de sesion.
+
+        El hash se verifica en el pool de procesos. Si el password esta guardado
+        en texto plano o con parametros de scrypt anteriores se reemplaza por un
+        hash con los parametros actuales.
+
+        Args:
+            email: Email del usuario.
+            password: Password en texto plano.
+
+        Returns:
+            Tokens de la sesion, ``None`` si las credenciales no son validas.
+        """
+        usuario = await self.usuarios_repository.get_by_email(email)
+        # Si el email no existe se verifica un hash falso, asi la respuesta tarda
+        # lo mismo y no revela que emails estan registrados.
+        guardado = usuario.get("password") if usuario else crear_hash_falso()
+
+        valido, requiere_rehash = await ejecutar_en_proceso(
+            verificar_password, password, guardado
+        )
+        if usuario is None or not valido:
+            return None
+
+        if requiere_rehash:
+            nuevo = await ejecutar_en_proceso(hashear_password, password)
+            await self.usuarios_repository.reemplazar_password(
+                str(usuario["_id"]), guardado, nuevo
+            )
+
+        return self._emitir_tokens(usuario)
+
+    async def refrescar_sesion(self, refresh_token: str) -> Optional[dict]:
+        """Emite nuevos tokens a partir de un ``refresh_token`` valido.
+
+        A diferencia de las peticiones autenticadas, aqui se consulta el usuario
+        para que una cuenta eliminada no pueda renovar su sesion y los tokens
+        tengan su informacion actual.
+
+        Args:
+            refresh_token: Token ``refresh`` emitido al iniciar sesion.
+
+        Returns:
+            Tokens de la sesion, ``None`` si el usuario ya no existe.
+
+        Raises:
+            TokenInvalidoError: Si el token no es valido o expiro.
+        """
+        carga = decodificar_token(refresh_token, "refresh")
+        usuario = await self.usuarios_repository.get_by_id(
+            carga["sub"], {"password": 0}
+        )
+        if usuario is None:
+            return None
+        return self._emitir_tokens(usuario)
+
+    @staticmethod
+    def _emitir_tokens(usuario: dict) -> dict:
+        return {
+            "access_token": crear_token(usuario, "access", Settings.jwt_access_ttl),
+            "refresh_token": crear_token(usuario, "refresh", Settings.jwt_refresh_ttl),
+            "token_type": "bearer",
+            "expires_in": Settings.jwt_access_ttl,
+        }